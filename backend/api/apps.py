@@ -1,6 +1,25 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 
 
 class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api"
+
+    def ready(self):
+        """Сброс кеша аутентификации при изменении токенов и пользователей"""
+        from rest_framework.authtoken.models import Token
+
+        from .v1.authentication import invalidate_token, invalidate_user_tokens
+
+        post_delete.connect(
+            invalidate_token,
+            sender=Token,
+            dispatch_uid="api_invalidate_token",
+        )
+        post_save.connect(
+            invalidate_user_tokens,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="api_invalidate_user_tokens",
+        )
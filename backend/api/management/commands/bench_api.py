@@ -0,0 +1,296 @@
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+import requests
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.servers.basehttp import (
+    ThreadedWSGIServer,
+    WSGIRequestHandler,
+    get_internal_wsgi_application,
+)
+from django.test.utils import override_settings
+from rest_framework.authtoken.models import Token
+
+from common.utils.benchmark import (
+    QueryCounter,
+    latency_histogram,
+    latency_summary,
+    temporary_database,
+    walk_survey,
+)
+from questionnaire.models import Question
+from .add_survey_data import Command as AddSurveyData
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+_DEFAULT_STEPS_PATH = (
+    Path(settings.BASE_DIR) / "static_db_data" / "questions" / "steps.json"
+)
+_FAKE_DISK_UPLOADER = "common.utils.yadisk.FakeDiskUploader"
+_BASE64_IMAGE = (
+    "data:image/png;base64,"
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAA"
+    "AADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    """Обработчик запросов без журнала каждого запроса в консоль"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def local_server():
+    """
+    Локальный многопоточный WSGI сервер проекта на свободном порту
+
+    Yields:
+        str: базовый адрес сервера
+    """
+    server = ThreadedWSGIServer(
+        ("127.0.0.1", 0),
+        _QuietRequestHandler,
+        allow_reuse_address=True,
+    )
+    server.set_app(get_internal_wsgi_application())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+class Command(BaseCommand):
+    help = (
+        "Нагрузочный прогон REST API опросов: создание, ответы, откат, "
+        "смена статуса и загрузка документов с локальной подменой диска"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=20,
+            help="Количество пользователей, каждый проходит сценарий один раз",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=5,
+            help="Количество одновременно работающих пользователей",
+        )
+        parser.add_argument(
+            "--updates",
+            type=int,
+            default=0,
+            help="Ответов на пользователя (0 - весь опросник)",
+        )
+        parser.add_argument(
+            "--docs",
+            type=int,
+            default=1,
+            help="Документов на пользователя",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Зерно выбора ответов",
+        )
+        parser.add_argument(
+            "--file",
+            type=str,
+            default=str(_DEFAULT_STEPS_PATH),
+            help="Путь к JSON файлу опросника",
+        )
+        parser.add_argument(
+            "--current-db",
+            action="store_true",
+            help=(
+                "Работать в настроенной базе вместо временной тестовой "
+                "(опросник в базе должен совпадать с --file)"
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default=None,
+            help="Файл для JSON отчета (по умолчанию вывод в консоль)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Запуск прогона
+
+        Args:
+            *args: аргументы
+            **options: именные аргументы
+        """
+        with open(options["file"], "r", encoding="utf-8") as file:
+            steps = json.load(file)["questions"]
+
+        with (
+            nullcontext() if options["current_db"] else temporary_database()
+        ):
+            if not Question.objects.filter(type="start").exists():
+                logger.debug("Загрузка опросника %s", options["file"])
+                AddSurveyData.load_data_from_json(options["file"])
+            tokens = self._create_users(options["users"])
+            with (
+                override_settings(DISK_UPLOADER=_FAKE_DISK_UPLOADER),
+                local_server() as base_url,
+            ):
+                report = self._run(base_url, steps, tokens, options)
+
+        output = json.dumps(report, ensure_ascii=False, indent=4)
+        if options["output"]:
+            Path(options["output"]).write_text(output, encoding="utf-8")
+            self.stdout.write(f"Отчет сохранен в {options['output']}")
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def _create_users(count: int) -> list[str]:
+        """
+        Пользователи прогона с токенами авторизации
+
+        Args:
+            count: количество пользователей
+
+        Returns:
+            list[str]: токены пользователей
+        """
+        tokens = []
+        for number in range(count):
+            user, _ = User.objects.get_or_create(
+                username=f"bench_api_{number}",
+                defaults={
+                    "email": f"bench_api_{number}@example.com",
+                    "password": "unusable_password",
+                },
+            )
+            user.surveys.all().delete()
+            token, _ = Token.objects.get_or_create(user=user)
+            tokens.append(token.key)
+        return tokens
+
+    @staticmethod
+    def _run(
+        base_url: str,
+        steps: list[dict],
+        tokens: list[str],
+        options: dict,
+    ) -> dict:
+        """
+        Прогон сценария всеми пользователями
+
+        Args:
+            base_url: адрес сервера
+            steps: вопросы из steps.json
+            tokens: токены пользователей
+            options: параметры команды
+
+        Returns:
+            dict: отчет
+        """
+        latencies = defaultdict(list)
+        errors = defaultdict(int)
+        surveys_url = f"{base_url}/api/v1/surveys/"
+
+        def call(session, kind: str, method: str, url: str, payload: dict):
+            started = time.perf_counter()
+            response = session.request(method, url, json=payload)
+            latencies[kind].append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors[kind] += 1
+                logger.debug(
+                    "%s %s: %s", kind, response.status_code, response.text
+                )
+            return response
+
+        def run_user(number: int) -> None:
+            rng = random.Random(options["seed"] + number)
+            with requests.Session() as session:
+                session.headers["Authorization"] = f"Token {tokens[number]}"
+                response = call(session, "create", "post", surveys_url, {})
+                if response.status_code >= 400:
+                    return
+                survey_url = f"{surveys_url}{response.json()['id']}/"
+                answers = list(walk_survey(steps, rng, number))
+                if options["updates"]:
+                    answers = answers[: options["updates"]]
+                for answer in answers:
+                    call(
+                        session,
+                        "update",
+                        "put",
+                        survey_url,
+                        {"answer": answer},
+                    )
+                call(session, "revert", "patch", f"{survey_url}revert/", {})
+                call(
+                    session,
+                    "processing",
+                    "patch",
+                    f"{survey_url}processing/",
+                    {},
+                )
+                for _ in range(options["docs"]):
+                    call(
+                        session,
+                        "docs_upload",
+                        "post",
+                        f"{survey_url}docs/",
+                        {"image": _BASE64_IMAGE},
+                    )
+
+        query_counter = QueryCounter()
+        with (
+            query_counter.capture(),
+            ThreadPoolExecutor(max_workers=options["concurrency"]) as pool,
+        ):
+            started = time.perf_counter()
+            for future in [
+                pool.submit(run_user, number) for number in range(len(tokens))
+            ]:
+                future.result()
+            duration = time.perf_counter() - started
+
+        total = sum(len(values) for values in latencies.values())
+        return {
+            "users": len(tokens),
+            "concurrency": options["concurrency"],
+            "requests": total,
+            "duration_s": round(duration, 3),
+            "throughput_rps": round(total / duration, 2),
+            "queries": {
+                "total": query_counter.total,
+                "per_request": round(query_counter.total / max(total, 1), 2),
+            },
+            "endpoints": {
+                kind: {
+                    **latency_summary(values),
+                    "errors": errors[kind],
+                    "throughput_rps": round(len(values) / duration, 2),
+                    "histogram_ms": latency_histogram(values),
+                }
+                for kind, values in latencies.items()
+            },
+        }
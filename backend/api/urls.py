@@ -6,4 +6,5 @@ urlpatterns = [
     path("v1/", include(urlpatterns_v1)),
     path('auth/', include('djoser.urls')),
     path('auth/', include('djoser.urls.authtoken')),
+    path('auth/', include('djoser.urls.jwt')),
 ]
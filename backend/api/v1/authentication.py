@@ -0,0 +1,230 @@
+import hashlib
+import logging
+from functools import cached_property
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+logger = logging.getLogger(__name__)
+
+TOKEN_KEY = "auth:token:{digest}"
+# Поля пользователя в кеше аутентификации: без пароля и личных данных
+USER_SNAPSHOT_FIELDS = ("username", "is_active", "is_staff")
+
+
+def _cache_key(key: str) -> str:
+    """
+    Ключ кеша для токена (сам токен в кеш не попадает)
+
+    Args:
+        key: токен
+
+    Returns:
+        str: ключ кеша
+    """
+    return TOKEN_KEY.format(
+        digest=hashlib.sha256(key.encode()).hexdigest(),
+    )
+
+
+def invalidate_tokens(*keys: str) -> None:
+    """
+    Убрать токены из кеша аутентификации
+
+    Args:
+        *keys: токены
+    """
+    cache.delete_many([_cache_key(key) for key in keys])
+
+
+def invalidate_token(sender, instance: Token, **kwargs) -> None:
+    """
+    Сброс кеша при удалении токена (выход через djoser token/logout).
+    Подключается к post_delete токена.
+    """
+    invalidate_tokens(instance.key)
+
+
+def invalidate_user_tokens(sender, instance, **kwargs) -> None:
+    """
+    Сброс кеша при изменении пользователя (блокировка, права).
+    Подключается к post_save пользователя.
+
+    QuerySet.update() сигналов не вызывает: после массового изменения
+    пользователей их токены нужно сбросить через invalidate_tokens,
+    иначе старые права действуют до API_TOKEN_CACHE_TIMEOUT.
+    """
+    invalidate_tokens(
+        *Token.objects.filter(user_id=instance.pk).values_list(
+            "key",
+            flat=True,
+        )
+    )
+
+
+def _user_snapshot(user: User) -> dict:
+    """
+    Снимок пользователя для кеша аутентификации
+
+    Args:
+        user: пользователь
+
+    Returns:
+        dict: первичный ключ и поля USER_SNAPSHOT_FIELDS
+    """
+    snapshot = {field: getattr(user, field) for field in USER_SNAPSHOT_FIELDS}
+    snapshot[User._meta.pk.attname] = user.pk
+    return snapshot
+
+
+def _user_from_snapshot(snapshot: dict) -> User:
+    """
+    Пользователь из снимка: как загруженный из БД с отложенными полями,
+    не попавшими в снимок (читаются из БД при обращении, save()
+    сохраняет только загруженные поля)
+
+    Args:
+        snapshot: снимок пользователя
+
+    Returns:
+        User: пользователь
+    """
+    field_names = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in snapshot
+    ]
+    return User.from_db(
+        router.db_for_read(User),
+        field_names,
+        [snapshot[name] for name in field_names],
+    )
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Аутентификация по токену с кешированием токена и пользователя.
+
+    В кеше API_TOKEN_CACHE_TIMEOUT секунд хранится снимок пользователя
+    (ключ, имя, активность, права), запрос к БД нужен только при
+    промахе. Остальные поля пользователя читаются из БД при обращении.
+    Кеш сбрасывается при удалении токена и сохранении пользователя.
+    """
+
+    def authenticate_credentials(self, key: str):
+        cache_key = _cache_key(key)
+        snapshot = cache.get(cache_key)
+        if snapshot is None:
+            user, token = super().authenticate_credentials(key)
+            cache.set(
+                cache_key,
+                _user_snapshot(user),
+                settings.API_TOKEN_CACHE_TIMEOUT,
+            )
+            logger.debug("Токен пользователя %s закеширован", user.pk)
+            return user, token
+        user = _user_from_snapshot(snapshot)
+        return user, Token(key=key, user=user)
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Выдача JWT с признаком администратора в утверждениях: проверки прав
+    по токену не требуют загрузки пользователя из БД.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token["is_staff"] = user.is_staff
+        return token
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Обновление JWT с актуальным признаком администратора.
+
+    simplejwt копирует утверждения refresh токена в новый токен доступа,
+    поэтому признак перечитывается из БД (пользователь и так читается
+    при обновлении): снятие прав действует с первого обновления токена.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user = (
+            User.objects.filter(
+                **{
+                    api_settings.USER_ID_FIELD: refresh.payload.get(
+                        api_settings.USER_ID_CLAIM
+                    )
+                }
+            )
+            .only("is_active", "is_staff")
+            .first()
+        )
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"],
+                "no_active_account",
+            )
+        refresh["is_staff"] = user.is_staff
+
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    # Приложение blacklist не установлено
+                    pass
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data["refresh"] = str(refresh)
+        return data
+
+
+class ClaimsUser(TokenUser):
+    """
+    Пользователь из утверждений JWT с первичным ключом типа модели
+    (в токене идентификатор хранится строкой)
+    """
+
+    @cached_property
+    def id(self):
+        return User._meta.pk.to_python(super().id)
+
+
+def get_request_user(request: Request) -> User:
+    """
+    Пользователь запроса для связи с опросом.
+
+    При аутентификации по JWT без состояния пользователь не читается из
+    БД: модель создается по утверждениям токена и годится только для
+    ссылок по первичному ключу (не для сохранения).
+
+    Args:
+        request: запрос
+
+    Returns:
+        User: пользователь
+    """
+    user = request.user
+    if isinstance(user, TokenUser):
+        return User(pk=user.pk, is_staff=user.is_staff)
+    return user
@@ -1,10 +1,25 @@
+import hashlib
+import json
 import logging
+from collections.abc import Callable, Iterable
+from functools import cached_property
 
 from django.core.exceptions import ValidationError
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.serializers import (
     SerializerMethodField,
 )
+from rest_framework.status import HTTP_304_NOT_MODIFIED
 
+from questionnaire.cache import (
+    get_question_answers,
+    get_revision,
+    get_start_question,
+)
 from questionnaire.models import Comment, Document, Question, Survey
 
 logger = logging.getLogger(__name__)
@@ -18,12 +33,12 @@ class SurveyQuestionStartMixin:
     @staticmethod
     def _get_question_start() -> Question:
         """
-        Получить стартовый вопрос
+        Получить стартовый вопрос (из кеша опросника)
 
         Returns:
             Question: стартовый вопрос
         """
-        question_start = Question.objects.filter(type="start").first()
+        question_start = get_start_question()
         if not question_start:
             text = "Не существует стартового вопроса для опроса."
             logger.error(text)
@@ -58,11 +73,96 @@ class SurveyQuestionAnswers:
         Returns:
             list[str|None]: варианты ответа
         """
-        if current_question := obj.current_question:
-            return list(
-                current_question.answers.all().values_list(
-                    "answer",
-                    flat=True,
-                )
-            )
+        if current_question_id := obj.current_question_id:
+            return get_question_answers(current_question_id)
         return []
+
+
+class SurveyETagMixin:
+    """
+    Условный GET опросов: ETag по версии опроса, при совпадении
+    If-None-Match ответ 304 без сериализации.
+
+    Опросам нужен select_related("current_question").
+    """
+
+    @staticmethod
+    def get_etag(surveys: Iterable[Survey]) -> str:
+        """
+        ETag опросов по всему, что попадает в ответ: поля опроса
+        и ответы (откат и новый ответ возвращают ту же версию
+        вопросов), версия текущего вопроса (текст) и ревизия
+        опросника (варианты ответа)
+
+        Args:
+            surveys: опросы
+
+        Returns:
+            str: ETag
+        """
+        digest = hashlib.md5(usedforsecurity=False)
+        digest.update(f"{get_revision()};".encode())
+        for survey in surveys:
+            question = survey.current_question
+            digest.update(
+                (
+                    f"{survey.id}:{survey.questions_version_uuid}:"
+                    f"{survey.updated_at}:{survey.status}:"
+                    f"{survey.current_question_id}:"
+                    f"{question.updated_uuid if question else None}:"
+                ).encode()
+            )
+            digest.update(
+                json.dumps(survey.result, ensure_ascii=False).encode()
+            )
+            digest.update(b";")
+        return quote_etag(digest.hexdigest())
+
+    def conditional_response(
+        self,
+        request: Request,
+        surveys: Iterable[Survey],
+        build_response: Callable[[], Response],
+    ) -> Response:
+        """
+        Ответ 304, если у клиента актуальная версия, иначе полный ответ
+
+        Args:
+            request: запрос
+            surveys: опросы ответа
+            build_response: построение полного ответа
+
+        Returns:
+            Response: ответ с ETag
+        """
+        etag = self.get_etag(surveys)
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=HTTP_304_NOT_MODIFIED)
+        else:
+            response = build_response()
+        response["ETag"] = etag
+        # Ответ зависит от пользователя и перепроверяется при каждом опросе
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Authorization",))
+        return response
+
+
+class NestedSurveyMixin:
+    """
+    Родительский опрос вложенных маршрутов (/surveys/<survey_pk>/...).
+
+    Опрос с автором загружается один раз на запрос и используется
+    правами доступа, контекстом сериализатора и созданием объектов.
+    """
+
+    @cached_property
+    def survey(self) -> Survey:
+        """Survey: родительский опрос (404, если не найден)"""
+        return get_object_or_404(
+            Survey.objects.select_related("user"),
+            pk=self.kwargs["survey_pk"],
+        )
+
+    def get_queryset(self):
+        """Только объекты родительского опроса"""
+        return super().get_queryset().filter(survey=self.survey)
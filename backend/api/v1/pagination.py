@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class SurveyCursorPagination(CursorPagination):
+    """
+    Постраничный вывод опросов по дате создания, новые первыми.
+
+    Курсор не требует COUNT и OFFSET: страница читается по индексу
+    (user, -created_at) за один запрос.
+    """
+
+    ordering = "-created_at"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -1,13 +1,12 @@
 from rest_framework import permissions
 
-from questionnaire.models import Survey
-
 
 class AuthorOrStaffOnly(permissions.BasePermission):
     """Доступ к данным только авторам и админам."""
 
     def has_object_permission(self, request, view, obj):
-        return request.user == obj.user or request.user.is_staff
+        # Сравнение по ключу: без загрузки автора и для пользователя из JWT
+        return obj.user_id == request.user.pk or request.user.is_staff
 
 
 class NestedAuthorStaffOnly(permissions.BasePermission):
@@ -22,13 +21,17 @@ class NestedAuthorStaffOnly(permissions.BasePermission):
 
 
 class NestedAuthorOrStaffOnly(permissions.BasePermission):
-    """Доступ к запросам только аутентифицированным пользователям
-    и админам, доступ к данным только авторам.
-    Для вложенных маршрутов (документы)"""
+    """Доступ к запросам только автору опроса и админам.
+    Для вложенных маршрутов (документы), опрос берется из
+    NestedSurveyMixin"""
 
     def has_permission(self, request, view):
-        return request.user.is_authenticated or request.user.is_staff
+        if not request.user.is_authenticated:
+            return False
+        return (
+            request.user.is_staff
+            or view.survey.user_id == request.user.pk
+        )
 
     def has_object_permission(self, request, view, obj):
-        return request.user == Survey.objects.get(
-            id=request.parser_context['kwargs'].get('survey_pk')).user
+        return view.survey.user_id == request.user.pk
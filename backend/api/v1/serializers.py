@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from random import choices
 from string import digits
@@ -8,18 +9,23 @@ import logging
 
 from django.conf import settings
 from django.core.files.base import ContentFile
+from django.core.validators import FileExtensionValidator
 from django.db import DatabaseError, IntegrityError
 from django.core.exceptions import ValidationError
 from rest_framework.serializers import (
     BooleanField,
     CharField,
+    FileField,
     ImageField,
+    ListField,
     ModelSerializer,
+    Serializer,
     SerializerMethodField,
     SlugRelatedField,
 )
 
-from common.utils.yadisk import YandexDiskUploader
+from common.utils.images import prepare_image
+from common.utils.yadisk import YandexDiskUploader, get_disk_uploader
 from questionnaire.models import Comment, Document, Question, Survey
 from questionnaire.constant import SurveyStatus
 from users.models import User
@@ -30,6 +36,54 @@ logger = logging.getLogger(__name__)
 
 
 DECODE_ERROR = "Ошибка кодировки изображения - {}"
+BATCH_SIZE_ERROR = "Не больше {} файлов за один запрос"
+# Расширения файлов документов (изображения и PDF)
+DOCUMENT_EXTENSIONS = ("jpg", "jpeg", "png", "gif", "webp", "heic", "pdf")
+
+
+def document_name(username: str, extension: str) -> str:
+    """
+    Имя файла документа на диске
+
+    Args:
+        username: имя пользователя - автора опроса
+        extension: расширение файла
+
+    Returns:
+        str: имя файла
+    """
+    return f"{username}{''.join(choices(digits, k=10))}.{extension}"
+
+
+def upload_document(
+    uploader: YandexDiskUploader,
+    name: str,
+    data: bytes,
+) -> dict[str, str]:
+    """
+    Подготовить файл документа и загрузить на диск вместе с миниатюрой.
+    Ошибка загрузки миниатюры не мешает сохранить документ.
+
+    Args:
+        uploader: загрузчик
+        name: имя файла
+        data: файл
+
+    Returns:
+        dict[str, str]: пути image и thumbnail для Document
+    """
+    image = prepare_image(name, data)
+    paths = {"image": uploader.upload_file(image.name, image.data)}
+    if image.thumbnail is not None:
+        try:
+            paths["thumbnail"] = uploader.upload_file(
+                image.thumbnail_name, image.thumbnail
+            )
+        except Exception as e:
+            logger.warning(
+                "Миниатюра %s не загружена: %s", image.thumbnail_name, e
+            )
+    return paths
 
 
 # Survey
@@ -202,7 +256,13 @@ class SurveyUpdateSerializer(
                 logger.debug(
                     "Пропуск вопроса @username для телеграм, в телеграм боте."
                 )
-                next_question = next_question.answers.first().next_question
+                # Менеджер по умолчанию не сортирует: первый ответ
+                # берется в порядке опросника
+                next_question = (
+                    next_question.answers.in_questionnaire_order()
+                    .first()
+                    .next_question
+                )
 
             if answer_text:
                 result.extend((current_question.text, answer_text))
@@ -342,9 +402,13 @@ class SurveyUpdateSerializer(
                 answer,
             )
 
-        if select_answer_choice := question.answers.filter(
-            answer=None
-        ).first():
+        # Пользовательских ответов может быть несколько: первый - в
+        # порядке опросника
+        if select_answer_choice := (
+            question.answers.filter(answer=None)
+            .in_questionnaire_order()
+            .first()
+        ):
             return (
                 select_answer_choice.next_question,
                 select_answer_choice.new_status,
@@ -401,7 +465,7 @@ class SurveyRevertSerializer(SurveyQuestionAnswers, ModelSerializer):
                 if not add_telegram and previous_answers:
                     previous_answers = set(
                         (
-                            previous_answer.current_question.previous_answers.first()
+                            previous_answer.current_question.previous_answers.in_questionnaire_order().first()
                             if previous_answer.current_question.external_table_field_name
                             == "User.telegram_username"
                             else previous_answer
@@ -498,9 +562,10 @@ class Base64ImageField(ImageField):
             try:
                 return ContentFile(
                     base64.b64decode(file_str),
-                    name=f"{self.parent.context['user']}"
-                    f'{"".join(choices(digits, k=10))}.'
-                    + file_format.split("/")[-1],
+                    name=document_name(
+                        self.parent.context["user"],
+                        file_format.split("/")[-1],
+                    ),
                 )
             except Exception as e:
                 logger.error(DECODE_ERROR.format(e))
@@ -525,16 +590,83 @@ class DocumentSerializer(ModelSerializer):
 
     def create(self, validated_data):
         data = validated_data.pop("image")
-        try:
-            url = YandexDiskUploader(
-                settings.DISK_TOKEN,
-            ).upload_file(data.name, data.read())
-        except Exception:
-            raise
-        document = Document.objects.create(**validated_data, image=url)
+        paths = upload_document(get_disk_uploader(), data.name, data.read())
+        document = Document.objects.create(**validated_data, **paths)
         return document
 
 
+class DocumentBatchSerializer(Serializer):
+    """
+    Сериализатор пакетной загрузки документов (multipart).
+
+    Файлы обрабатываются и загружаются на диск параллельно (изображения
+    сжимаются в пуле процессов), документы создаются одним
+    bulk_create. Ошибка загрузки одного файла не отменяет остальные:
+    результат возвращается по каждому файлу.
+    """
+
+    files = ListField(
+        child=FileField(
+            validators=(FileExtensionValidator(DOCUMENT_EXTENSIONS),),
+        ),
+        allow_empty=False,
+    )
+
+    def validate_files(self, files):
+        if len(files) > settings.DOCUMENT_BATCH_MAX_FILES:
+            raise ValidationError(
+                BATCH_SIZE_ERROR.format(settings.DOCUMENT_BATCH_MAX_FILES)
+            )
+        return files
+
+    def create(self, validated_data) -> list[dict[str, Any]]:
+        """
+        Загрузить файлы и создать документы
+
+        Args:
+            validated_data: файлы и опрос
+
+        Returns:
+            list[dict[str, Any]]: результаты в порядке файлов запроса:
+                id и image документа или error
+        """
+        files = validated_data["files"]
+        uploader = get_disk_uploader()
+        workers = min(settings.DOCUMENT_UPLOAD_WORKERS, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    upload_document,
+                    uploader,
+                    document_name(
+                        self.context["user"],
+                        file.name.rsplit(".", 1)[-1].lower(),
+                    ),
+                    file.read(),
+                )
+                for file in files
+            ]
+
+        results = []
+        documents = []
+        for file, future in zip(files, futures):
+            try:
+                paths = future.result()
+            except Exception as e:
+                logger.error("Файл %s не загружен: %s", file.name, e)
+                results.append({"file": file.name, "error": str(e)})
+                continue
+            document = Document(survey=validated_data["survey"], **paths)
+            documents.append(document)
+            results.append({"file": file.name, "document": document})
+
+        Document.objects.bulk_create(documents)
+        for result in results:
+            if document := result.pop("document", None):
+                result.update(id=document.pk, image=document.image)
+        return results
+
+
 class CommentSerializer(ModelSerializer):
     """Сериализатор для комментариев."""
 
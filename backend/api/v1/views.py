@@ -2,14 +2,16 @@ import logging
 from uuid import UUID
 
 from django.contrib.auth import get_user_model
-from django.shortcuts import get_object_or_404
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.status import (
     HTTP_201_CREATED,
+    HTTP_207_MULTI_STATUS,
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 from rest_framework.viewsets import GenericViewSet
@@ -18,10 +20,17 @@ from rest_framework.mixins import (
     UpdateModelMixin,
     ListModelMixin,
     DestroyModelMixin,
+    RetrieveModelMixin,
+)
+from rest_framework_simplejwt.authentication import (
+    JWTStatelessUserAuthentication,
 )
 
 from questionnaire.constant import SurveyStatus
 from questionnaire.models import Survey, Document, Comment
+from .authentication import get_request_user
+from .mixins import NestedSurveyMixin, SurveyETagMixin
+from .pagination import SurveyCursorPagination
 from .permissions import (
     AuthorOrStaffOnly,
     NestedAuthorOrStaffOnly,
@@ -33,24 +42,39 @@ from .serializers import (
     SurveyRevertSerializer,
     SurveyReadSerializer,
     DocumentSerializer,
+    DocumentBatchSerializer,
     CommentSerializer,
 )
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Кроме токена принимается JWT (Bearer): пользователь и права берутся из
+# утверждений токена без запросов к БД
+AUTHENTICATION_CLASSES = (
+    *api_settings.DEFAULT_AUTHENTICATION_CLASSES,
+    JWTStatelessUserAuthentication,
+)
+
 
 class SurveyViewSet(
+    SurveyETagMixin,
     CreateModelMixin,
     UpdateModelMixin,
     ListModelMixin,
+    RetrieveModelMixin,
     GenericViewSet,
 ):
     """
-    ViewSet для работы с опросами
+    ViewSet для работы с опросами.
+
+    Кроме токена принимает JWT (Bearer): пользователь и права берутся
+    из утверждений токена без запросов к БД.
     """
 
     queryset = Survey.objects.all()
+    authentication_classes = AUTHENTICATION_CLASSES
+    pagination_class = SurveyCursorPagination
     permission_classes = (
         IsAuthenticated,
         AuthorOrStaffOnly,
@@ -98,7 +122,7 @@ class SurveyViewSet(
             partial=True,
         )
         serializer.is_valid(raise_exception=True)
-        serializer.save(user=request.user)
+        serializer.save(user=get_request_user(request))
         return Response(serializer.data)
 
     def get_serializer_class(self):
@@ -119,15 +143,13 @@ class SurveyViewSet(
         queryset = super().get_queryset()
         if self.request.user.is_authenticated:
             return (
-                queryset.filter(user=self.request.user)
-                .prefetch_related(
-                    "current_question",
-                )
+                queryset.filter(user_id=self.request.user.pk)
+                .select_related("current_question")
                 .order_by("-created_at")
             )
-        return queryset.prefetch_related(
-            "current_question",
-        ).order_by("-created_at")
+        return queryset.select_related("current_question").order_by(
+            "-created_at"
+        )
 
     def create(self, request: Request, *args, **kwargs) -> Response:
         """
@@ -144,14 +166,14 @@ class SurveyViewSet(
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        serializer.save(user=request.user)
+        serializer.save(user=get_request_user(request))
         return Response(serializer.data, status=HTTP_201_CREATED)
 
     def update(self, request, *args, **kwargs):
         """
         Обновляет опрос через SurveyUpdateSerializer
         """
-        user = request.user
+        user = get_request_user(request)
         # Получаем объект survey
         survey = self.get_object()
 
@@ -168,32 +190,50 @@ class SurveyViewSet(
         return Response(serializer.data)
 
     def list(self, request, *args, **kwargs):
-        user = request.user
-        serializer = SurveyCreateSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        serializer.save(user=user)
+        """
+        Опросы пользователя постранично (только чтение)
+        """
+        page = self.paginate_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+        return self.conditional_response(
+            request,
+            page,
+            lambda: self.get_paginated_response(
+                self.get_serializer(page, many=True).data
+            ),
+        )
 
-        return Response([serializer.data])
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Опрос пользователя
+        """
+        survey = self.get_object()
+        return self.conditional_response(
+            request,
+            (survey,),
+            lambda: Response(self.get_serializer(survey).data),
+        )
 
 
 class DocumentViewSet(
+    NestedSurveyMixin,
     CreateModelMixin,
     DestroyModelMixin,
     ListModelMixin,
     GenericViewSet,
 ):
-    """ViewSet для работы с документами."""
+    """ViewSet для работы с документами. Принимает и JWT (Bearer)."""
 
     queryset = Document.objects.all()
+    authentication_classes = AUTHENTICATION_CLASSES
     permission_classes = (NestedAuthorOrStaffOnly,)
     serializer_class = DocumentSerializer
 
     def get_serializer_context(self):
         """Добавляем переменную из URL в контекст сериализатора."""
         context = super().get_serializer_context()
-        survey = get_object_or_404(Survey, id=self.kwargs.get("survey_pk"))
-        context["user"] = survey.user.username
+        context["user"] = self.survey.user.username
         return context
 
     def create(self, request, *args, **kwargs):
@@ -213,28 +253,56 @@ class DocumentViewSet(
         )
 
     def perform_create(self, serializer):
-        serializer.save(
-            survey=Survey.objects.get(pk=self.kwargs["survey_pk"]),
-        )
+        serializer.save(survey=self.survey)
+
+    def get_serializer_class(self):
+        """
+        Сериализатор пакетной загрузки для действия batch
+        """
+        if self.action == "batch":
+            return DocumentBatchSerializer
+        return super().get_serializer_class()
+
+    @action(
+        methods=("post",),
+        detail=False,
+        parser_classes=(MultiPartParser,),
+    )
+    def batch(self, request: Request, survey_pk: UUID) -> Response:
+        """
+        Пакетная загрузка документов: файлы в поле files (multipart)
+
+        Args:
+            request: запрос
+            survey_pk: первичный ключ опроса
+
+        Returns:
+            Response: результаты по файлам, 201 - загружены все,
+                207 - часть файлов не загружена
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = serializer.save(survey=self.survey)
+        if any("error" in result for result in results):
+            return Response({"results": results}, status=HTTP_207_MULTI_STATUS)
+        return Response({"results": results}, status=HTTP_201_CREATED)
 
 
 class CommentViewSet(
+    NestedSurveyMixin,
     CreateModelMixin,
     DestroyModelMixin,
     GenericViewSet,
 ):
-    """ViewSet для работы с комментариями."""
+    """ViewSet для работы с комментариями. Принимает и JWT (Bearer)."""
 
     queryset = Comment.objects.all()
+    authentication_classes = AUTHENTICATION_CLASSES
     permission_classes = (NestedAuthorStaffOnly,)
     serializer_class = CommentSerializer
 
     def perform_create(self, serializer):
         serializer.save(
-            survey=get_object_or_404(Survey, pk=self.kwargs["survey_pk"]),
-            user=self.request.user,
+            survey=self.survey,
+            user=get_request_user(self.request),
         )
-
-    def perform_destroy(self, instance):
-        get_object_or_404(Survey, pk=self.kwargs["survey_pk"])
-        instance.delete()
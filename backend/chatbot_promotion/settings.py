@@ -1,4 +1,5 @@
 import logging
+from datetime import timedelta
 from os import getenv, path
 from pathlib import Path
 
@@ -178,6 +179,9 @@ if getenv("ENABLE_POSTGRES_DB", "").lower() == "true":
             "PASSWORD": getenv("POSTGRES_PASSWORD"),
             "HOST": getenv("DB_HOST"),
             "PORT": 5432,
+            # Переиспользование соединений потоков (бот, gunicorn)
+            "CONN_MAX_AGE": int(getenv("DB_CONN_MAX_AGE", "60")),
+            "CONN_HEALTH_CHECKS": True,
         }
     }
 else:
@@ -190,7 +194,7 @@ else:
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "api.v1.authentication.CachedTokenAuthentication",
         # "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
@@ -203,6 +207,27 @@ REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "api.v1.exceptions.custom_exception_handler",
 }
 
+# JWT для виджета опроса (/api/auth/jwt/create, /api/auth/jwt/refresh).
+# Признак администратора берется из токена и перечитывается из БД при
+# обновлении токена: его изменение вступает в силу не позже, чем через
+# JWT_ACCESS_TOKEN_MINUTES
+SIMPLE_JWT = {
+    "ACCESS_TOKEN_LIFETIME": timedelta(
+        minutes=int(getenv("JWT_ACCESS_TOKEN_MINUTES", "5"))
+    ),
+    "REFRESH_TOKEN_LIFETIME": timedelta(
+        hours=int(getenv("JWT_REFRESH_TOKEN_HOURS", "24"))
+    ),
+    "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_OBTAIN_SERIALIZER": (
+        "api.v1.authentication.ClaimsTokenObtainPairSerializer"
+    ),
+    "TOKEN_REFRESH_SERIALIZER": (
+        "api.v1.authentication.ClaimsTokenRefreshSerializer"
+    ),
+    "TOKEN_USER_CLASS": "api.v1.authentication.ClaimsUser",
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": (
@@ -318,6 +343,87 @@ TELEGRAM_SHOW_RESPONSE_CHOICE = (
 TELEGRAM_SHOW_REVERT_PREVIOUS_QUESTION = (
     getenv("TELEGRAM_SHOW_REVERT_PREVIOUS_QUESTION", "false").lower() == "true"
 )
+# Потоков бота для запросов к БД (0 - все запросы в одном потоке).
+# Столько же обновлений бот обрабатывает одновременно.
+# Не больше числа соединений, доступных боту в PostgreSQL
+TELEGRAM_DB_POOL_SIZE = int(
+    getenv(
+        "TELEGRAM_DB_POOL_SIZE",
+        "8" if DATABASES["default"]["ENGINE"].endswith("postgresql") else "0",
+    )
+)
+# Ограничение исходящих запросов к Bot API в секунду (0 - без ограничения)
+TELEGRAM_RATE_LIMIT_GLOBAL = float(getenv("TELEGRAM_RATE_LIMIT_GLOBAL", "30"))
+# Ограничение сообщений в один чат в секунду
+TELEGRAM_RATE_LIMIT_CHAT = float(getenv("TELEGRAM_RATE_LIMIT_CHAT", "1"))
+# Пауза между проверками очереди уведомлений ботом в секундах (0 - не
+# отправлять, очередь разбирает команда send_notifications)
+TELEGRAM_NOTIFICATIONS_INTERVAL = float(
+    getenv("TELEGRAM_NOTIFICATIONS_INTERVAL", "5")
+)
+# Сколько секунд бот доверяет запомненному статусу опроса пользователя
+# (статус могут сменить в админке)
+TELEGRAM_STATE_TTL = float(getenv("TELEGRAM_STATE_TTL", "60"))
+
+# Общий кеш процессов (бот, админка, API). Без REDIS_URL - кеш в памяти
+# процесса, изменения опросника в админке бот увидит через
+# QUESTIONNAIRE_CACHE_TIMEOUT
+REDIS_URL = getenv("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+# Время жизни кеша вариантов ответа в секундах
+QUESTIONNAIRE_CACHE_TIMEOUT = int(getenv("QUESTIONNAIRE_CACHE_TIMEOUT", "60"))
+# Время жизни токена API в кеше в секундах. Без REDIS_URL выход
+# пользователя в других процессах вступит в силу через это время, как и
+# изменение пользователей через QuerySet.update() (без сигналов)
+API_TOKEN_CACHE_TIMEOUT = int(getenv("API_TOKEN_CACHE_TIMEOUT", "60"))
 
 DEFAULT_DISK_TOKEN = "dummy-key-for-dev"
 DISK_TOKEN = getenv("DISK_TOKEN", DEFAULT_DISK_TOKEN)
+# Класс загрузчика документов (common.utils.yadisk.FakeDiskUploader - локально)
+DISK_UPLOADER = getenv(
+    "DISK_UPLOADER",
+    "common.utils.yadisk.YandexDiskUploader",
+)
+# Файлов в одном запросе пакетной загрузки документов
+DOCUMENT_BATCH_MAX_FILES = int(getenv("DOCUMENT_BATCH_MAX_FILES", "10"))
+# Параллельных загрузок на диск в одном запросе пакетной загрузки
+DOCUMENT_UPLOAD_WORKERS = int(getenv("DOCUMENT_UPLOAD_WORKERS", "4"))
+# Процессов для обработки изображений документов (0 - в потоке запроса)
+IMAGE_PROCESS_WORKERS = int(getenv("IMAGE_PROCESS_WORKERS", "2"))
+# Наибольшая сторона изображения документа и миниатюры в пикселях
+IMAGE_MAX_SIZE = int(getenv("IMAGE_MAX_SIZE", "2048"))
+IMAGE_THUMBNAIL_SIZE = int(getenv("IMAGE_THUMBNAIL_SIZE", "200"))
+# Качество JPEG изображений документов и миниатюр
+IMAGE_JPEG_QUALITY = int(getenv("IMAGE_JPEG_QUALITY", "82"))
+# Кеш миниатюр документов для админки: каталог и лимит размера в байтах
+THUMBNAIL_CACHE_DIR = Path(
+    getenv("THUMBNAIL_CACHE_DIR", BASE_DIR / "thumbnails")
+)
+THUMBNAIL_CACHE_MAX_BYTES = int(
+    getenv("THUMBNAIL_CACHE_MAX_BYTES", str(200 * 1024 * 1024))
+)
+# Потоков построения миниатюр в фоне (0 - в потоке запроса)
+THUMBNAIL_BUILD_WORKERS = int(getenv("THUMBNAIL_BUILD_WORKERS", "2"))
+# Префикс internal location nginx с каталогом кеша миниатюр
+# (пусто - миниатюры отдает Django)
+THUMBNAIL_ACCEL_REDIRECT = getenv("THUMBNAIL_ACCEL_REDIRECT", "")
+# Время кеширования миниатюр браузером в секундах
+THUMBNAIL_MAX_AGE = int(getenv("THUMBNAIL_MAX_AGE", str(30 * 24 * 60 * 60)))
+# Комментариев в карточке опроса в админке (остальные - по ссылке)
+# и время жизни кеша их списка в секундах
+ADMIN_COMMENTS_LIMIT = int(getenv("ADMIN_COMMENTS_LIMIT", "20"))
+ADMIN_COMMENTS_CACHE_TIMEOUT = int(
+    getenv("ADMIN_COMMENTS_CACHE_TIMEOUT", "300")
+)
@@ -0,0 +1,234 @@
+import logging
+import math
+import random
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# Границы корзин гистограммы задержек в миллисекундах
+HISTOGRAM_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+# Ответы на вопросы со свободным вводом по полю внешней таблицы
+_FREE_TEXT_ANSWERS = {
+    "User.last_name": "Иванов",
+    "User.first_name": "Иван",
+    "User.patronymic": "Иванович",
+    "User.ward_last_name": "Петров",
+    "User.ward_first_name": "Петр",
+    "User.ward_patronymic": "Петрович",
+    "User.residence": "Москва",
+    "User.birthday": "01.01.2000",
+    "User.telegram_username": "нет",
+}
+_DEFAULT_FREE_TEXT_ANSWER = "Тестовый ответ"
+_REJECTED_STATUS = "rejected"
+
+
+class QueryCounter:
+    """
+    Счетчик SQL-запросов по всем соединениям и потокам.
+
+    Подключается как execute_wrapper к уже открытым соединениям
+    и к каждому новому соединению через сигнал connection_created,
+    поэтому учитывает запросы из потоков sync_to_async.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self._lock:
+            self.total += 1
+        return execute(sql, params, many, context)
+
+    def _attach(self, connection) -> None:
+        """
+        Подключить счетчик к соединению
+
+        Args:
+            connection: обертка соединения Django
+        """
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+    def _on_connection_created(self, sender, connection, **kwargs) -> None:
+        self._attach(connection)
+
+    @contextmanager
+    def capture(self):
+        """Считать запросы внутри блока"""
+        for connection in connections.all(initialized_only=True):
+            self._attach(connection)
+        connection_created.connect(self._on_connection_created)
+        try:
+            yield self
+        finally:
+            connection_created.disconnect(self._on_connection_created)
+            for connection in connections.all(initialized_only=True):
+                if self in connection.execute_wrappers:
+                    connection.execute_wrappers.remove(self)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Перцентиль по методу ближайшего ранга
+
+    Args:
+        values: значения
+        percent: перцентиль от 0 до 100
+
+    Returns:
+        float: значение перцентиля (0.0 для пустого списка)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def latency_summary(latencies: list[float]) -> dict[str, float | int]:
+    """
+    Сводка по задержкам
+
+    Args:
+        latencies: задержки в секундах
+
+    Returns:
+        dict[str, float | int]: количество и задержки в миллисекундах
+    """
+    return {
+        "count": len(latencies),
+        "mean_ms": (
+            round(sum(latencies) / len(latencies) * 1000, 2)
+            if latencies
+            else 0.0
+        ),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 2),
+    }
+
+
+def latency_histogram(
+    latencies: list[float],
+    bounds_ms: tuple[int, ...] = HISTOGRAM_BOUNDS_MS,
+) -> dict[str, int]:
+    """
+    Гистограмма задержек
+
+    Args:
+        latencies: задержки в секундах
+        bounds_ms: верхние границы корзин в миллисекундах
+
+    Returns:
+        dict[str, int]: количество по корзинам "<=N" и "+inf"
+    """
+    buckets = {f"<={bound}": 0 for bound in bounds_ms}
+    buckets["+inf"] = 0
+    for latency in latencies:
+        latency_ms = latency * 1000
+        bucket = next(
+            (f"<={bound}" for bound in bounds_ms if latency_ms <= bound),
+            "+inf",
+        )
+        buckets[bucket] += 1
+    return buckets
+
+
+def _free_text_answer(step: dict, number: int) -> str:
+    """
+    Ответ на вопрос со свободным вводом
+
+    Args:
+        step: вопрос из steps.json
+        number: номер виртуального пользователя
+
+    Returns:
+        str: ответ, проходящий валидацию полей пользователя
+    """
+    match field_name := step.get("external_table_field_name"):
+        case "User.phone_number":
+            return f"+7900{number:07d}"
+        case "User.email":
+            return f"bench_vu_{number}@example.com"
+        case _:
+            return _FREE_TEXT_ANSWERS.get(
+                field_name,
+                _DEFAULT_FREE_TEXT_ANSWER,
+            )
+
+
+def walk_survey(
+    steps: list[dict],
+    rng: random.Random,
+    number: int,
+    skip_telegram_username: bool = False,
+) -> Iterator[str]:
+    """
+    Ответы одного прохождения опросника до вопроса без вариантов ответа.
+    Ответы, отклоняющие заявку, не выбираются.
+
+    Args:
+        steps: вопросы из steps.json
+        rng: генератор выбора ответов
+        number: номер виртуального пользователя
+        skip_telegram_username: пропускать вопрос про @username (Telegram)
+
+    Yields:
+        str: текст ответа
+    """
+    index = next(
+        index for index, step in enumerate(steps) if step["type"] == "start"
+    )
+    while answers := [
+        answer
+        for answer in steps[index]["answers"]
+        if answer.get("next_question_index") is not None
+        and answer.get("new_status") != _REJECTED_STATUS
+    ]:
+        answer = rng.choice(answers)
+        yield (
+            answer["text"]
+            if answer["text"] is not None
+            else _free_text_answer(steps[index], number)
+        )
+        index = answer["next_question_index"]
+        step = steps[index]
+        if skip_telegram_username and (
+            step.get("external_table_field_name") == "User.telegram_username"
+        ):
+            index = step["answers"][0]["next_question_index"]
+
+
+@contextmanager
+def temporary_database():
+    """
+    Временная база данных на время прогона (как у тестов).
+    Для SQLite база создается в файле, чтобы ее видели все потоки.
+    """
+    old_name = connection.settings_dict["NAME"]
+    test_settings = connection.settings_dict.setdefault("TEST", {})
+    old_test_name = test_settings.get("NAME")
+    with tempfile.TemporaryDirectory() as directory:
+        if connection.vendor == "sqlite":
+            test_settings["NAME"] = str(Path(directory) / "bench.sqlite3")
+        connection.creation.create_test_db(
+            verbosity=0,
+            autoclobber=True,
+            serialize=False,
+        )
+        try:
+            yield
+        finally:
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            test_settings["NAME"] = old_test_name
@@ -0,0 +1,293 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import PurePosixPath
+from typing import Any, Callable
+
+from django.conf import settings
+from PIL import Image, ImageDraw, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Формат нормализованных изображений и миниатюр
+IMAGE_FORMAT = "JPEG"
+IMAGE_EXTENSION = "jpg"
+THUMBNAIL_SUFFIX = "_thumb"
+
+_executor: ProcessPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
+class PreparedImage:
+    """Файл документа для загрузки на диск и его миниатюра"""
+
+    name: str
+    data: bytes
+    thumbnail_name: str | None = None
+    thumbnail: bytes | None = None
+
+
+def _to_rgb(image: Image.Image) -> Image.Image:
+    """
+    Изображение без прозрачности и палитры (прозрачное - на белом фоне)
+
+    Args:
+        image: изображение
+
+    Returns:
+        Image.Image: изображение RGB или в оттенках серого
+    """
+    if image.mode in ("RGB", "L"):
+        return image
+    if image.mode == "P" and "transparency" not in image.info:
+        return image.convert("RGB")
+    image = image.convert("RGBA")
+    background = Image.new("RGB", image.size, "white")
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+def _encode(image: Image.Image, quality: int) -> bytes:
+    """
+    Сжатие изображения
+
+    Args:
+        image: изображение
+        quality: качество JPEG
+
+    Returns:
+        bytes: файл изображения
+    """
+    output = BytesIO()
+    image.save(
+        output,
+        IMAGE_FORMAT,
+        quality=quality,
+        optimize=True,
+        progressive=True,
+    )
+    return output.getvalue()
+
+
+def normalize_image(
+    data: bytes,
+    max_size: int,
+    thumbnail_size: int,
+    quality: int,
+) -> tuple[bytes, bytes] | None:
+    """
+    Нормализация изображения: поворот по EXIF, уменьшение до max_size
+    по большей стороне, пересжатие и миниатюра.
+
+    Выполняется в пуле процессов, поэтому не обращается к настройкам
+    Django: параметры передаются явно.
+
+    Args:
+        data: исходный файл
+        max_size: наибольшая сторона изображения в пикселях
+        thumbnail_size: наибольшая сторона миниатюры в пикселях
+        quality: качество JPEG
+
+    Returns:
+        tuple[bytes, bytes] | None: изображение и миниатюра или None,
+            если файл не изображение (PDF) или не декодируется
+    """
+    try:
+        with Image.open(BytesIO(data)) as source:
+            image = _to_rgb(ImageOps.exif_transpose(source))
+            image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            normalized = _encode(image, quality)
+            image.thumbnail((thumbnail_size, thumbnail_size))
+            return normalized, _encode(image, quality)
+    except Exception as e:
+        # Декодеры Pillow на поврежденных файлах бросают разные
+        # исключения (OSError, SyntaxError, DecompressionBombError)
+        logger.debug("Файл не нормализован: %s", e)
+        return None
+
+
+def thumbnail_image(data: bytes, size: int, quality: int) -> bytes | None:
+    """
+    Миниатюра изображения (выполняется в пуле процессов)
+
+    Args:
+        data: исходный файл
+        size: наибольшая сторона миниатюры в пикселях
+        quality: качество JPEG
+
+    Returns:
+        bytes | None: миниатюра или None, если файл не изображение
+    """
+    try:
+        with Image.open(BytesIO(data)) as source:
+            # draft ускоряет декодирование больших JPEG
+            source.draft("RGB", (size, size))
+            image = _to_rgb(ImageOps.exif_transpose(source))
+            image.thumbnail((size, size))
+            return _encode(image, quality)
+    except Exception as e:
+        logger.debug("Миниатюра не создана: %s", e)
+        return None
+
+
+def icon_image(label: str, size: int, quality: int) -> bytes:
+    """
+    Значок файла без изображения (PDF): подпись с типом файла
+
+    Args:
+        label: подпись (тип файла)
+        size: сторона значка в пикселях
+        quality: качество JPEG
+
+    Returns:
+        bytes: значок
+    """
+    image = Image.new("RGB", (size, size), "#f8f9fa")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, size - 1, size - 1), outline="#e0e0e0")
+    draw.text(
+        (size / 2, size / 2),
+        label.upper(),
+        fill="#e74c3c",
+        anchor="mm",
+        font_size=size // 5,
+    )
+    return _encode(image, quality)
+
+
+def get_image_executor() -> ProcessPoolExecutor | None:
+    """
+    Пул процессов для обработки изображений.
+
+    Размер задается IMAGE_PROCESS_WORKERS, 0 - изображения
+    обрабатываются в вызывающем потоке. Процессы запускаются через
+    spawn: fork многопоточного процесса (бот, сервер) небезопасен.
+
+    Returns:
+        ProcessPoolExecutor | None: пул или None, если пул отключен
+    """
+    global _executor
+    if settings.IMAGE_PROCESS_WORKERS <= 0:
+        return None
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.debug(
+                "Создан пул процессов изображений на %s",
+                settings.IMAGE_PROCESS_WORKERS,
+            )
+        return _executor
+
+
+def _reset_image_executor(executor: ProcessPoolExecutor) -> None:
+    """
+    Убрать сломанный пул (процесс завершился аварийно),
+    следующий вызов создаст новый
+
+    Args:
+        executor: сломанный пул
+    """
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def shutdown_image_executor() -> None:
+    """Остановить пул процессов изображений"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+        logger.debug("Пул процессов изображений остановлен")
+
+
+def _run(func: Callable[..., Any], *args) -> Any:
+    """
+    Выполнить обработку изображения в пуле процессов
+    (без пула - в вызывающем потоке)
+
+    Args:
+        func: функция обработки
+        *args: аргументы
+
+    Returns:
+        Any: результат функции
+    """
+    executor = get_image_executor()
+    if executor is None:
+        return func(*args)
+    try:
+        return executor.submit(func, *args).result()
+    except BrokenProcessPool:
+        logger.error("Пул процессов изображений сломан, пересоздаем")
+        _reset_image_executor(executor)
+        return func(*args)
+
+
+def make_thumbnail(data: bytes) -> bytes | None:
+    """
+    Миниатюра IMAGE_THUMBNAIL_SIZE для превью документа
+
+    Args:
+        data: файл
+
+    Returns:
+        bytes | None: миниатюра или None, если файл не изображение
+    """
+    return _run(
+        thumbnail_image,
+        data,
+        settings.IMAGE_THUMBNAIL_SIZE,
+        settings.IMAGE_JPEG_QUALITY,
+    )
+
+
+def prepare_image(name: str, data: bytes) -> PreparedImage:
+    """
+    Подготовка файла документа к загрузке на диск.
+
+    Изображения нормализуются в пуле процессов и получают миниатюру,
+    остальные файлы (PDF) возвращаются без изменений.
+
+    Args:
+        name: имя файла
+        data: файл
+
+    Returns:
+        PreparedImage: файл и миниатюра для загрузки
+    """
+    result = _run(
+        normalize_image,
+        data,
+        settings.IMAGE_MAX_SIZE,
+        settings.IMAGE_THUMBNAIL_SIZE,
+        settings.IMAGE_JPEG_QUALITY,
+    )
+    if result is None:
+        return PreparedImage(name=name, data=data)
+
+    image, thumbnail = result
+    stem = PurePosixPath(name).stem
+    logger.debug(
+        "Изображение %s сжато: %s -> %s байт",
+        name,
+        len(data),
+        len(image),
+    )
+    return PreparedImage(
+        name=f"{stem}.{IMAGE_EXTENSION}",
+        data=image,
+        thumbnail_name=f"{stem}{THUMBNAIL_SUFFIX}.{IMAGE_EXTENSION}",
+        thumbnail=thumbnail,
+    )
@@ -0,0 +1,95 @@
+from django.db import migrations
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """
+    Добавление индекса, в PostgreSQL - без блокировки записи в таблицу
+    (CREATE INDEX CONCURRENTLY). На других СУБД - обычный AddIndex.
+
+    Миграция с этой операцией должна быть atomic = False.
+    """
+
+    @staticmethod
+    def _concurrently(schema_editor) -> dict[str, bool]:
+        """
+        Аргументы schema_editor для построения индекса
+
+        Args:
+            schema_editor: редактор схемы БД
+
+        Returns:
+            dict[str, bool]: аргументы
+        """
+        if schema_editor.connection.vendor == "postgresql":
+            return {"concurrently": True}
+        return {}
+
+    def database_forwards(
+        self,
+        app_label,
+        schema_editor,
+        from_state,
+        to_state,
+    ):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(
+                model,
+                self.index,
+                **self._concurrently(schema_editor),
+            )
+
+    def database_backwards(
+        self,
+        app_label,
+        schema_editor,
+        from_state,
+        to_state,
+    ):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(
+                model,
+                self.index,
+                **self._concurrently(schema_editor),
+            )
+
+
+class AddPostgresIndexConcurrently(AddIndexConcurrently):
+    """
+    Индекс, который есть только в PostgreSQL (GIN, opclasses),
+    строится без блокировки записи. На других СУБД индекс остается
+    только в состоянии моделей, в БД ничего не создается.
+
+    Миграция с этой операцией должна быть atomic = False.
+    """
+
+    def database_forwards(
+        self,
+        app_label,
+        schema_editor,
+        from_state,
+        to_state,
+    ):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(
+                app_label,
+                schema_editor,
+                from_state,
+                to_state,
+            )
+
+    def database_backwards(
+        self,
+        app_label,
+        schema_editor,
+        from_state,
+        to_state,
+    ):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(
+                app_label,
+                schema_editor,
+                from_state,
+                to_state,
+            )
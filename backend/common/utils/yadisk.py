@@ -2,6 +2,8 @@ import logging
 import urllib
 
 import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
 from rest_framework import status
 
 logger = logging.getLogger(__name__)
@@ -104,3 +106,35 @@ class YandexDiskUploader:
         except Exception as e:
             logger.error(EXIST_ERROR.format(e))
             raise self.FileCheckError(EXIST_ERROR.format(e))
+
+
+class FakeDiskUploader(YandexDiskUploader):
+    """
+    Локальная подмена Яндекс-диска для нагрузочных прогонов и разработки.
+
+    Файлы никуда не отправляются, возвращаются пути того же вида,
+    что и у Яндекс-диска.
+    """
+
+    def get_upload_url(self, filename):
+        return f"fake-disk:/{self.upload_path.format(filename)}"
+
+    def upload_file(self, filename, file_data):
+        logger.debug(UPLOAD_MSG)
+        return self.upload_path.format(filename)
+
+    def get_download_url(self, file_path):
+        return f"/fake-disk/{file_path}"
+
+    def check_file_exists(self, file_path):
+        return True
+
+
+def get_disk_uploader() -> YandexDiskUploader:
+    """
+    Загрузчик файлов из настройки DISK_UPLOADER
+
+    Returns:
+        YandexDiskUploader: загрузчик с токеном DISK_TOKEN
+    """
+    return import_string(settings.DISK_UPLOADER)(settings.DISK_TOKEN)
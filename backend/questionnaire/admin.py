@@ -1,10 +1,17 @@
 import logging
 
+from django.conf import settings
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Count
+from django.http import FileResponse, Http404, HttpResponse
+from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from django.utils.html import format_html
 from django.urls import path, reverse
 from rest_framework.authtoken.models import TokenProxy
@@ -12,7 +19,9 @@ from unfold.admin import ModelAdmin
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 
+from questionnaire.comments import render_survey_comments
 from questionnaire.constant import SurveyStatus
+from questionnaire.search import search_filter
 from questionnaire.models import (
     AnswerChoice,
     Comment,
@@ -25,6 +34,12 @@ from questionnaire.utils import (
     get_docs_zip,
     get_excel_file,
 )
+from questionnaire.thumbnails import (
+    ThumbnailError,
+    get_thumbnail_nowait,
+    placeholder,
+)
+from telegram_bot.notifications import enqueue_status_notifications
 
 User = get_user_model()
 admin.site.unregister(Group)
@@ -48,6 +63,23 @@ class StatusFilter(admin.SimpleListFilter):
         return queryset
 
 
+def _thumbnail_url(document: Document) -> str:
+    """
+    Ссылка на миниатюру документа из локального кеша
+    (вместо загрузки оригинала с Яндекс-диска)
+
+    Args:
+        document: документ
+
+    Returns:
+        str: ссылка на изображение превью
+    """
+    return reverse(
+        "admin:questionnaire_document_thumbnail",
+        args=(document.pk,),
+    )
+
+
 class DocumentInline(admin.TabularInline):
     """Документы."""
 
@@ -108,7 +140,7 @@ class DocumentInline(admin.TabularInline):
                     'style="max-height: 100px; max-width: 100px; '
                     'border: 1px solid #ddd; border-radius: 4px;" /></a>',
                     download_url,
-                    download_url,
+                    _thumbnail_url(obj),
                 )
 
             # Для других типов файлов показываем общую иконку
@@ -150,6 +182,9 @@ class CommentInline(admin.TabularInline):
     readonly_fields = ("created_at_formatted", "user_display")
     exclude = ("user",)  # Убираем поле пользователя из формы
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("user")
+
     @admin.display(description="Пользователь")
     def user_display(self, obj):
         """Отображаем пользователя в readonly режиме."""
@@ -202,7 +237,11 @@ class SurveyAdmin(ModelAdmin):
         "created_at_formatted",
     )
     list_filter = (StatusFilter, "created_at")
-    search_fields = ("user__email", "user__phone_number", "created_at")
+    # Поиск по денормализованным полям опроса, см. get_search_results
+    search_fields = ("search_user", "search_answers")
+    search_help_text = "ФИО, почта, телефон, Telegram или текст ответа"
+    # Без подсчета всех опросов (COUNT по таблице) при каждом поиске
+    show_full_result_count = False
     readonly_fields = (
         "id",
         "user_info",
@@ -220,19 +259,101 @@ class SurveyAdmin(ModelAdmin):
     )
     list_select_related = ("user", "current_question")
     inlines = (DocumentInline, CommentInline)
-    actions = ["download_servey"]
+    actions = [
+        "download_servey",
+        "mark_in_progress",
+        "mark_completed",
+        "mark_rejected",
+    ]
     ordering = ("-created_at",)
 
+    def _is_changelist(self, request) -> bool:
+        """
+        Запрос страницы списка (не карточки и не действия над списком:
+        действиям нужны полные объекты без группировки)
+        """
+        opts = self.model._meta
+        return (
+            request.method == "GET"
+            and request.resolver_match is not None
+            and request.resolver_match.url_name
+            == f"{opts.app_label}_{opts.model_name}_changelist"
+        )
+
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related("user", "current_question").prefetch_related(
-            "docs", "comments"
+        qs = super().get_queryset(request).select_related(
+            "user", "current_question"
         )
+        if self._is_changelist(request):
+            # Списку нужны только количества документов и комментариев,
+            # результаты опроса и данные для поиска в нем не выводятся
+            return qs.defer(
+                "result", "search_user", "search_answers"
+            ).annotate(
+                documents_total=Count("docs", distinct=True),
+                comments_total=Count("comments", distinct=True),
+            )
+        return qs.prefetch_related("docs")
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Поиск опросов по словам запроса в данных пользователя и ответах
+        без JOIN с пользователями (questionnaire.search).
+        Дубликатов нет: условие только на поля опроса.
+        """
+        if not search_term.strip():
+            return queryset, False
+        return queryset.filter(search_filter(search_term)), False
 
     @admin.action(description="Скачать результаты опроса в формате Excel")
     def download_servey(self, request, queryset):
         return get_excel_file(queryset)
 
+    def save_model(self, request, obj, form, change):
+        """
+        Сохранение опроса. При смене статуса пользователю
+        отправляется уведомление в Telegram.
+        """
+        super().save_model(request, obj, form, change)
+        if change and "status" in form.changed_data:
+            transaction.on_commit(
+                lambda: enqueue_status_notifications(
+                    Survey.objects.filter(pk=obj.pk)
+                )
+            )
+
+    def _change_status(self, request, queryset, status: SurveyStatus):
+        """
+        Сменить статус опросов одним запросом и поставить
+        уведомления пользователям в очередь
+
+        Args:
+            request: запрос
+            queryset: выбранные опросы
+            status: новый статус
+        """
+        surveys = queryset.exclude(status=status.value)
+        with transaction.atomic():
+            notified = enqueue_status_notifications(surveys, status.value)
+            changed = surveys.update(status=status.value)
+        self.message_user(
+            request,
+            f"Статус «{status.label}» установлен у {changed} заявок, "
+            f"уведомлений в очереди: {notified}",
+        )
+
+    @admin.action(description="Перевести в статус «В работе»")
+    def mark_in_progress(self, request, queryset):
+        self._change_status(request, queryset, SurveyStatus.IN_PROGRESS)
+
+    @admin.action(description="Перевести в статус «Завершена»")
+    def mark_completed(self, request, queryset):
+        self._change_status(request, queryset, SurveyStatus.COMPLETED)
+
+    @admin.action(description="Перевести в статус «Отклонена»")
+    def mark_rejected(self, request, queryset):
+        self._change_status(request, queryset, SurveyStatus.REJECTED)
+
     @admin.display(description="Пользователь")
     def user_info(self, obj):
         user = obj.user
@@ -249,15 +370,13 @@ class SurveyAdmin(ModelAdmin):
     def created_at_formatted(self, obj):
         return timezone.localtime(obj.created_at).strftime("%d.%m.%Y %H:%M")
 
-    @admin.display(description="Документы")
+    @admin.display(description="Документы", ordering="documents_total")
     def documents_count(self, obj):
-        return len(obj.docs.all())
-        # return obj.docs.count()
+        return obj.documents_total
 
-    @admin.display(description="Комментарии")
+    @admin.display(description="Комментарии", ordering="comments_total")
     def comments_count(self, obj):
-        return len(obj.comments.all())
-        # return obj.comments.count()
+        return obj.comments_total
 
     @admin.display(description="Результаты опроса")
     def result_display(self, obj):
@@ -294,49 +413,7 @@ class SurveyAdmin(ModelAdmin):
 
     @admin.display(description="Комментарии")
     def comments_list(self, obj):
-        comments = obj.comments.all().order_by("-created_at")
-        if not comments:
-            return "Комментарии отсутствуют"
-
-        html = (
-            '<div style="max-height: 300px; '
-            "overflow-y: auto; "
-            "border: 1px solid #ddd; "
-            "padding: 10px; "
-            "border-radius: 5px;"
-            '">'
-        )
-        for comment in comments:
-            html += format_html(
-                """
-                <div style="margin-bottom: 15px;
-                    padding: 10px;
-                    background: #f9f9f9;
-                    border-radius: 5px;
-                    border-left: 4px solid #007cba;
-                ">
-                    <div style="display: flex;
-                        justify-content: between;
-                        align-items: center;
-                        margin-bottom: 5px;
-                    ">
-                        <strong style="color: #333;">{}</strong>
-                        <small style="color: #666;
-                            margin-left: auto;
-                            ">{}
-                        </small>
-                    </div>
-                    <div style="color: #555; line-height: 1.4;">{}</div>
-                </div>
-                """,
-                comment.user.get_full_name() or comment.user.username,
-                timezone.localtime(comment.created_at).strftime(
-                    "%d.%m.%Y %H:%M"
-                ),
-                comment.text,
-            )
-        html += "</div>"
-        return format_html(html)
+        return render_survey_comments(obj.pk) or "Комментарии отсутствуют"
 
     def has_module_permission(self, request):
         """
@@ -368,6 +445,64 @@ class DocumentAdmin(ModelAdmin):
     )
     list_select_related = ("survey",)  # Добавляем для оптимизации запросов
 
+    def get_urls(self):
+        urls = super().get_urls()
+        custom_urls = [
+            path(
+                "<int:pk>/thumbnail/",
+                self.admin_site.admin_view(self.thumbnail_view),
+                name="questionnaire_document_thumbnail",
+            ),
+        ]
+        return custom_urls + urls
+
+    def thumbnail_view(self, request, pk: int) -> HttpResponse:
+        """
+        Миниатюра документа из кеша на диске.
+
+        При THUMBNAIL_ACCEL_REDIRECT файл отдает nginx (X-Accel-Redirect),
+        иначе - Django. Путь к файлу документа не меняется, поэтому
+        ответ кешируется браузером надолго. Пока миниатюра строится в
+        фоне, отдается значок типа файла без кеширования.
+
+        Args:
+            request: запрос
+            pk: первичный ключ документа
+
+        Returns:
+            HttpResponse: миниатюра
+        """
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        document = get_object_or_404(Document, pk=pk)
+        try:
+            path = get_thumbnail_nowait(document)
+        except ThumbnailError as e:
+            logger.warning("Нет миниатюры документа %s: %s", pk, e)
+            raise Http404 from e
+        if path is None:
+            response = HttpResponse(
+                placeholder(document), content_type="image/jpeg"
+            )
+            patch_cache_control(response, private=True, no_store=True)
+            return response
+
+        if settings.THUMBNAIL_ACCEL_REDIRECT:
+            response = HttpResponse(content_type="image/jpeg")
+            relative_path = path.relative_to(settings.THUMBNAIL_CACHE_DIR)
+            response["X-Accel-Redirect"] = (
+                settings.THUMBNAIL_ACCEL_REDIRECT + relative_path.as_posix()
+            )
+        else:
+            response = FileResponse(path.open("rb"), content_type="image/jpeg")
+        patch_cache_control(
+            response,
+            private=True,
+            max_age=settings.THUMBNAIL_MAX_AGE,
+            immutable=True,
+        )
+        return response
+
     def has_module_permission(self, request):
         """Показывать раздел только персоналу"""
         return request.user.is_staff or request.user.is_superuser
@@ -436,7 +571,7 @@ class DocumentAdmin(ModelAdmin):
                     'style="max-height: 80px; max-width: 80px; '
                     'border: 1px solid #ddd; border-radius: 4px;" /></a>',
                     download_url,
-                    download_url,
+                    _thumbnail_url(obj),
                 )
             else:
                 return format_html(
@@ -490,6 +625,14 @@ class AnswerChoiceAdmin(ModelAdmin):
         "new_status",
     )
 
+    def get_queryset(self, request):
+        """Варианты ответа в порядке опросника"""
+        qs = AnswerChoice.admin_objects.get_queryset()
+        ordering = self.get_ordering(request)
+        if ordering:
+            qs = qs.order_by(*ordering)
+        return qs
+
     def has_module_permission(self, request):
         """Только суперпользователи видят раздел Ответы"""
         return request.user.is_superuser
@@ -562,6 +705,7 @@ class UserAdmin(ModelAdmin):
                     "email",
                     "phone_number",
                     "telegram_username",
+                    "telegram_id",
                     "residence",
                 )
             },
@@ -634,6 +778,7 @@ class CommentAdmin(ModelAdmin):
     """Комментарии."""
 
     list_display = ("survey_short", "user_info", "text", "created_at")
+    list_select_related = ("survey", "user")
     readonly_fields = ("user_info", "created_at_formatted")
     exclude = ["created_at"]
     list_filter = ("survey", "user", "created_at")
@@ -1,7 +1,44 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 
 
 class QuestionnaireConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "questionnaire"
     verbose_name = "Раздел «ОПРОСЫ»"
+
+    def ready(self):
+        """
+        Сброс кеша опросника при изменении вопросов и ответов
+        и кеша комментариев в админке при изменении комментариев,
+        обновление данных для поиска опросов при создании опроса
+        и изменении пользователя
+        """
+        from .cache import bump_revision
+        from .comments import invalidate_survey_comments
+        from .search import fill_created_survey_search, update_user_surveys
+
+        for model_name in ("Question", "AnswerChoice"):
+            model = self.get_model(model_name)
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    bump_revision,
+                    sender=model,
+                    dispatch_uid=f"questionnaire_revision_{model_name}",
+                )
+        post_save.connect(
+            invalidate_survey_comments,
+            sender=self.get_model("Comment"),
+            dispatch_uid="questionnaire_admin_comments",
+        )
+        post_save.connect(
+            fill_created_survey_search,
+            sender=self.get_model("Survey"),
+            dispatch_uid="questionnaire_survey_search",
+        )
+        post_save.connect(
+            update_user_surveys,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="questionnaire_user_search",
+        )
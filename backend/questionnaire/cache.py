@@ -0,0 +1,133 @@
+import copy
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import AnswerChoice, Question
+
+logger = logging.getLogger(__name__)
+
+REVISION_KEY = "questionnaire:revision"
+ANSWERS_KEY = "questionnaire:{revision}:answers:{question_id}"
+
+
+def get_revision() -> int:
+    """
+    Ревизия опросника: меняется при любом изменении вопросов
+    и вариантов ответа
+
+    Начальное значение берется от времени: после очистки кеша
+    ревизия не совпадет с запомненной процессами раньше.
+
+    Returns:
+        int: ревизия
+    """
+    return cache.get_or_set(REVISION_KEY, time.time_ns, timeout=None)
+
+
+def bump_revision(*args, **kwargs) -> None:
+    """
+    Сменить ревизию опросника: закешированные по старой ревизии
+    данные больше не используются.
+    Подключается к сигналам изменения вопросов и вариантов ответа.
+    """
+    try:
+        revision = cache.incr(REVISION_KEY)
+    except ValueError:
+        revision = time.time_ns()
+        cache.set(REVISION_KEY, revision, timeout=None)
+    logger.debug("Ревизия опросника %s", revision)
+
+
+def get_question_answers(question_id: int) -> list[str | None]:
+    """
+    Варианты ответа на вопрос с кешированием по ревизии опросника
+    (в порядке опросника, как в админке).
+
+    Записи живут не дольше QUESTIONNAIRE_CACHE_TIMEOUT: без общего
+    кеша (Redis) другой процесс не увидит смену ревизии.
+
+    Args:
+        question_id: идентификатор вопроса
+
+    Returns:
+        list[str | None]: варианты ответа
+    """
+    key = ANSWERS_KEY.format(
+        revision=get_revision(),
+        question_id=question_id,
+    )
+    answers = cache.get(key)
+    if answers is None:
+        answers = list(
+            AnswerChoice.admin_objects.filter(
+                current_question_id=question_id
+            ).values_list("answer", flat=True)
+        )
+        cache.set(key, answers, settings.QUESTIONNAIRE_CACHE_TIMEOUT)
+    return answers
+
+
+class RevisionMemo:
+    """
+    Словарь в памяти процесса для данных, построенных по опроснику.
+
+    Очищается при смене ревизии опросника и не реже, чем раз в
+    QUESTIONNAIRE_CACHE_TIMEOUT: без общего кеша смену ревизии в другом
+    процессе не видно.
+    """
+
+    def __init__(self):
+        self._data: dict[Hashable, Any] = {}
+        self._revision: int | None = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Значение по ключу, построенное при первом обращении
+
+        Args:
+            key: ключ
+            build: построение значения
+
+        Returns:
+            Any: значение
+        """
+        revision = get_revision()
+        with self._lock:
+            now = time.monotonic()
+            if revision != self._revision or now >= self._expires_at:
+                self._data.clear()
+                self._revision = revision
+                self._expires_at = now + settings.QUESTIONNAIRE_CACHE_TIMEOUT
+            if key not in self._data:
+                self._data[key] = build()
+            return self._data[key]
+
+
+_start_questions = RevisionMemo()
+
+
+def get_start_question(question_type: str = "start") -> Question | None:
+    """
+    Стартовый вопрос опросника с кешированием по ревизии.
+
+    Возвращается копия: сериализаторы меняют текст вопроса.
+
+    Args:
+        question_type: тип стартового вопроса
+
+    Returns:
+        Question | None: стартовый вопрос
+    """
+    question = _start_questions.get_or_build(
+        question_type,
+        lambda: Question.objects.filter(type=question_type).first(),
+    )
+    return copy.deepcopy(question)
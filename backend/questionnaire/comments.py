@@ -0,0 +1,90 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.safestring import SafeString, mark_safe
+
+from questionnaire.models import Comment
+
+logger = logging.getLogger(__name__)
+
+COMMENTS_TEMPLATE = "admin/questionnaire/survey/comments_list.html"
+COMMENTS_KEY = "admin:survey:{survey_id}:comments:{total}:{last}"
+
+
+def _cache_key(survey_id) -> tuple[str, int]:
+    """
+    Ключ кеша списка комментариев опроса: меняется с каждым новым
+    и удаленным комментарием
+
+    Args:
+        survey_id: идентификатор опроса
+
+    Returns:
+        tuple[str, int]: ключ и число комментариев
+    """
+    state = Comment.objects.filter(survey_id=survey_id).aggregate(
+        total=Count("id"),
+        last=Max("created_at"),
+    )
+    key = COMMENTS_KEY.format(
+        survey_id=survey_id,
+        total=state["total"],
+        last=state["last"].timestamp() if state["last"] else 0,
+    )
+    return key, state["total"]
+
+
+def render_survey_comments(survey_id) -> SafeString | None:
+    """
+    Последние ADMIN_COMMENTS_LIMIT комментариев опроса со ссылкой на
+    остальные. Фрагмент кешируется по времени последнего комментария:
+    при кеше - один запрос к БД, без кеша - еще один.
+
+    Args:
+        survey_id: идентификатор опроса
+
+    Returns:
+        SafeString | None: HTML или None, если комментариев нет
+    """
+    key, total = _cache_key(survey_id)
+    if not total:
+        return None
+    html = cache.get(key)
+    if html is None:
+        limit = settings.ADMIN_COMMENTS_LIMIT
+        comments = list(
+            Comment.objects.filter(survey_id=survey_id)
+            .select_related("user")
+            .order_by("-created_at", "-id")[:limit]
+        )
+        html = render_to_string(
+            COMMENTS_TEMPLATE,
+            {
+                "comments": comments,
+                "more": total > len(comments),
+                "total": total,
+                "all_url": reverse("admin:questionnaire_comment_changelist")
+                + f"?survey__id__exact={survey_id}",
+            },
+        )
+        cache.set(key, html, settings.ADMIN_COMMENTS_CACHE_TIMEOUT)
+    return mark_safe(html)
+
+
+def invalidate_survey_comments(
+    sender,
+    instance: Comment,
+    created: bool = False,
+    **kwargs,
+) -> None:
+    """
+    Сброс кеша списка комментариев при изменении комментария
+    (новые комментарии меняют ключ сами).
+    Подключается к post_save комментария.
+    """
+    if not created:
+        cache.delete(_cache_key(instance.survey_id)[0])
@@ -0,0 +1,37 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from questionnaire.search import FILL_BATCH_SIZE, fill_missing_user_search
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Заполняет данные пользователя для поиска в админке у опросов, "
+        "где их нет (например, после сбоя между созданием опроса "
+        "и заполнением)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=FILL_BATCH_SIZE,
+            help="Опросов за один запрос",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Заполнение пачками до последнего опроса
+
+        Args:
+            *args: аргументы
+            **options: именные аргументы
+        """
+        total = 0
+        while filled := fill_missing_user_search(options["batch_size"]):
+            total += filled
+            logger.debug("Заполнено опросов: %s", total)
+        self.stdout.write(f"Заполнено опросов: {total}")
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-19 12:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("questionnaire", "0011_alter_answerchoice_new_status_alter_survey_status"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="question",
+            name="type",
+            field=models.CharField(
+                choices=[
+                    ("standart", "Cтандартный"),
+                    ("start", "Стартовый вопрос"),
+                    ("waiting_docs", "Ожидает документов"),
+                ],
+                db_index=True,
+                default="standart",
+                max_length=30,
+                verbose_name="Тип вопроса",
+            ),
+        ),
+    ]
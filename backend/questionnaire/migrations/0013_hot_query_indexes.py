@@ -0,0 +1,63 @@
+# Generated by Django 5.2.6 on 2026-10-19 12:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from common.utils.migrations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # Индексы строятся в PostgreSQL без блокировки записи, а индексы
+    # внешних ключей удаляются только после построения составных
+    atomic = False
+
+    dependencies = [
+        ("questionnaire", "0012_question_type_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="comment",
+            index=models.Index(
+                fields=["survey", "-created_at"],
+                name="comment_survey_created_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="survey",
+            index=models.Index(
+                fields=["user", "-created_at"],
+                name="survey_user_created_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="survey",
+            index=models.Index(
+                fields=["status", "-created_at"],
+                name="survey_status_created_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="comment",
+            name="survey",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="questionnaire.survey",
+                verbose_name="Опрос",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="survey",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="surveys",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Пользователь",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("questionnaire", "0013_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="thumbnail",
+            field=models.CharField(
+                blank=True,
+                default="",
+                max_length=2048,
+                verbose_name="Путь к миниатюре документа на Яндекс-диске",
+            ),
+        ),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 5.2.6 on 2026-10-19 13:26
+
+import re
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+from common.utils.migrations import (
+    AddIndexConcurrently,
+    AddPostgresIndexConcurrently,
+)
+
+BATCH_SIZE = 1000
+# Копия questionnaire.search на момент миграции: ее результат не должен
+# зависеть от последующих изменений модуля
+USER_SEARCH_FIELDS = (
+    "first_name",
+    "last_name",
+    "patronymic",
+    "email",
+    "phone_number",
+    "telegram_username",
+)
+_NOT_DIGITS = re.compile(r"\D")
+
+
+def normalize(text):
+    return " ".join(text.lower().split())
+
+
+def user_search_text(user):
+    values = [getattr(user, field, None) or "" for field in USER_SEARCH_FIELDS]
+    if user.phone_number:
+        values.append(_NOT_DIGITS.sub("", user.phone_number))
+    return normalize(" ".join(values))
+
+
+def answers_search_text(result):
+    return normalize(
+        " ".join(str(answer) for answer in (result or [])[1::2] if answer)
+    )
+
+
+def fill_search_fields(apps, schema_editor):
+    """Заполняет данные для поиска у существующих опросов"""
+
+    Survey = apps.get_model("questionnaire", "Survey")
+    surveys = (
+        Survey.objects.select_related("user")
+        .only(
+            "result",
+            *(f"user__{field}" for field in USER_SEARCH_FIELDS),
+        )
+        .order_by("pk")
+    )
+    batch = []
+    for survey in surveys.iterator(chunk_size=BATCH_SIZE):
+        survey.search_user = user_search_text(survey.user)
+        survey.search_answers = answers_search_text(survey.result)
+        batch.append(survey)
+        if len(batch) == BATCH_SIZE:
+            Survey.objects.bulk_update(
+                batch,
+                ["search_user", "search_answers"],
+            )
+            batch = []
+    if batch:
+        Survey.objects.bulk_update(batch, ["search_user", "search_answers"])
+
+
+class Migration(migrations.Migration):
+    # Индексы строятся в PostgreSQL без блокировки записи
+    atomic = False
+
+    dependencies = [
+        ("questionnaire", "0014_document_thumbnail"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        # Заполнение существующих опросов читает поля пользователя
+        ("users", "0010_user_telegram_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="survey",
+            name="search_answers",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                verbose_name="Ответы для поиска",
+            ),
+        ),
+        migrations.AddField(
+            model_name="survey",
+            name="search_user",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="Данные пользователя для поиска",
+            ),
+        ),
+        migrations.RunPython(
+            fill_search_fields,
+            migrations.RunPython.noop,
+        ),
+        TrigramExtension(),
+        AddPostgresIndexConcurrently(
+            model_name="survey",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_user"],
+                name="survey_search_user_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="survey",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_answers"],
+                name="survey_search_answers_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="survey",
+            index=models.Index(
+                condition=models.Q(("search_user__isnull", True)),
+                fields=["id"],
+                name="survey_search_user_missing",
+            ),
+        ),
+    ]
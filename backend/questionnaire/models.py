@@ -8,12 +8,14 @@ from django.db.models import (
     Index,
     JSONField,
     Model,
+    Q,
     SET_NULL,
     TextField,
     UniqueConstraint,
     UUIDField,
 )
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from uuid import uuid4
 
 from django.db import models
@@ -27,6 +29,7 @@ from .constant import (
     QUESTION_TYPE_LEN,
     EXTERNAL_TABLE_FIELD_NAME_CHOICES,
 )
+from .search import answers_search_text, user_search_text
 
 User = get_user_model()
 
@@ -48,6 +51,7 @@ class Question(Model):
         max_length=QUESTION_TYPE_LEN,
         choices=QUESTION_TYPE,
         default="standart",
+        db_index=True,
         verbose_name="Тип вопроса",
     )
     external_table_field_name = CharField(
@@ -82,29 +86,48 @@ class Question(Model):
         return f"{self.text[:MAX_LEN_STRING-10]} ({self.type}, PK:{self.pk})"
 
 
-class AnswerChoiceManager(models.Manager):
-    def get_queryset(self):
+class AnswerChoiceQuerySet(models.QuerySet):
+    """Варианты ответа"""
+
+    def in_questionnaire_order(self):
+        """
+        Порядок опросника: ответы стартового вопроса, затем рекурсивные,
+        затем остальные. Требует соединения с вопросами.
+
+        Returns:
+            AnswerChoiceQuerySet: отсортированные варианты ответа
+        """
         from django.db.models import Case, When, Value, IntegerField
 
-        return (
-            super()
-            .get_queryset()
-            .annotate(
-                sort_order=Case(
-                    # 1. current_question.type == "start"
-                    When(current_question__type="start", then=Value(1)),
-                    # 2. current_question == next_question (рекурсивные)
-                    When(
-                        current_question=models.F("next_question"),
-                        then=Value(2),
-                    ),
-                    # 3. Все остальные
-                    default=Value(3),
-                    output_field=IntegerField(),
-                )
+        return self.annotate(
+            sort_order=Case(
+                # 1. current_question.type == "start"
+                When(current_question__type="start", then=Value(1)),
+                # 2. current_question == next_question (рекурсивные)
+                When(
+                    current_question=models.F("next_question"),
+                    then=Value(2),
+                ),
+                # 3. Все остальные
+                default=Value(3),
+                output_field=IntegerField(),
             )
-            .order_by("sort_order", "current_question_id", "id")
-        )
+        ).order_by("sort_order", "current_question_id", "id")
+
+
+class AnswerChoiceAdminManager(
+    models.Manager.from_queryset(AnswerChoiceQuerySet)
+):
+    """
+    Варианты ответа в порядке для просмотра опросника: ответы стартового
+    вопроса, затем рекурсивные, затем остальные.
+
+    Сортировка требует соединения с вопросами, поэтому менеджер не
+    используется по умолчанию.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().in_questionnaire_order()
 
 
 class AnswerChoice(Model):
@@ -138,7 +161,9 @@ class AnswerChoice(Model):
         null=True,
         blank=True,
     )
-    objects = AnswerChoiceManager()
+    # Менеджер по умолчанию (и для question.answers) - без сортировки
+    objects = AnswerChoiceQuerySet.as_manager()
+    admin_objects = AnswerChoiceAdminManager()
 
     class Meta:
         verbose_name = "Вариант ответа"
@@ -182,6 +207,8 @@ class Survey(Model):
         on_delete=CASCADE,
         related_name="surveys",
         verbose_name="Пользователь",
+        # Покрыт индексом survey_user_created_idx
+        db_index=False,
     )
     current_question = ForeignKey(
         Question,
@@ -219,16 +246,80 @@ class Survey(Model):
         null=True,
         blank=True,
     )
+    # Денормализованные данные для поиска в админке (questionnaire.search).
+    # В PostgreSQL покрыты триграммными GIN-индексами.
+    # None - данные пользователя еще не заполнены
+    search_user = TextField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="Данные пользователя для поиска",
+    )
+    search_answers = TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="Ответы для поиска",
+    )
 
     class Meta:
         verbose_name = "Опрос"
         verbose_name_plural = "Опросы"
         ordering = ("-created_at",)
-        indexes = (Index(fields=["created_at"]),)
+        indexes = (
+            Index(fields=["created_at"]),
+            # Опросы пользователя, новые первыми
+            Index(
+                fields=["user", "-created_at"],
+                name="survey_user_created_idx",
+            ),
+            # Фильтр по статусу в админке с сортировкой по дате
+            Index(
+                fields=["status", "-created_at"],
+                name="survey_status_created_idx",
+            ),
+            # Поиск в админке по подстроке (PostgreSQL, pg_trgm)
+            GinIndex(
+                fields=["search_user"],
+                name="survey_search_user_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["search_answers"],
+                name="survey_search_answers_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+            # Опросы, которым нужно заполнить данные пользователя
+            Index(
+                fields=["id"],
+                condition=Q(search_user__isnull=True),
+                name="survey_search_user_missing",
+            ),
+        )
 
     def __str__(self) -> str:
         return f"Опрос пользователя {self.user} (статус: {self.status})"
 
+    def save(self, *args, **kwargs):
+        """
+        Сохранение опроса с обновлением данных для поиска.
+
+        Ответы берутся из result, данные пользователя - при создании
+        опроса (дальше их обновляет сигнал сохранения пользователя).
+        Пользователь из JWT без состояния или из кеша токенов загружен
+        из БД не целиком: его данные заполняются после фиксации
+        транзакции (search.fill_created_survey_search).
+        """
+        self.search_answers = answers_search_text(self.result)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "result" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "search_answers"}
+        if self._state.adding and self.user_id is not None:
+            user = self.user
+            if not (user._state.adding or user.get_deferred_fields()):
+                self.search_user = user_search_text(user)
+        super().save(*args, **kwargs)
+
 
 class Document(Model):
     """Документ"""
@@ -237,6 +328,12 @@ class Document(Model):
         max_length=FILE_URL_MAX_LEN,
         verbose_name="Путь к изображению документа на Яндекс-диске",
     )
+    thumbnail = CharField(
+        max_length=FILE_URL_MAX_LEN,
+        blank=True,
+        default="",
+        verbose_name="Путь к миниатюре документа на Яндекс-диске",
+    )
     survey = ForeignKey(
         Survey,
         on_delete=CASCADE,
@@ -262,6 +359,8 @@ class Comment(Model):
         Survey,
         on_delete=CASCADE,
         verbose_name="Опрос",
+        # Покрыт индексом comment_survey_created_idx
+        db_index=False,
     )
     user = ForeignKey(
         User,
@@ -278,6 +377,12 @@ class Comment(Model):
         verbose_name_plural = "Комментарии"
         default_related_name = "comments"
         ordering = ("-created_at",)
+        indexes = (
+            Index(
+                fields=["survey", "-created_at"],
+                name="comment_survey_created_idx",
+            ),
+        )
 
     def __str__(self):
         return f"Комментарий к опросу {self.survey}."
@@ -0,0 +1,185 @@
+import logging
+import re
+from functools import partial
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+# Поля пользователя, по которым ищутся опросы в админке
+USER_SEARCH_FIELDS = (
+    "first_name",
+    "last_name",
+    "patronymic",
+    "email",
+    "phone_number",
+    "telegram_username",
+)
+# Короче не ищем по цифрам номера: совпадет почти с любым телефоном
+_MIN_PHONE_DIGITS = 3
+_NOT_DIGITS = re.compile(r"\D")
+# Опросов за один вызов fill_missing_user_search
+FILL_BATCH_SIZE = 500
+
+
+def normalize(text: str) -> str:
+    """
+    Текст для поиска: в нижнем регистре и с одиночными пробелами.
+    Поиск идет по contains без учета регистра на стороне Python:
+    SQLite не приводит к нижнему регистру кириллицу.
+
+    Args:
+        text: текст
+
+    Returns:
+        str: нормализованный текст
+    """
+    return " ".join(text.lower().split())
+
+
+def user_search_text(user) -> str:
+    """
+    Данные пользователя для поиска опросов: ФИО, почта, телефон
+    (как есть и только цифры) и имя в Телеграм
+
+    Args:
+        user: пользователь с полями USER_SEARCH_FIELDS
+
+    Returns:
+        str: текст для поиска
+    """
+    values = [getattr(user, field, None) or "" for field in USER_SEARCH_FIELDS]
+    if user.phone_number:
+        values.append(_NOT_DIGITS.sub("", user.phone_number))
+    return normalize(" ".join(values))
+
+
+def answers_search_text(result: list | None) -> str:
+    """
+    Ответы опроса для поиска (без текстов вопросов: они у всех общие)
+
+    Args:
+        result: вопросы и ответы опроса
+
+    Returns:
+        str: текст для поиска
+    """
+    return normalize(
+        " ".join(str(answer) for answer in (result or [])[1::2] if answer)
+    )
+
+
+def search_filter(term: str) -> Q:
+    """
+    Условие поиска опросов: каждое слово запроса есть в данных
+    пользователя или в ответах. Номер телефона в любом формате
+    ищется и по цифрам.
+
+    Args:
+        term: строка поиска
+
+    Returns:
+        Q: условие для Survey
+    """
+    condition = Q()
+    for word in normalize(term).split():
+        word_condition = Q(search_user__contains=word) | Q(
+            search_answers__contains=word
+        )
+        digits = _NOT_DIGITS.sub("", word)
+        if digits != word and len(digits) >= _MIN_PHONE_DIGITS:
+            word_condition |= Q(search_user__contains=digits)
+        condition &= word_condition
+    return condition
+
+
+def fill_missing_user_search(limit: int = FILL_BATCH_SIZE) -> int:
+    """
+    Заполнение данных пользователя у опросов, где их нет (опрос
+    создан без загрузки пользователя и не заполнен после создания).
+    Опросы выбираются по частичному индексу, не больше limit за вызов.
+
+    Args:
+        limit: наибольшее количество опросов
+
+    Returns:
+        int: заполнено опросов
+    """
+    Survey = apps.get_model("questionnaire", "Survey")
+    surveys = list(
+        Survey.objects.filter(search_user__isnull=True)
+        .select_related("user")
+        .only(
+            "user_id",
+            *(f"user__{field}" for field in USER_SEARCH_FIELDS),
+        )
+        .order_by("pk")[:limit]
+    )
+    for survey in surveys:
+        survey.search_user = user_search_text(survey.user)
+    Survey.objects.bulk_update(surveys, ["search_user"])
+    return len(surveys)
+
+
+def _fill_survey_user_search(survey_id, user_id) -> None:
+    """
+    Заполнение данных пользователя у созданного опроса
+
+    Args:
+        survey_id: идентификатор опроса
+        user_id: идентификатор пользователя
+    """
+    user = (
+        get_user_model()
+        .objects.filter(pk=user_id)
+        .only(*USER_SEARCH_FIELDS)
+        .first()
+    )
+    if user is None:
+        return
+    apps.get_model("questionnaire", "Survey").objects.filter(
+        pk=survey_id,
+        search_user__isnull=True,
+    ).update(search_user=user_search_text(user))
+
+
+def fill_created_survey_search(
+    sender,
+    instance,
+    created: bool = False,
+    **kwargs,
+) -> None:
+    """
+    Заполнение данных пользователя у опроса, созданного без загрузки
+    пользователя (JWT без состояния), после фиксации транзакции:
+    шаги опроса пользователя не ждут этого запроса.
+    Подключается к post_save опроса.
+    """
+    if created and instance.search_user is None:
+        transaction.on_commit(
+            partial(_fill_survey_user_search, instance.pk, instance.user_id)
+        )
+
+
+def update_user_surveys(
+    sender,
+    instance,
+    created: bool = False,
+    update_fields=None,
+    **kwargs,
+) -> None:
+    """
+    Обновление данных пользователя для поиска во всех его опросах.
+    Подключается к post_save пользователя.
+    """
+    if created or (
+        update_fields is not None
+        and not set(update_fields) & set(USER_SEARCH_FIELDS)
+    ):
+        return
+    apps.get_model("questionnaire", "Survey").objects.filter(
+        user_id=instance.pk
+    ).update(search_user=user_search_text(instance))
@@ -0,0 +1,314 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import requests
+from django.conf import settings
+
+from common.utils.images import icon_image, make_thumbnail
+from questionnaire.models import Document
+from questionnaire.utils import get_cached_yadisk_url
+
+logger = logging.getLogger(__name__)
+
+# Расширение файлов кеша миниатюр
+THUMBNAIL_EXTENSION = ".jpg"
+# После вытеснения кеш занимает не больше этой доли от лимита,
+# чтобы не чистить его при каждой новой миниатюре
+_EVICT_TO = 0.9
+_DOWNLOAD_TIMEOUT = 30
+
+_evict_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_building: set[Path] = set()
+_build_lock = threading.Lock()
+
+
+class ThumbnailError(Exception):
+    """Исходный файл документа недоступен"""
+
+
+def _cache_dir() -> Path:
+    return Path(settings.THUMBNAIL_CACHE_DIR)
+
+
+def thumbnail_path(document: Document) -> Path:
+    """
+    Файл миниатюры документа в кеше.
+
+    Имя строится от пути файла на диске и размера миниатюры:
+    при смене IMAGE_THUMBNAIL_SIZE старые миниатюры вытесняются.
+
+    Args:
+        document: документ
+
+    Returns:
+        Path: путь к файлу миниатюры
+    """
+    digest = hashlib.sha256(
+        f"{document.image}:{settings.IMAGE_THUMBNAIL_SIZE}".encode()
+    ).hexdigest()
+    return _cache_dir() / digest[:2] / f"{digest}{THUMBNAIL_EXTENSION}"
+
+
+def _extension(file_path: str) -> str:
+    return file_path.rsplit(".", 1)[-1].lower() if "." in file_path else ""
+
+
+def _download(file_path: str) -> bytes:
+    """
+    Скачать файл с Яндекс-диска
+
+    Args:
+        file_path: путь к файлу на диске
+
+    Returns:
+        bytes: файл
+    """
+    url = get_cached_yadisk_url(file_path)
+    if not url:
+        raise ThumbnailError(f"Нет ссылки на файл {file_path}")
+    try:
+        response = requests.get(url, timeout=_DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise ThumbnailError(f"Файл {file_path} не скачан: {e}") from e
+    return response.content
+
+
+def _render(document: Document) -> bytes:
+    """
+    Миниатюра документа: готовая миниатюра с диска, уменьшенный
+    оригинал или значок для PDF и других файлов без изображения
+
+    Args:
+        document: документ
+
+    Returns:
+        bytes: миниатюра
+    """
+    size = settings.IMAGE_THUMBNAIL_SIZE
+    quality = settings.IMAGE_JPEG_QUALITY
+    extension = _extension(document.image)
+    if extension == "pdf":
+        return icon_image(extension, size, quality)
+    thumbnail = make_thumbnail(_download(document.thumbnail or document.image))
+    if thumbnail is None:
+        return icon_image(extension or "file", size, quality)
+    return thumbnail
+
+
+@lru_cache(maxsize=32)
+def _icon(label: str, size: int, quality: int) -> bytes:
+    return icon_image(label, size, quality)
+
+
+def placeholder(document: Document) -> bytes:
+    """
+    Значок типа файла документа на время, пока миниатюра строится
+
+    Args:
+        document: документ
+
+    Returns:
+        bytes: значок
+    """
+    return _icon(
+        _extension(document.image) or "file",
+        settings.IMAGE_THUMBNAIL_SIZE,
+        settings.IMAGE_JPEG_QUALITY,
+    )
+
+
+def _write(path: Path, data: bytes) -> None:
+    """
+    Атомарная запись файла: другие процессы не увидят его недописанным
+
+    Args:
+        path: путь
+        data: содержимое
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def evict(max_bytes: int | None = None) -> int:
+    """
+    Вытеснение давно не использованных миниатюр (LRU по времени
+    изменения файла, оно обновляется при каждом обращении), пока кеш
+    больше лимита THUMBNAIL_CACHE_MAX_BYTES
+
+    Args:
+        max_bytes: лимит размера кеша в байтах
+
+    Returns:
+        int: удалено файлов
+    """
+    if max_bytes is None:
+        max_bytes = settings.THUMBNAIL_CACHE_MAX_BYTES
+    with _evict_lock:
+        files = []
+        total = 0
+        for path in _cache_dir().glob(f"*/*{THUMBNAIL_EXTENSION}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= max_bytes:
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(files, key=lambda file: file[0]):
+            if total <= max_bytes * _EVICT_TO:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        logger.info("Из кеша миниатюр вытеснено файлов: %s", removed)
+        return removed
+
+
+def cached_thumbnail(document: Document) -> Path | None:
+    """
+    Миниатюра документа, если она уже в кеше на диске
+
+    Args:
+        document: документ
+
+    Returns:
+        Path | None: путь к файлу миниатюры или None
+    """
+    path = thumbnail_path(document)
+    try:
+        # отметка использования для LRU
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+def get_thumbnail(document: Document) -> Path:
+    """
+    Миниатюра документа из кеша на диске (создается при первом
+    обращении, для изображений - со скачиванием файла с диска)
+
+    Args:
+        document: документ
+
+    Returns:
+        Path: путь к файлу миниатюры
+
+    Raises:
+        ThumbnailError: исходный файл недоступен
+    """
+    if (path := cached_thumbnail(document)) is not None:
+        return path
+
+    path = thumbnail_path(document)
+    _write(path, _render(document))
+    logger.debug("Миниатюра документа %s сохранена в кеш", document.pk)
+    evict()
+    return path
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Пул потоков построения миниатюр (THUMBNAIL_BUILD_WORKERS)
+
+    Returns:
+        ThreadPoolExecutor: пул
+    """
+    global _executor
+    with _build_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.THUMBNAIL_BUILD_WORKERS,
+                thread_name_prefix="thumbnails",
+            )
+        return _executor
+
+
+def _build(document: Document, path: Path) -> None:
+    """
+    Построение миниатюры в фоне (без обращений к БД)
+
+    Args:
+        document: документ
+        path: путь к файлу миниатюры
+    """
+    try:
+        get_thumbnail(document)
+    except ThumbnailError as e:
+        logger.warning("Нет миниатюры документа %s: %s", document.pk, e)
+    except Exception:
+        logger.exception("Миниатюра документа %s не создана", document.pk)
+    finally:
+        with _build_lock:
+            _building.discard(path)
+
+
+def schedule_thumbnail(document: Document) -> None:
+    """
+    Построить миниатюру документа в фоне: запрос админки не ждет
+    скачивания файла с диска. Повторные вызовы, пока миниатюра
+    строится, ничего не делают.
+
+    Args:
+        document: документ
+    """
+    path = thumbnail_path(document)
+    with _build_lock:
+        if path in _building:
+            return
+        _building.add(path)
+    _get_executor().submit(_build, document, path)
+
+
+def shutdown_thumbnail_executor() -> None:
+    """Дождаться построения миниатюр и остановить пул"""
+    global _executor
+    with _build_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def get_thumbnail_nowait(document: Document) -> Path | None:
+    """
+    Миниатюра документа без ожидания скачивания: из кеша, значок PDF
+    строится сразу, миниатюра изображения - в фоне (None, пока не
+    готова). При THUMBNAIL_BUILD_WORKERS = 0 строится в вызывающем
+    потоке.
+
+    Args:
+        document: документ
+
+    Returns:
+        Path | None: путь к файлу миниатюры или None
+
+    Raises:
+        ThumbnailError: исходный файл недоступен
+    """
+    if (path := cached_thumbnail(document)) is not None:
+        return path
+    if (
+        settings.THUMBNAIL_BUILD_WORKERS <= 0
+        or _extension(document.image) == "pdf"
+    ):
+        return get_thumbnail(document)
+    schedule_thumbnail(document)
+    return None
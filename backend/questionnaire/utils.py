@@ -6,14 +6,13 @@ import logging
 import time
 
 import pandas as pd
-from django.conf import settings
 from django.core.cache import cache
 from django.http import FileResponse
 from uuid import uuid4
 from zipfile import ZipFile, ZIP_DEFLATED
 
 
-from common.utils.yadisk import YandexDiskUploader
+from common.utils.yadisk import get_disk_uploader
 from questionnaire.models import Survey
 
 
@@ -26,7 +25,7 @@ DOWNLOAD_ERROR = "Ошибка загрузки документа {}: {}"
 def get_url(document):
     """Получение URL на скачивание файла от API Yandex-диска."""
     try:
-        uploader = YandexDiskUploader(settings.DISK_TOKEN)
+        uploader = get_disk_uploader()
         download_url = uploader.get_download_url(document.image)
         if download_url and download_url != "#":
             return download_url
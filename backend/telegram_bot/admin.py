@@ -0,0 +1,39 @@
+from django.contrib import admin
+from unfold.admin import ModelAdmin
+
+from .models import Notification
+
+
+@admin.register(Notification)
+class NotificationAdmin(ModelAdmin):
+    """Очередь уведомлений."""
+
+    list_display = (
+        "id",
+        "chat_id",
+        "status",
+        "attempts",
+        "created_at",
+        "sent_at",
+    )
+    list_filter = ("status",)
+    readonly_fields = (
+        "chat_id",
+        "text",
+        "survey",
+        "attempts",
+        "error",
+        "created_at",
+        "send_after",
+        "sent_at",
+    )
+
+    def has_module_permission(self, request):
+        """Показывать раздел только персоналу"""
+        return request.user.is_staff or request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return self.has_module_permission(request)
+
+    def has_add_permission(self, request):
+        return False
@@ -1,59 +1,64 @@
+import asyncio
 import logging
 
 from django.conf import settings
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from telegram.request import BaseRequest
 
+from common.utils.images import shutdown_image_executor
 from questionnaire.constant import TelegramCommand
 from .admin_handlers import log_command
-from .menu_handlers import help_command
-from .survey_handlers import (
-    start_command,
-    status_command,
-    load_document_command,
-    processing_command,
-    handle_message,
-)
+from .db_executor import shutdown_db_executor
+from .notifications import NotificationSender
+from .rate_limiter import create_rate_limiter
+from .router import route_text
+from .survey_handlers import load_document_command
+from .update_processor import create_update_processor
 
 logger = logging.getLogger(__name__)
 
 
 class TelegramBot:
 
-    def __init__(self):
-        self.token = settings.TELEGRAM_BOT_TOKEN
-        self.application = Application.builder().token(self.token).build()
+    def __init__(
+        self,
+        token: str | None = None,
+        request: BaseRequest | None = None,
+        rate_limit: bool = True,
+    ):
+        """
+        Создание приложения бота
+
+        Args:
+            token: токен бота (по умолчанию из настроек)
+            request: транспорт Bot API (по умолчанию HTTP к api.telegram.org)
+            rate_limit: ограничивать исходящие запросы по настройкам
+        """
+        self.token = token or settings.TELEGRAM_BOT_TOKEN
+        self._notifications_task: asyncio.Task | None = None
+        builder = (
+            Application.builder()
+            .token(self.token)
+            .post_init(self._post_init)
+            .post_stop(self._post_stop)
+            .post_shutdown(self._post_shutdown)
+            .concurrent_updates(create_update_processor())
+        )
+        if request is not None:
+            builder = builder.request(request)
+        if rate_limit and (rate_limiter := create_rate_limiter()):
+            builder = builder.rate_limiter(rate_limiter)
+        self.application = builder.build()
         self.setup_handlers()
 
     def setup_handlers(self):
-        self.application.add_handler(
-            MessageHandler(
-                filters.Text(
-                    TelegramCommand.START.get_all_select_command(),
-                ),
-                start_command,
-            ),
-        )
-        self.application.add_handler(
-            MessageHandler(
-                filters.Text(TelegramCommand.STATUS.get_all_select_command()),
-                status_command,
-            )
-        )
-        self.application.add_handler(
-            MessageHandler(
-                filters.Text(TelegramCommand.HELP.get_all_select_command()),
-                help_command,
-            )
-        )
-        self.application.add_handler(
-            MessageHandler(
-                filters.Text(
-                    TelegramCommand.PROCESSING.get_all_select_command()
-                ),
-                processing_command,
-            )
-        )
+        """
+        Регистрация обработчиков.
+
+        Все текстовые сообщения (команды, кнопки меню и ответы)
+        разбирает один обработчик по таблице маршрутов
+        """
         self.application.add_handler(
             CommandHandler(
                 TelegramCommand.LOG.value,
@@ -66,11 +71,46 @@ class TelegramBot:
                 load_document_command,
             )
         )
-
         self.application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message)
+            MessageHandler(filters.TEXT, route_text)
         )
 
+    async def _post_init(self, application: Application) -> None:
+        """
+        Запуск отправки уведомлений из очереди вместе с ботом
+
+        Args:
+            application: приложение бота
+        """
+        if settings.TELEGRAM_NOTIFICATIONS_INTERVAL > 0:
+            self._notifications_task = asyncio.create_task(
+                NotificationSender(application.bot).run(
+                    settings.TELEGRAM_NOTIFICATIONS_INTERVAL
+                )
+            )
+
+    async def _post_stop(self, application: Application) -> None:
+        """
+        Остановка отправки уведомлений
+
+        Args:
+            application: приложение бота
+        """
+        if self._notifications_task is not None:
+            self._notifications_task.cancel()
+            self._notifications_task = None
+
+    @staticmethod
+    async def _post_shutdown(application: Application) -> None:
+        """
+        Освобождение ресурсов после остановки бота
+
+        Args:
+            application: приложение бота
+        """
+        shutdown_db_executor()
+        shutdown_image_executor()
+
     async def process_webhook_update(self, update_data):
         """Обработка входящего обновления через webhook"""
         try:
@@ -1,3 +1,14 @@
 from typing import Final
 
 MSG_REVERT_PREVIOUS_QUESTION: Final = "Вернуться к предыдущему вопросу"
+
+NOTIFICATION_PENDING: Final = "pending"
+NOTIFICATION_SENT: Final = "sent"
+NOTIFICATION_FAILED: Final = "failed"
+NOTIFICATION_STATUS_CHOICES: Final = (
+    (NOTIFICATION_PENDING, "Ожидает отправки"),
+    (NOTIFICATION_SENT, "Отправлено"),
+    (NOTIFICATION_FAILED, "Не доставлено"),
+)
+NOTIFICATION_STATUS_LEN: Final = 10
+MSG_STATUS_CHANGED: Final = "Статус вашей заявки изменен: {status}"
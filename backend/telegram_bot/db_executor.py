@@ -0,0 +1,117 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+# Сколько ждать, пока все потоки пула закроют соединения при остановке
+_SHUTDOWN_TIMEOUT = 10
+
+_executor: ThreadPoolExecutor | None = None
+_executor_size = 0
+_lock = threading.Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor | None:
+    """
+    Пул потоков для работы бота с БД.
+
+    Размер задается TELEGRAM_DB_POOL_SIZE и не должен превышать число
+    соединений, которое готова принять база. 0 - пул не используется,
+    все вызовы идут в один поток (thread_sensitive).
+
+    Returns:
+        ThreadPoolExecutor | None: пул или None, если пул отключен
+    """
+    global _executor, _executor_size
+    if settings.TELEGRAM_DB_POOL_SIZE <= 0:
+        return None
+    with _lock:
+        if _executor is None:
+            _executor_size = settings.TELEGRAM_DB_POOL_SIZE
+            _executor = ThreadPoolExecutor(
+                max_workers=_executor_size,
+                thread_name_prefix="telegram-db",
+            )
+            logger.debug("Создан пул потоков БД на %s", _executor_size)
+        return _executor
+
+
+def _close_thread_connections(barrier: threading.Barrier) -> None:
+    """
+    Закрыть соединения потока пула.
+    Барьер гарантирует, что задачу получит каждый поток.
+
+    Args:
+        barrier: барьер на все потоки пула
+    """
+    try:
+        barrier.wait()
+    except threading.BrokenBarrierError:
+        logger.warning("Не все потоки пула БД закрыли соединения")
+    connections.close_all()
+
+
+def shutdown_db_executor() -> None:
+    """Остановить пул потоков БД и закрыть его соединения"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is None:
+        return
+    barrier = threading.Barrier(_executor_size, timeout=_SHUTDOWN_TIMEOUT)
+    for _ in range(_executor_size):
+        executor.submit(_close_thread_connections, barrier)
+    executor.shutdown(wait=True)
+    logger.debug("Пул потоков БД остановлен")
+
+
+def _run_with_connection(func, *args, **kwargs):
+    """
+    Выполнить функцию в потоке пула.
+
+    Соединение потока переиспользуется между задачами:
+    close_old_connections закрывает его только по CONN_MAX_AGE
+    или после ошибки и включает проверку CONN_HEALTH_CHECKS
+    перед следующим запросом.
+    """
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def db_sync_to_async(func):
+    """
+    Аналог sync_to_async для работы бота с БД.
+
+    При включенном пуле вызовы разных пользователей выполняются
+    параллельно в потоках пула, иначе - в одном потоке,
+    как у sync_to_async по умолчанию.
+
+    Args:
+        func: синхронная функция
+
+    Returns:
+        Callable: асинхронная функция
+    """
+    thread_sensitive_func = sync_to_async(func)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        executor = get_db_executor()
+        if executor is None:
+            return await thread_sensitive_func(*args, **kwargs)
+        return await sync_to_async(
+            _run_with_connection,
+            thread_sensitive=False,
+            executor=executor,
+        )(func, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import logging
+import time
+from collections import Counter
+from itertools import count
+
+from telegram.request import BaseRequest, RequestData
+
+logger = logging.getLogger(__name__)
+
+FAKE_BOT_ID = 1000000
+FAKE_BOT_USERNAME = "fake_bench_bot"
+FAKE_BOT_TOKEN = f"{FAKE_BOT_ID}:fake-bench-token"
+
+# Фрагменты текста ответов бота, которые считаются ошибкой прохождения
+ERROR_REPLY_MARKERS = ("Произошла ошибка", "Некорректный ответ")
+_MESSAGE_METHODS = (
+    "sendMessage",
+    "sendPhoto",
+    "sendDocument",
+    "editMessageText",
+)
+
+
+class FakeTelegramRequest(BaseRequest):
+    """
+    Локальная подмена Bot API для нагрузочных прогонов.
+
+    Отвечает на запросы бота без сети, имитирует задержку API
+    и считает вызовы по методам и ответы бота с ошибкой.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency: имитация сетевой задержки одного вызова в секундах
+        """
+        self.latency = latency
+        self.calls = Counter()
+        self.error_replies = 0
+        self._message_ids = count(1)
+
+    @property
+    def read_timeout(self) -> float | None:
+        return None
+
+    async def initialize(self) -> None:
+        """Ресурсы не требуются"""
+
+    async def shutdown(self) -> None:
+        """Ресурсы не требуются"""
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: RequestData | None = None,
+        read_timeout=None,
+        write_timeout=None,
+        connect_timeout=None,
+        pool_timeout=None,
+    ) -> tuple[int, bytes]:
+        """
+        Ответ на вызов Bot API
+
+        Args:
+            url: адрес метода Bot API
+            method: HTTP метод
+            request_data: параметры вызова
+
+        Returns:
+            int: HTTP статус
+            bytes: тело ответа
+        """
+        api_method = url.rsplit("/", 1)[-1]
+        self.calls[api_method] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        parameters = request_data.parameters if request_data else {}
+        text = str(parameters.get("text", ""))
+        if any(marker in text for marker in ERROR_REPLY_MARKERS):
+            self.error_replies += 1
+        body = {"ok": True, "result": self._result(api_method, parameters)}
+        return 200, json.dumps(body).encode("utf-8")
+
+    def _message(self, parameters: dict) -> dict:
+        """
+        Сообщение, которое вернул бы Bot API
+
+        Args:
+            parameters: параметры вызова
+
+        Returns:
+            dict: сообщение
+        """
+        return {
+            "message_id": next(self._message_ids),
+            "date": int(time.time()),
+            "chat": {"id": parameters.get("chat_id", 0), "type": "private"},
+            "text": parameters.get("text", ""),
+        }
+
+    def _result(self, api_method: str, parameters: dict):
+        """
+        Результат вызова метода
+
+        Args:
+            api_method: имя метода Bot API
+            parameters: параметры вызова
+
+        Returns:
+            Any: поле result ответа Bot API
+        """
+        if api_method == "getMe":
+            return {
+                "id": FAKE_BOT_ID,
+                "is_bot": True,
+                "first_name": "Fake bench bot",
+                "username": FAKE_BOT_USERNAME,
+            }
+        if api_method in _MESSAGE_METHODS:
+            return self._message(parameters)
+        if api_method == "sendMediaGroup":
+            return [
+                self._message(parameters) for _ in parameters.get("media", ())
+            ]
+        return True
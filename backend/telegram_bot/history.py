@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from collections.abc import MutableMapping
+
+from telegram import Bot
+from telegram.error import TelegramError
+
+logger = logging.getLogger(__name__)
+
+# Ключ chat_data с сообщениями опроса, сгруппированными по вопросам
+SURVEY_STEPS_KEY = "survey_steps"
+# Сколько последних вопросов помнить в чате
+_MAX_STEPS = 50
+# Одновременных deleteMessage, если пакетное удаление не удалось
+_DELETE_CONCURRENCY = 3
+
+
+def reset_steps(chat_data: MutableMapping) -> None:
+    """
+    Забыть сообщения опроса в чате
+
+    Args:
+        chat_data: данные чата
+    """
+    chat_data[SURVEY_STEPS_KEY] = []
+
+
+def start_step(chat_data: MutableMapping, *message_ids: int) -> None:
+    """
+    Начать шаг опроса: сообщение бота с новым вопросом
+
+    Args:
+        chat_data: данные чата
+        *message_ids: идентификаторы сообщений
+    """
+    steps = chat_data.setdefault(SURVEY_STEPS_KEY, [])
+    steps.append(list(message_ids))
+    del steps[:-_MAX_STEPS]
+
+
+def add_to_step(chat_data: MutableMapping, *message_ids: int) -> None:
+    """
+    Добавить сообщения к текущему шагу опроса (ответы пользователя,
+    сообщения об ошибке)
+
+    Args:
+        chat_data: данные чата
+        *message_ids: идентификаторы сообщений
+    """
+    steps = chat_data.setdefault(SURVEY_STEPS_KEY, [])
+    if steps:
+        steps[-1].extend(message_ids)
+    else:
+        steps.append(list(message_ids))
+
+
+def pop_steps(chat_data: MutableMapping, count: int) -> list[int]:
+    """
+    Убрать последние шаги опроса
+
+    Args:
+        chat_data: данные чата
+        count: количество шагов
+
+    Returns:
+        list[int]: идентификаторы сообщений убранных шагов
+    """
+    steps = chat_data.get(SURVEY_STEPS_KEY, [])
+    popped = steps[-count:]
+    del steps[-count:]
+    return [message_id for step in popped for message_id in step]
+
+
+async def _delete_message(
+    bot: Bot,
+    chat_id: int,
+    message_id: int,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """
+    Удалить одно сообщение
+
+    Args:
+        bot: бот
+        chat_id: идентификатор чата
+        message_id: идентификатор сообщения
+        semaphore: ограничение одновременных запросов
+    """
+    async with semaphore:
+        try:
+            await bot.delete_message(chat_id=chat_id, message_id=message_id)
+        except TelegramError as e:
+            logger.debug(f"Не удалось удалить сообщение {message_id}: {e}")
+
+
+async def delete_messages(
+    bot: Bot,
+    chat_id: int,
+    message_ids: list[int],
+) -> None:
+    """
+    Удалить сообщения одним вызовом deleteMessages.
+    Если вызов не удался, сообщения удаляются по одному параллельно.
+
+    Args:
+        bot: бот
+        chat_id: идентификатор чата
+        message_ids: идентификаторы сообщений
+    """
+    if not message_ids:
+        return
+    try:
+        await bot.delete_messages(chat_id=chat_id, message_ids=message_ids)
+        logger.debug(f"Удалены сообщения {message_ids}")
+        return
+    except TelegramError as e:
+        logger.debug(f"Не удалось удалить сообщения {message_ids}: {e}")
+
+    semaphore = asyncio.Semaphore(_DELETE_CONCURRENCY)
+    await asyncio.gather(
+        *(
+            _delete_message(bot, chat_id, message_id, semaphore)
+            for message_id in message_ids
+        )
+    )
@@ -0,0 +1,74 @@
+import logging
+
+from telegram import KeyboardButton, ReplyKeyboardMarkup
+
+from questionnaire.cache import RevisionMemo
+from .constant import MSG_REVERT_PREVIOUS_QUESTION
+
+logger = logging.getLogger(__name__)
+
+# Кнопок ответа в одном ряду клавиатуры
+_ROWS = 4
+# Клавиатура без вариантов ответа
+EMPTY_KEYBOARD = ReplyKeyboardMarkup(
+    [],
+    resize_keyboard=True,
+    one_time_keyboard=True,
+)
+
+_question_keyboards = RevisionMemo()
+
+
+def _build_answers_keyboard(answers: list[str]) -> ReplyKeyboardMarkup:
+    """
+    Клавиатура с вариантами ответа
+
+    Args:
+        answers: список ответов
+
+    Returns:
+        ReplyKeyboardMarkup: клавиатура с возможными ответами
+    """
+    keyboard = []
+    for i, answer in enumerate(answer for answer in answers if answer):
+        index = i % _ROWS
+        try:
+            keyboard[index].append(KeyboardButton(answer))
+        except IndexError:
+            keyboard.append([KeyboardButton(answer)])
+
+    return ReplyKeyboardMarkup(
+        keyboard,
+        resize_keyboard=True,
+        one_time_keyboard=True,
+    )
+
+
+def get_question_keyboard(
+    question_id: int | None,
+    answers: list[str | None],
+    show_revert: bool = False,
+) -> ReplyKeyboardMarkup:
+    """
+    Клавиатура вопроса, построенная один раз на ревизию опросника.
+
+    Args:
+        question_id: идентификатор вопроса
+        answers: варианты ответа (для построения при первом обращении)
+        show_revert: добавить кнопку возврата к предыдущему вопросу
+
+    Returns:
+        ReplyKeyboardMarkup: клавиатура с возможными ответами
+    """
+    if question_id is None or not (answers or show_revert):
+        return EMPTY_KEYBOARD
+
+    def build() -> ReplyKeyboardMarkup:
+        logger.debug("Построена клавиатура вопроса %s", question_id)
+        if show_revert:
+            return _build_answers_keyboard(
+                [*answers, MSG_REVERT_PREVIOUS_QUESTION]
+            )
+        return _build_answers_keyboard(answers)
+
+    return _question_keyboards.get_or_build((question_id, show_revert), build)
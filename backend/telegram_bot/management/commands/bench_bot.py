@@ -0,0 +1,334 @@
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from itertools import count
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from telegram import Update
+from telegram.ext import Application
+
+from api.management.commands.add_survey_data import Command as AddSurveyData
+from common.utils.benchmark import (
+    QueryCounter,
+    latency_summary,
+    temporary_database,
+    walk_survey,
+)
+from questionnaire.constant import TelegramCommand
+from questionnaire.models import Question
+from telegram_bot.bot import TelegramBot
+from telegram_bot.db_executor import shutdown_db_executor
+from telegram_bot.fake_api import FAKE_BOT_TOKEN, FakeTelegramRequest
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_STEPS_PATH = (
+    Path(settings.BASE_DIR) / "static_db_data" / "questions" / "steps.json"
+)
+# Идентификаторы виртуальных пользователей Telegram
+_FIRST_TELEGRAM_ID = 900000000
+
+
+class VirtualUser:
+    """Виртуальный пользователь, проходящий опросник из steps.json"""
+
+    def __init__(self, number: int, steps: list[dict], seed: int):
+        """
+        Args:
+            number: номер пользователя
+            steps: вопросы из steps.json
+            seed: зерно выбора ответов
+        """
+        self.number = number
+        self.steps = steps
+        self.random = random.Random(seed + number)
+        self.telegram_user = {
+            "id": _FIRST_TELEGRAM_ID + number,
+            "is_bot": False,
+            "first_name": f"Bench{number}",
+            "username": f"bench_vu_{number}",
+        }
+
+    def script(self):
+        """
+        Сообщения одного прохождения опроса
+
+        Yields:
+            str: вид сообщения для статистики
+            str: текст сообщения
+        """
+        yield "start", TelegramCommand.START.get_call_name()
+        for answer in walk_survey(
+            self.steps,
+            self.random,
+            self.number,
+            skip_telegram_username=True,
+        ):
+            yield "answer", answer
+        yield "processing", TelegramCommand.PROCESSING.get_call_name()
+        yield "status", TelegramCommand.STATUS.get_call_name()
+
+    def update(self, update_id: int, text: str, bot) -> Update:
+        """
+        Входящее обновление с сообщением пользователя
+
+        Args:
+            update_id: номер обновления
+            text: текст сообщения
+            bot: бот приложения
+
+        Returns:
+            Update: обновление
+        """
+        message = {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": self.telegram_user["id"], "type": "private"},
+            "from": self.telegram_user,
+            "text": text,
+        }
+        if text.startswith("/"):
+            message["entities"] = [
+                {"type": "bot_command", "offset": 0, "length": len(text)}
+            ]
+        return Update.de_json(
+            {"update_id": update_id, "message": message},
+            bot,
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Нагрузочный прогон Telegram бота: виртуальные пользователи "
+        "проходят опросник через обработчик обновлений бота с локальной "
+        "подменой Bot API"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=20,
+            help="Количество одновременных виртуальных пользователей",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=1,
+            help="Сколько раз каждый пользователь проходит опрос",
+        )
+        parser.add_argument(
+            "--api-latency",
+            type=float,
+            default=0.0,
+            help="Имитация задержки одного вызова Bot API в секундах",
+        )
+        parser.add_argument(
+            "--rate-limit",
+            action="store_true",
+            help="Ограничивать вызовы Bot API как в рабочем боте",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Зерно выбора ответов",
+        )
+        parser.add_argument(
+            "--file",
+            type=str,
+            default=str(_DEFAULT_STEPS_PATH),
+            help="Путь к JSON файлу опросника",
+        )
+        parser.add_argument(
+            "--current-db",
+            action="store_true",
+            help=(
+                "Работать в настроенной базе вместо временной тестовой "
+                "(опросник в базе должен совпадать с --file)"
+            ),
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Вывести отчет в формате JSON",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Запуск прогона
+
+        Args:
+            *args: аргументы
+            **options: именные аргументы
+        """
+        with open(options["file"], "r", encoding="utf-8") as file:
+            steps = json.load(file)["questions"]
+
+        with (
+            nullcontext()
+            if options["current_db"]
+            else temporary_database()
+        ):
+            if not Question.objects.filter(type="start").exists():
+                logger.debug("Загрузка опросника %s", options["file"])
+                AddSurveyData.load_data_from_json(options["file"])
+            report = asyncio.run(
+                self._run(
+                    steps,
+                    options["users"],
+                    options["rounds"],
+                    options["api_latency"],
+                    options["rate_limit"],
+                    options["seed"],
+                )
+            )
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=4))
+        else:
+            self._write_report(report)
+
+    @staticmethod
+    async def _run(
+        steps: list[dict],
+        users: int,
+        rounds: int,
+        api_latency: float,
+        rate_limit: bool,
+        seed: int,
+    ) -> dict:
+        """
+        Прогон виртуальных пользователей
+
+        Args:
+            steps: вопросы из steps.json
+            users: количество пользователей
+            rounds: количество прохождений на пользователя
+            api_latency: задержка Bot API
+            rate_limit: ограничивать вызовы Bot API
+            seed: зерно выбора ответов
+
+        Returns:
+            dict: отчет
+        """
+        fake_api = FakeTelegramRequest(latency=api_latency)
+        application: Application = TelegramBot(
+            token=FAKE_BOT_TOKEN,
+            request=fake_api,
+            rate_limit=rate_limit,
+        ).application
+        latencies = defaultdict(list)
+        update_ids = count(1)
+
+        async def run_user(virtual_user: VirtualUser) -> None:
+            for _ in range(rounds):
+                for kind, text in virtual_user.script():
+                    update = virtual_user.update(
+                        next(update_ids),
+                        text,
+                        application.bot,
+                    )
+                    started = time.perf_counter()
+                    # Тот же путь, что у run_polling: через обработчик
+                    # обновлений с его лимитом параллельности
+                    await application.update_processor.process_update(
+                        update,
+                        application.process_update(update),
+                    )
+                    latencies[kind].append(time.perf_counter() - started)
+
+        query_counter = QueryCounter()
+        await application.initialize()
+        try:
+            with query_counter.capture():
+                started = time.perf_counter()
+                await asyncio.gather(
+                    *(
+                        run_user(VirtualUser(number, steps, seed))
+                        for number in range(users)
+                    )
+                )
+                duration = time.perf_counter() - started
+        finally:
+            await application.shutdown()
+            shutdown_db_executor()
+            await sync_to_async(connections.close_all)()
+
+        all_latencies = [
+            latency for values in latencies.values() for latency in values
+        ]
+        return {
+            "users": users,
+            "rounds": rounds,
+            "updates": len(all_latencies),
+            "duration_s": round(duration, 3),
+            "throughput_ups": round(len(all_latencies) / duration, 2),
+            "latency": {
+                "all": latency_summary(all_latencies),
+                **{
+                    kind: latency_summary(values)
+                    for kind, values in sorted(latencies.items())
+                },
+            },
+            "queries": {
+                "total": query_counter.total,
+                "per_update": round(
+                    query_counter.total / max(len(all_latencies), 1), 2
+                ),
+            },
+            "error_replies": fake_api.error_replies,
+            "api_calls": dict(sorted(fake_api.calls.items())),
+        }
+
+    def _write_report(self, report: dict) -> None:
+        """
+        Вывод отчета в консоль
+
+        Args:
+            report: отчет
+        """
+        self.stdout.write(
+            f"Пользователей: {report['users']}, "
+            f"прохождений: {report['rounds']}, "
+            f"обновлений: {report['updates']}"
+        )
+        self.stdout.write(
+            f"Время: {report['duration_s']} с, "
+            f"пропускная способность: {report['throughput_ups']} обн/с"
+        )
+        self.stdout.write(
+            f"{'Вид':<12}{'кол-во':>8}{'p50 мс':>10}"
+            f"{'p95 мс':>10}{'p99 мс':>10}{'max мс':>10}"
+        )
+        for kind, summary in report["latency"].items():
+            self.stdout.write(
+                f"{kind:<12}{summary['count']:>8}{summary['p50_ms']:>10}"
+                f"{summary['p95_ms']:>10}{summary['p99_ms']:>10}"
+                f"{summary['max_ms']:>10}"
+            )
+        self.stdout.write(
+            f"Запросов к БД: {report['queries']['total']} "
+            f"({report['queries']['per_update']} на обновление)"
+        )
+        self.stdout.write(
+            "Вызовы Bot API: "
+            + ", ".join(
+                f"{method}={calls}"
+                for method, calls in report["api_calls"].items()
+            )
+        )
+        if report["error_replies"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Ответов с ошибкой: {report['error_replies']}"
+                )
+            )
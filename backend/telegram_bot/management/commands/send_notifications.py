@@ -0,0 +1,65 @@
+import asyncio
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from telegram.ext import ExtBot
+
+from telegram_bot.db_executor import shutdown_db_executor
+from telegram_bot.notifications import NotificationSender
+from telegram_bot.rate_limiter import create_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Отправляет уведомления пользователям из очереди"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Не завершаться, проверять очередь с паузой --interval",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Пауза между проверками очереди в секундах",
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Запуск отправки
+
+        Args:
+            *args: аргументы
+            **options: именные аргументы
+        """
+        sent = asyncio.run(self._run(options["loop"], options["interval"]))
+        self.stdout.write(f"Отправлено уведомлений: {sent}")
+
+    @staticmethod
+    async def _run(loop: bool, interval: float) -> int:
+        """
+        Отправка уведомлений одним ботом
+
+        Args:
+            loop: работать до остановки
+            interval: пауза между проверками очереди
+
+        Returns:
+            int: количество отправленных уведомлений
+        """
+        bot = ExtBot(
+            settings.TELEGRAM_BOT_TOKEN,
+            rate_limiter=create_rate_limiter(),
+        )
+        try:
+            async with bot:
+                sender = NotificationSender(bot)
+                if loop:
+                    await sender.run(interval)
+                return await sender.send_pending()
+        finally:
+            shutdown_db_executor()
@@ -1,21 +1,22 @@
 import logging
+from functools import cache
 
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton
 from telegram.ext import ContextTypes
 
 from questionnaire.constant import SurveyStatus, TelegramCommand
-from .sync_to_async import (
-    get_or_create_user,
-    get_or_create_survey,
-)
+from .services import load_survey_state
+from .user_state import remember_status
 
 
 logger = logging.getLogger(__name__)
 
 
+@cache
 def _get_default_help_keyboard(status: SurveyStatus) -> ReplyKeyboardMarkup:
     """
-    Клавиатура по умолчанию с кнопкой помощи
+    Клавиатура по умолчанию с кнопкой помощи.
+    Строится один раз на статус.
 
     Args:
         status: статус ответа
@@ -65,10 +66,9 @@ async def help_command(
         status: статус ответа
     """
     if status is None:
-        user = update.effective_user
-        user_obj = await get_or_create_user(user)
-        _, __, result, survey = await get_or_create_survey(user_obj, False)
-        status = survey.status
+        state = await load_survey_state(update.effective_user)
+        status = state.survey.status
+        remember_status(context.user_data, status)
 
     status_enum = SurveyStatus.from_value(status)
 
@@ -97,9 +97,10 @@ async def help_command(
     )
 
 
+@cache
 def _load_documents_keyboard() -> ReplyKeyboardMarkup:
     """
-    Клавиатура загрузки документов
+    Клавиатура загрузки документов (строится один раз)
 
     Returns:
         ReplyKeyboardMarkup: клавиатура с кнопкой помощи
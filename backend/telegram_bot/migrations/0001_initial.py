@@ -0,0 +1,100 @@
+# Generated by Django 5.2.6 on 2026-10-19 12:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("questionnaire", "0011_alter_answerchoice_new_status_alter_survey_status"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Notification",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "chat_id",
+                    models.BigIntegerField(verbose_name="Идентификатор чата Telegram"),
+                ),
+                ("text", models.TextField(verbose_name="Текст")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Ожидает отправки"),
+                            ("sent", "Отправлено"),
+                            ("failed", "Не доставлено"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="Статус отправки",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Попыток отправки"
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(blank=True, verbose_name="Последняя ошибка"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Дата создания"
+                    ),
+                ),
+                (
+                    "send_after",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="Отправить не раньше",
+                    ),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Дата отправки"
+                    ),
+                ),
+                (
+                    "survey",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="notifications",
+                        to="questionnaire.survey",
+                        verbose_name="Опрос",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "уведомление",
+                "verbose_name_plural": "Уведомления",
+                "ordering": ("created_at",),
+                "indexes": [
+                    models.Index(
+                        fields=["status", "send_after"],
+                        name="telegram_bo_status_426e34_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+from django.db.models import (
+    SET_NULL,
+    BigIntegerField,
+    CharField,
+    DateTimeField,
+    ForeignKey,
+    Index,
+    Model,
+    PositiveSmallIntegerField,
+    TextField,
+)
+from django.utils import timezone
+
+from questionnaire.models import Survey
+from .constant import (
+    NOTIFICATION_PENDING,
+    NOTIFICATION_STATUS_CHOICES,
+    NOTIFICATION_STATUS_LEN,
+)
+
+
+class Notification(Model):
+    """Уведомление пользователю в Telegram (очередь отправки)"""
+
+    chat_id = BigIntegerField(
+        verbose_name="Идентификатор чата Telegram",
+    )
+    text = TextField(
+        verbose_name="Текст",
+    )
+    survey = ForeignKey(
+        Survey,
+        on_delete=SET_NULL,
+        related_name="notifications",
+        verbose_name="Опрос",
+        null=True,
+        blank=True,
+    )
+    status = CharField(
+        max_length=NOTIFICATION_STATUS_LEN,
+        choices=NOTIFICATION_STATUS_CHOICES,
+        default=NOTIFICATION_PENDING,
+        verbose_name="Статус отправки",
+    )
+    attempts = PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Попыток отправки",
+    )
+    error = TextField(
+        blank=True,
+        verbose_name="Последняя ошибка",
+    )
+    created_at = DateTimeField(
+        auto_now_add=True,
+        verbose_name="Дата создания",
+    )
+    send_after = DateTimeField(
+        default=timezone.now,
+        verbose_name="Отправить не раньше",
+    )
+    sent_at = DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Дата отправки",
+    )
+
+    class Meta:
+        verbose_name = "уведомление"
+        verbose_name_plural = "Уведомления"
+        ordering = ("created_at",)
+        indexes = (Index(fields=["status", "send_after"]),)
+
+    def __str__(self) -> str:
+        return f"Уведомление в чат {self.chat_id} ({self.status})"
@@ -0,0 +1,223 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from telegram import Bot
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
+from telegram.ext import ExtBot
+
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import Survey
+from .constant import (
+    MSG_STATUS_CHANGED,
+    NOTIFICATION_FAILED,
+    NOTIFICATION_PENDING,
+    NOTIFICATION_SENT,
+)
+from .db_executor import db_sync_to_async
+from .models import Notification
+from .rate_limiter import PRIORITY_BULK, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+# Размер пачки при записи и отправке уведомлений
+BATCH_SIZE = 500
+# Попыток отправки до отметки "Не доставлено"
+MAX_ATTEMPTS = 5
+# На сколько уведомление закрепляется за отправителем
+_LEASE = timedelta(minutes=1)
+# Пауза перед повтором растет с каждой попыткой
+_RETRY_DELAY = timedelta(seconds=30)
+
+
+def status_text(status: str) -> str:
+    """
+    Текст уведомления о смене статуса
+
+    Args:
+        status: новый статус опроса
+
+    Returns:
+        str: текст уведомления
+    """
+    return MSG_STATUS_CHANGED.format(
+        status=SurveyStatus.from_value(status).ext_label
+    )
+
+
+def enqueue_status_notifications(
+    surveys: QuerySet[Survey],
+    status: str | None = None,
+) -> int:
+    """
+    Поставить в очередь уведомления о статусе опросов.
+    Опросы пользователей без чата с ботом пропускаются.
+
+    Args:
+        surveys: опросы
+        status: новый статус (по умолчанию текущий статус опроса)
+
+    Returns:
+        int: количество уведомлений
+    """
+    rows = (
+        surveys.prefetch_related(None)
+        .filter(user__telegram_id__isnull=False)
+        .values_list("id", "status", "user__telegram_id")
+    )
+    notifications = Notification.objects.bulk_create(
+        (
+            Notification(
+                survey_id=survey_id,
+                chat_id=chat_id,
+                text=status_text(status or survey_status),
+            )
+            for survey_id, survey_status, chat_id in rows.iterator(BATCH_SIZE)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    logger.debug("В очередь поставлено %s уведомлений", len(notifications))
+    return len(notifications)
+
+
+@db_sync_to_async
+def _claim_batch(limit: int) -> list[Notification]:
+    """
+    Забрать пачку уведомлений к отправке.
+
+    Уведомления закрепляются за отправителем на _LEASE: другой
+    отправитель их не возьмет, а после сбоя они вернутся в очередь.
+
+    Args:
+        limit: размер пачки
+
+    Returns:
+        list[Notification]: уведомления
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            Notification.objects.select_for_update(skip_locked=True)
+            .filter(status=NOTIFICATION_PENDING, send_after__lte=now)
+            .order_by("send_after")[:limit]
+        )
+        for notification in batch:
+            notification.attempts += 1
+            notification.send_after = now + _LEASE
+        Notification.objects.bulk_update(batch, ("attempts", "send_after"))
+    return batch
+
+
+@db_sync_to_async
+def _save_results(batch: list[Notification]) -> None:
+    """
+    Сохранить результаты отправки
+
+    Args:
+        batch: уведомления
+    """
+    Notification.objects.bulk_update(
+        batch,
+        ("status", "error", "send_after", "sent_at"),
+        batch_size=BATCH_SIZE,
+    )
+
+
+class NotificationSender:
+    """
+    Отправка уведомлений из очереди.
+
+    Использует один бот (и его пул HTTP соединений) на все уведомления.
+    Если у бота есть ограничитель запросов, уведомления идут с низким
+    приоритетом и не задерживают ответы пользователям.
+    """
+
+    def __init__(self, bot: Bot, batch_size: int = BATCH_SIZE):
+        """
+        Args:
+            bot: бот
+            batch_size: размер пачки уведомлений
+        """
+        self.bot = bot
+        self.batch_size = batch_size
+        rate_limited = isinstance(bot, ExtBot) and bot.rate_limiter
+        self._send_kwargs = (
+            {"rate_limit_args": PRIORITY_BULK} if rate_limited else {}
+        )
+
+    async def _send(self, notification: Notification) -> None:
+        """
+        Отправить уведомление и записать результат в объект
+
+        Args:
+            notification: уведомление
+        """
+        now = timezone.now()
+        try:
+            await self.bot.send_message(
+                chat_id=notification.chat_id,
+                text=notification.text,
+                **self._send_kwargs,
+            )
+        except (Forbidden, BadRequest) as e:
+            # Пользователь заблокировал бота или чат не существует
+            notification.status = NOTIFICATION_FAILED
+            notification.error = str(e)
+        except TelegramError as e:
+            notification.error = str(e)
+            if notification.attempts >= MAX_ATTEMPTS:
+                notification.status = NOTIFICATION_FAILED
+            elif isinstance(e, RetryAfter):
+                notification.send_after = now + timedelta(
+                    seconds=retry_after_seconds(e)
+                )
+            else:
+                notification.send_after = (
+                    now + _RETRY_DELAY * notification.attempts
+                )
+        else:
+            notification.status = NOTIFICATION_SENT
+            notification.error = ""
+            notification.sent_at = now
+
+    async def send_pending(self) -> int:
+        """
+        Отправить все уведомления, готовые к отправке
+
+        Returns:
+            int: количество отправленных уведомлений
+        """
+        sent = 0
+        while batch := await _claim_batch(self.batch_size):
+            await asyncio.gather(
+                *(self._send(notification) for notification in batch)
+            )
+            await _save_results(batch)
+            sent += sum(
+                notification.status == NOTIFICATION_SENT
+                for notification in batch
+            )
+        if sent:
+            logger.info("Отправлено %s уведомлений", sent)
+        return sent
+
+    async def run(self, interval: float) -> None:
+        """
+        Отправлять уведомления, пока задачу не отменят
+
+        Args:
+            interval: пауза между проверками очереди в секундах
+        """
+        while True:
+            try:
+                await self.send_pending()
+            except Exception as e:
+                logger.error(
+                    f"Ошибка отправки уведомлений: {e}",
+                    exc_info=True,
+                )
+            await asyncio.sleep(interval)
+
@@ -0,0 +1,278 @@
+import asyncio
+import heapq
+import logging
+import time
+from datetime import timedelta
+from itertools import count
+from typing import Any, Callable, Coroutine
+
+from django.conf import settings
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Приоритеты исходящих запросов: меньше - раньше
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+
+# Сколько сообщений подряд можно отправить в один чат без ожидания
+_CHAT_BURST = 3
+# Чаты с полными корзинами удаляются, когда их становится больше
+_MAX_IDLE_CHATS = 1000
+# Сколько раз повторять запрос после ответа 429
+_MAX_RETRIES = 5
+# Методы Bot API, отправляющие сообщения в чат
+_SEND_PREFIXES = ("send", "forward", "copy")
+_NOT_LIMITED_IN_CHAT = ("sendChatAction",)
+
+
+def retry_after_seconds(error: RetryAfter) -> float:
+    """
+    Время ожидания из ответа 429 (PTB отдает его числом секунд
+    или timedelta в зависимости от PTB_TIMEDELTA)
+
+    Args:
+        error: ошибка ограничения Bot API
+
+    Returns:
+        float: время ожидания в секундах
+    """
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class TokenBucket:
+    """Корзина токенов: не больше rate событий в секунду"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: скорость пополнения в токенах в секунду
+            capacity: максимальное количество токенов (размер всплеска)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Пополнить корзину за прошедшее время"""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+
+    def delay(self) -> float:
+        """
+        Сколько ждать до появления токена
+
+        Returns:
+            float: время ожидания в секундах
+        """
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    @property
+    def full(self) -> bool:
+        """bool: корзина полна (давно не использовалась)"""
+        self._refill()
+        return self._tokens >= self.capacity
+
+    def consume(self) -> None:
+        """Забрать токен"""
+        self._tokens -= 1
+
+    async def acquire(self) -> None:
+        """Дождаться токена и забрать его"""
+        while (delay := self.delay()) > 0:
+            await asyncio.sleep(delay)
+        self.consume()
+
+
+class TelegramRateLimiter(BaseRateLimiter[int]):
+    """
+    Ограничение исходящих запросов к Bot API.
+
+    Общая корзина ограничивает все запросы бота (около 30 в секунду),
+    корзина чата - отправку сообщений в один чат (около 1 в секунду).
+    Корзины чатов ждут только массовые уведомления
+    (rate_limit_args=PRIORITY_BULK): они отправляются в фоне. Ответы
+    пользователю не ждут корзину чата, чтобы не задерживать обработку
+    обновлений, но расходуют ее токены - уведомления в тот же чат
+    подождут. Общую корзину первыми получают интерактивные ответы,
+    затем уведомления. После ответа 429 все запросы ждут retry_after,
+    затем запрос повторяется.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = 30,
+        chat_rate: float = 1,
+        max_retries: int = _MAX_RETRIES,
+    ):
+        """
+        Args:
+            global_rate: запросов в секунду на всего бота
+            chat_rate: сообщений в секунду в один чат
+            max_retries: повторов запроса после ответа 429
+        """
+        self.global_rate = global_rate
+        self.chat_rate = chat_rate
+        self.max_retries = max_retries
+        self._global = TokenBucket(global_rate, global_rate)
+        self._chats: dict[int | str, TokenBucket] = {}
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = count()
+        self._condition: asyncio.Condition | None = None
+        self._paused_until = 0.0
+
+    async def initialize(self) -> None:
+        """Условие создается в цикле событий приложения"""
+        self._condition = asyncio.Condition()
+
+    async def shutdown(self) -> None:
+        """Сброс очереди и корзин чатов"""
+        self._chats.clear()
+        self._waiters.clear()
+
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        """
+        Корзина чата. Неиспользуемые корзины периодически удаляются.
+
+        Args:
+            chat_id: идентификатор чата
+
+        Returns:
+            TokenBucket: корзина чата
+        """
+        if (bucket := self._chats.get(chat_id)) is None:
+            if len(self._chats) >= _MAX_IDLE_CHATS:
+                self._chats = {
+                    key: value
+                    for key, value in self._chats.items()
+                    if not value.full
+                }
+            bucket = TokenBucket(self.chat_rate, _CHAT_BURST)
+            self._chats[chat_id] = bucket
+        return bucket
+
+    def _delay(self) -> float:
+        """
+        Сколько ждать первому в очереди
+
+        Returns:
+            float: время ожидания в секундах
+        """
+        return max(
+            self._global.delay(),
+            self._paused_until - time.monotonic(),
+        )
+
+    async def _acquire_global(self, priority: int) -> None:
+        """
+        Дождаться токена общей корзины в порядке приоритета
+
+        Args:
+            priority: приоритет запроса
+        """
+        entry = (priority, next(self._sequence))
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            # Новый запрос может оказаться приоритетнее ждущего первым
+            self._condition.notify_all()
+            try:
+                while True:
+                    if self._waiters[0] != entry:
+                        await self._condition.wait()
+                        continue
+                    if (delay := self._delay()) <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), delay)
+                    except TimeoutError:
+                        pass
+                self._global.consume()
+                heapq.heappop(self._waiters)
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                self._condition.notify_all()
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Any]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: int | None,
+    ) -> Any:
+        """
+        Выполнить запрос с учетом ограничений
+
+        Args:
+            callback: запрос к Bot API
+            args: позиционные аргументы запроса
+            kwargs: именные аргументы запроса
+            endpoint: метод Bot API
+            data: параметры метода
+            rate_limit_args: приоритет (по умолчанию интерактивный)
+
+        Returns:
+            Any: результат запроса
+        """
+        priority = rate_limit_args
+        if priority is None:
+            priority = PRIORITY_INTERACTIVE
+        chat_id = data.get("chat_id")
+        if (
+            chat_id is not None
+            and endpoint.startswith(_SEND_PREFIXES)
+            and endpoint not in _NOT_LIMITED_IN_CHAT
+        ):
+            bucket = self._chat_bucket(chat_id)
+            if priority == PRIORITY_INTERACTIVE:
+                bucket.consume()
+            else:
+                await bucket.acquire()
+
+        for attempt in range(self.max_retries + 1):
+            await self._acquire_global(priority)
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as e:
+                if attempt == self.max_retries:
+                    raise
+                retry_after = retry_after_seconds(e)
+                logger.warning(
+                    "Ограничение Bot API на %s, повтор %s через %s с",
+                    endpoint,
+                    attempt + 1,
+                    retry_after,
+                )
+                self._paused_until = max(
+                    self._paused_until,
+                    time.monotonic() + retry_after,
+                )
+
+
+def create_rate_limiter() -> TelegramRateLimiter | None:
+    """
+    Ограничитель запросов по настройкам
+
+    Returns:
+        TelegramRateLimiter | None: ограничитель или None, если отключен
+    """
+    if settings.TELEGRAM_RATE_LIMIT_GLOBAL <= 0:
+        return None
+    return TelegramRateLimiter(
+        global_rate=settings.TELEGRAM_RATE_LIMIT_GLOBAL,
+        chat_rate=settings.TELEGRAM_RATE_LIMIT_CHAT,
+    )
@@ -0,0 +1,155 @@
+import logging
+
+from telegram import InputMediaDocument, InputMediaPhoto, Message
+from telegram.constants import MediaGroupLimit, MessageLimit
+
+from questionnaire.models import Document
+
+logger = logging.getLogger(__name__)
+
+RESULT_HEADER = "Результаты опроса:"
+EMPTY_RESULT = "Опрос не пройден"
+DOCUMENTS_HEADER = "📎 Прикрепленные документы:"
+_BLOCK_SEPARATOR = "\n\n"
+_PDF_EXTENSION = ".pdf"
+
+
+def format_result(result: list[str]) -> list[str]:
+    """
+    Блоки текста истории опроса: вопросы и ответы по очереди
+
+    Args:
+        result: вопросы и ответы опроса
+
+    Returns:
+        list[str]: блоки текста
+    """
+    return [
+        f"✅ Ответ:\n    {text}" if i % 2 else f"❓ Вопрос:\n    {text}"
+        for i, text in enumerate(result)
+    ]
+
+
+def pack_messages(
+    blocks: list[str],
+    limit: int = MessageLimit.MAX_TEXT_LENGTH,
+    separator: str = _BLOCK_SEPARATOR,
+) -> list[str]:
+    """
+    Упаковать блоки текста в минимум сообщений не длиннее limit.
+    Блок длиннее limit режется на части.
+
+    Args:
+        blocks: блоки текста
+        limit: максимальная длина сообщения
+        separator: разделитель блоков внутри сообщения
+
+    Returns:
+        list[str]: тексты сообщений
+    """
+    messages = []
+    current = ""
+    for block in blocks:
+        parts = [block[i : i + limit] for i in range(0, len(block), limit)]
+        for part in parts or [""]:
+            if not current:
+                current = part
+            elif len(current) + len(separator) + len(part) <= limit:
+                current += separator + part
+            else:
+                messages.append(current)
+                current = part
+    if current:
+        messages.append(current)
+    return messages
+
+
+def _is_pdf(document: Document) -> bool:
+    """
+    Является ли документ PDF файлом
+
+    Args:
+        document: документ
+
+    Returns:
+        bool: PDF файл
+    """
+    return document.image.lower().endswith(_PDF_EXTENSION)
+
+
+def build_media_groups(
+    documents: list[Document],
+) -> list[list[InputMediaPhoto | InputMediaDocument]]:
+    """
+    Альбомы документов не больше 10 файлов.
+    Фото и PDF не смешиваются: Telegram не допускает таких альбомов.
+
+    Args:
+        documents: документы опроса
+
+    Returns:
+        list[list[InputMediaPhoto | InputMediaDocument]]: альбомы
+    """
+    photos, pdfs = [], []
+    for document in documents:
+        if not document.image:
+            continue
+        if _is_pdf(document):
+            pdfs.append(InputMediaDocument(media=document.image))
+        else:
+            photos.append(InputMediaPhoto(media=document.image))
+    size = MediaGroupLimit.MAX_MEDIA_LENGTH
+    return [
+        media[i : i + size]
+        for media in (photos, pdfs)
+        for i in range(0, len(media), size)
+    ]
+
+
+async def _reply_media_group(
+    message: Message,
+    group: list[InputMediaPhoto | InputMediaDocument],
+) -> None:
+    """
+    Отправить альбом (одиночный файл - обычным сообщением)
+
+    Args:
+        message: сообщение, на которое отвечаем
+        group: альбом
+    """
+    if len(group) >= MediaGroupLimit.MIN_MEDIA_LENGTH:
+        await message.reply_media_group(media=group)
+    elif isinstance(group[0], InputMediaDocument):
+        await message.reply_document(document=group[0].media)
+    else:
+        await message.reply_photo(photo=group[0].media)
+
+
+async def reply_survey_status(
+    message: Message,
+    result: list[str],
+    documents: list[Document],
+) -> None:
+    """
+    Ответ историей опроса и документами за минимум вызовов Bot API
+
+    Args:
+        message: сообщение, на которое отвечаем
+        result: вопросы и ответы опроса
+        documents: документы опроса
+    """
+    blocks = (
+        [RESULT_HEADER, *format_result(result)] if result else [EMPTY_RESULT]
+    )
+    media_groups = build_media_groups(documents)
+    if media_groups:
+        blocks.append(DOCUMENTS_HEADER)
+
+    for text in pack_messages(blocks):
+        await message.reply_text(text)
+
+    for group in media_groups:
+        try:
+            await _reply_media_group(message, group)
+        except Exception as e:
+            logger.error(f"Не удалось отправить документы: {e}")
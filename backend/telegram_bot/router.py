@@ -0,0 +1,104 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from questionnaire.constant import SurveyStatus, TelegramCommand
+from .menu_handlers import help_command, load_command
+from .survey_handlers import (
+    handle_message,
+    processing_command,
+    start_command,
+    status_command,
+)
+from .user_state import get_status
+
+logger = logging.getLogger(__name__)
+
+TextHandler = Callable[
+    [Update, ContextTypes.DEFAULT_TYPE],
+    Awaitable[None],
+]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Текст сообщения для поиска в таблице маршрутов:
+    без пробелов по краям, упоминания бота в команде и регистра
+
+    Args:
+        text: текст сообщения
+
+    Returns:
+        str: нормализованный текст
+    """
+    text = text.strip()
+    if text.startswith("/"):
+        # /start@bot_name
+        text = text.split("@", 1)[0]
+    return text.casefold()
+
+
+def _build_text_routes() -> dict[str, TextHandler]:
+    """
+    Таблица маршрутов команд: текст кнопки и команда -> обработчик
+
+    Returns:
+        dict[str, TextHandler]: маршруты
+    """
+    handlers = {
+        TelegramCommand.START: start_command,
+        TelegramCommand.STATUS: status_command,
+        TelegramCommand.HELP: help_command,
+        TelegramCommand.PROCESSING: processing_command,
+    }
+    return {
+        normalize_text(text): handler
+        for command, handler in handlers.items()
+        for text in command.get_all_select_command()
+    }
+
+
+TEXT_ROUTES = _build_text_routes()
+
+# Обработчик остального текста по статусу опроса.
+# Статусы без маршрута получают помощь по статусу
+STATUS_ROUTES: dict[str, TextHandler] = {
+    SurveyStatus.FILLING_SURVEY.value: handle_message,
+    SurveyStatus.COMPLETED.value: handle_message,
+    SurveyStatus.REJECTED.value: handle_message,
+    SurveyStatus.WAITING_DOCS.value: load_command,
+}
+
+
+async def route_text(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+) -> None:
+    """
+    Единая точка входа текстовых сообщений.
+
+    Команды и кнопки меню ищутся в TEXT_ROUTES, остальной текст
+    направляется по запомненному статусу опроса без запросов к БД.
+    Если статус неизвестен, сообщение обрабатывает handle_message.
+
+    Args:
+        update: обновление от Telegram
+        context: контекст
+    """
+    text = normalize_text(update.message.text)
+    if handler := TEXT_ROUTES.get(text):
+        await handler(update, context)
+        return
+    if text.startswith("/"):
+        logger.debug("Неизвестная команда: %s", text)
+        return
+
+    status = get_status(context.user_data)
+    if status is None:
+        await handle_message(update, context)
+    elif handler := STATUS_ROUTES.get(status):
+        await handler(update, context)
+    else:
+        await help_command(update, context, status=status)
@@ -0,0 +1,184 @@
+import logging
+from dataclasses import dataclass, field
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from telegram import User as TelegramUser
+
+from api.v1.serializers import SurveyCreateSerializer
+from questionnaire.cache import get_question_answers
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import Document, Question, Survey
+from .db_executor import db_sync_to_async
+
+User = get_user_model()
+
+logger = logging.getLogger(__name__)
+
+# Статусы, из которых /start начинает опрос заново
+_RESTART_STATUSES = (
+    SurveyStatus.SURVEY_COMPLETED.value,
+    SurveyStatus.COMPLETED.value,
+    SurveyStatus.REJECTED.value,
+)
+
+
+@dataclass
+class SurveyState:
+    """Пользователь и его опрос для ответа бота"""
+
+    user: User
+    survey: Survey
+    question_text: str | None
+    answers: list[str | None]
+    documents: list[Document] = field(default_factory=list)
+
+    @property
+    def result(self) -> list[str]:
+        """list[str]: вопросы и ответы опроса"""
+        return self.survey.result or []
+
+
+def _get_or_create_user(user: TelegramUser) -> User:
+    """
+    Найти или создать пользователя по идентификатору Telegram.
+
+    Пользователи, созданные до сохранения идентификатора, находятся
+    по Telegram username, и идентификатор им записывается. Первые
+    сообщения пользователя могут обрабатываться одновременно:
+    get_or_create вернет пользователя, созданного параллельно.
+
+    Args:
+        user: пользователь Telegram
+
+    Returns:
+        User: пользователь
+    """
+    if user_obj := User.objects.filter(telegram_id=user.id).first():
+        return user_obj
+
+    telegram_username = "@" + user.username if user.username else None
+    if telegram_username and (
+        user_obj := User.objects.filter(
+            telegram_id__isnull=True,
+            telegram_username=telegram_username,
+        ).first()
+    ):
+        user_obj.telegram_id = user.id
+        user_obj.save(update_fields=("telegram_id",))
+        return user_obj
+
+    user_obj, created = User.objects.get_or_create(
+        telegram_id=user.id,
+        defaults={
+            "username": user.username or f"telegram_{user.id}",
+            "telegram_username": telegram_username,
+            "first_name": user.first_name or "",
+            "last_name": user.last_name or "",
+            # TODO При первичной авторизации не задается но потом просят
+            #  задать
+            "password": "unusable_password",
+        },
+    )
+    if created:
+        logger.debug("Создан пользователь: %s", user_obj)
+    return user_obj
+
+
+def _need_restart(survey: Survey, restart_question: bool) -> bool:
+    """
+    Нужно ли начать опрос заново (как в SurveyCreateSerializer)
+
+    Args:
+        survey: опрос
+        restart_question: запрошен перезапуск опроса
+
+    Returns:
+        bool: опрос начинается заново
+    """
+    if (current_question := survey.current_question) is None:
+        return True
+    return (
+        restart_question
+        and survey.status in _RESTART_STATUSES
+        and not current_question.answers.exists()
+    )
+
+
+def _create_or_restart_survey(
+    user_obj: User,
+    restart_question: bool,
+) -> Survey:
+    """
+    Создать или перезапустить опрос через SurveyCreateSerializer
+
+    Args:
+        user_obj: пользователь
+        restart_question: перезапустить опрос
+
+    Returns:
+        Survey: опрос
+    """
+    serializer = SurveyCreateSerializer(
+        data={"restart_question": restart_question},
+    )
+    serializer.is_valid(raise_exception=True)
+    with transaction.atomic():
+        return serializer.save(user=user_obj)
+
+
+def _get_answers(question: Question | None) -> list[str | None]:
+    """
+    Варианты ответа на вопрос
+
+    Args:
+        question: вопрос
+
+    Returns:
+        list[str|None]: варианты ответа
+    """
+    if question is None:
+        return []
+    return get_question_answers(question.id)
+
+
+@db_sync_to_async
+def load_survey_state(
+    user: TelegramUser,
+    restart_question: bool = False,
+    with_answers: bool = False,
+    with_documents: bool = False,
+) -> SurveyState:
+    """
+    Пользователь, опрос и текущий вопрос (при необходимости варианты
+    ответа и документы) за одно обращение к потоку БД.
+
+    Чтение идет прямыми запросами, сериализатор используется только
+    для создания и перезапуска опроса.
+
+    Args:
+        user: пользователь Telegram
+        restart_question: перезапустить завершенный опрос
+        with_answers: загрузить варианты ответа на текущий вопрос
+        with_documents: загрузить документы опроса
+
+    Returns:
+        SurveyState: состояние опроса
+    """
+    user_obj = _get_or_create_user(user)
+    survey = (
+        Survey.objects.filter(user=user_obj)
+        .select_related("current_question")
+        .first()
+    )
+    if survey is None or _need_restart(survey, restart_question):
+        survey = _create_or_restart_survey(user_obj, restart_question)
+
+    current_question = survey.current_question
+    return SurveyState(
+        user=user_obj,
+        survey=survey,
+        question_text=current_question.text if current_question else None,
+        answers=_get_answers(current_question) if with_answers else [],
+        documents=list(survey.docs.all()) if with_documents else [],
+    )
@@ -7,8 +7,6 @@ from django.core.exceptions import ValidationError
 from telegram import (
     Update,
     User as TelegramUser,
-    KeyboardButton,
-    ReplyKeyboardMarkup,
     File,
 )
 from telegram.ext import ContextTypes
@@ -16,16 +14,24 @@ from telegram.ext import ContextTypes
 from questionnaire.models import Survey
 from questionnaire.constant import SurveyStatus, TelegramCommand
 from .constant import MSG_REVERT_PREVIOUS_QUESTION
+from .history import (
+    add_to_step,
+    delete_messages,
+    pop_steps,
+    reset_steps,
+    start_step,
+)
+from .keyboards import get_question_keyboard
 from .menu_handlers import help_command, load_command
+from .replies import reply_survey_status
+from .services import load_survey_state
 from .sync_to_async import (
     write_document_db,
     save_survey_data,
     revert_survey_data,
-    get_or_create_user,
     change_processing,
-    get_or_create_survey,
-    get_survey_documents,
 )
+from .user_state import remember_status
 
 
 logger = logging.getLogger(__name__)
@@ -97,32 +103,6 @@ async def _save_document(
         return False, None, None
 
 
-def _get_reply_markup(answers: list[str]) -> ReplyKeyboardMarkup | None:
-    """
-    Получить клавиатуру
-
-    Args:
-        answers: список ответов
-
-    Returns:
-        ReplyKeyboardMarkup | None: клавиатура с возможными ответами
-    """
-    keyboard = []
-    for i, answer in enumerate(answer for answer in answers if answer):
-        index = i % 4
-        try:
-            keyboard[index].append(KeyboardButton(answer))
-        except IndexError:
-            keyboard.append([KeyboardButton(answer)])
-
-    reply_markup = ReplyKeyboardMarkup(
-        keyboard,
-        resize_keyboard=True,
-        one_time_keyboard=True,
-    )
-    return reply_markup
-
-
 async def _inform_msg(survey_obj: Survey, update) -> None:
     """
     Информационное сообщение в зависимости от статуса
@@ -162,33 +142,23 @@ async def _inform_msg(survey_obj: Survey, update) -> None:
 async def _delete_last_bot_messages(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
-    count=4,
+    steps: int = 2,
 ) -> None:
     """
-    Удаляет последние <count> сообщения бота из сохраненной истории
+    Удаляет сообщения последних <steps> вопросов опроса
+    из сохраненной истории чата
 
     Args:
         update: обновление от Telegram
         context: контекст
-        count: количество удаляемых сообщений
+        steps: количество вопросов
     """
     try:
-        chat_id = update.effective_chat.id
-
-        # Удаляем 2 последних сообщения бота перед текущим сообщением пользователя
-        for offset in range(0, count):
-            message_id_to_delete = update.message.message_id - offset
-
-            try:
-                await context.bot.delete_message(
-                    chat_id=chat_id, message_id=message_id_to_delete
-                )
-                logger.debug(f"Удалено сообщение {message_id_to_delete}")
-            except Exception as e:
-                logger.debug(
-                    f"Не удалось удалить сообщение {message_id_to_delete}: {e}"
-                )
-
+        await delete_messages(
+            context.bot,
+            update.effective_chat.id,
+            pop_steps(context.chat_data, steps),
+        )
     except Exception as e:
         logger.error(
             f"Ошибка при удалении сообщений: {e}",
@@ -206,16 +176,25 @@ async def start_command(
     user = update.effective_user
 
     try:
-        user_obj = await get_or_create_user(user)
-        text, answers, _, __ = await get_or_create_survey(user_obj, True)
+        state = await load_survey_state(
+            user,
+            restart_question=True,
+            with_answers=True,
+        )
+        remember_status(context.user_data, state.survey.status)
         welcome_text = (
             f"Привет, {user.first_name}! 👋\nЯ бот для проведения опросов!\n\n"
-        ) + (text or "")
-        reply_markup = _get_reply_markup(answers)
-        await update.message.reply_text(
+        ) + (state.question_text or "")
+        reply_markup = get_question_keyboard(
+            state.survey.current_question_id,
+            state.answers,
+        )
+        sent = await update.message.reply_text(
             welcome_text,
             reply_markup=reply_markup,
         )
+        reset_steps(context.chat_data)
+        start_step(context.chat_data, sent.message_id)
     except Exception as e:
         logger.error(
             "Ошибка в start_command: %s",
@@ -238,29 +217,11 @@ async def status_command(
     """
     user = update.effective_user
     try:
-        user_obj = await get_or_create_user(user)
-        _, __, result, survey = await get_or_create_survey(user_obj, False)
-
-        await update.message.reply_text(
-            "Результаты опроса:" if result else "Опрос не пройден"
-        )
-        if result:
-            for i, text in enumerate(result):
-                await update.message.reply_text(
-                    f"✅ Ответ:\n    {text}"
-                    if i % 2
-                    else f"❓ Вопрос:\n    {text}"
-                )
-
-        logger.debug("Добавляем отображение документов")
-        if documents := await get_survey_documents(survey):
-            await update.message.reply_text("📎 Прикрепленные документы:")
-            for select_doc in (doc for doc in documents if doc.image):
-                try:
-                    await update.message.reply_photo(photo=select_doc.image)
-                except Exception as e:
-                    logger.error(f"Не удалось отправить фото: {e}")
+        state = await load_survey_state(user, with_documents=True)
+        result, survey = state.result, state.survey
+        remember_status(context.user_data, survey.status)
 
+        await reply_survey_status(update.message, result, state.documents)
         await help_command(update, context, status=survey.status)
     except Exception as e:
         logger.error(
@@ -287,11 +248,8 @@ async def load_document_command(
     try:
         if survey_obj is None:
             user: TelegramUser = update.effective_user
-            user_obj = await get_or_create_user(user)
-
-            __, ___, ____, survey_obj = await get_or_create_survey(
-                user_obj, False
-            )
+            survey_obj = (await load_survey_state(user)).survey
+            remember_status(context.user_data, survey_obj.status)
         logger.debug("Проверяем статус опроса")
         await _inform_msg(survey_obj, update)
         logger.debug("Обработка документа")
@@ -344,13 +302,12 @@ async def processing_command(
     """
     try:
         user: TelegramUser = update.effective_user
-        user_obj = await get_or_create_user(user)
-
-        __, ___, ____, survey_obj = await get_or_create_survey(user_obj, False)
+        survey_obj = (await load_survey_state(user)).survey
         logger.debug("Проверяем статус опроса")
         await _inform_msg(survey_obj, update)
         logger.debug("Обработка смена статуса")
         await change_processing(survey_obj)
+        remember_status(context.user_data, survey_obj.status)
         await update.message.reply_text("✅ Ваша заявка принята")
         await help_command(update, context, status=survey_obj.status)
     except Exception as e:
@@ -370,7 +327,8 @@ async def handle_message(
     context: ContextTypes.DEFAULT_TYPE,
 ) -> None:
     """
-    Обработка обычных текстовых сообщений
+    Обработка обычных текстовых сообщений с загрузкой опроса из БД.
+    Запоминает статус опроса для маршрутизации следующих сообщений
 
     Args:
         update: обновление от Telegram
@@ -387,9 +345,9 @@ async def handle_message(
     )
 
     try:
-        user_obj = await get_or_create_user(user)
-
-        __, ___, ____, survey_obj = await get_or_create_survey(user_obj, False)
+        state = await load_survey_state(user)
+        user_obj, survey_obj = state.user, state.survey
+        remember_status(context.user_data, survey_obj.status)
         logger.debug(f"Статус опроса: {survey_obj.status}")
         match survey_obj.status:
             case (
@@ -399,6 +357,10 @@ async def handle_message(
             ):
                 logger.debug("Опрос")
                 new_status = None
+                # Ответ бота начинает новый шаг, если вопрос сменился
+                new_step = True
+                show_revert = settings.TELEGRAM_SHOW_REVERT_PREVIOUS_QUESTION
+                add_to_step(context.chat_data, update.message.message_id)
                 try:
                     if user_message == MSG_REVERT_PREVIOUS_QUESTION:
                         text, answers, new_status, revert_success = (
@@ -407,6 +369,7 @@ async def handle_message(
                                 survey_obj,
                             )
                         )
+                        new_step = revert_success
                         if revert_success:
                             await _delete_last_bot_messages(update, context)
 
@@ -426,17 +389,25 @@ async def handle_message(
                         text += "\n".join(
                             f"🔘 - {answer}" for answer in answers
                         )
-                    if settings.TELEGRAM_SHOW_REVERT_PREVIOUS_QUESTION:
-                        answers.append(MSG_REVERT_PREVIOUS_QUESTION)
                 except ValidationError as exp:
                     text, answers = "\n".join(exp.messages), []
+                    new_step = show_revert = False
+                remember_status(context.user_data, survey_obj.status)
 
-                reply_markup = _get_reply_markup(answers)
+                reply_markup = get_question_keyboard(
+                    survey_obj.current_question_id,
+                    answers,
+                    show_revert=show_revert,
+                )
                 if text:
-                    await update.message.reply_text(
+                    sent = await update.message.reply_text(
                         text,
                         reply_markup=reply_markup,
                     )
+                    if new_step:
+                        start_step(context.chat_data, sent.message_id)
+                    else:
+                        add_to_step(context.chat_data, sent.message_id)
                     if survey_obj.status == SurveyStatus.WAITING_DOCS.value:
                         await load_command(update, context)
                     return
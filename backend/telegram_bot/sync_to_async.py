@@ -1,26 +1,26 @@
 import logging
-from asgiref.sync import sync_to_async
 
 from django.contrib.auth import get_user_model
 from django.core.files.base import ContentFile
-from telegram import User as TelegramUser
+from django.db import transaction
 
 from api.v1.serializers import (
     SurveyUpdateSerializer,
-    SurveyCreateSerializer,
     DocumentSerializer,
     SurveyRevertSerializer,
 )
 
-from questionnaire.models import Survey, Question, Document
+from questionnaire.cache import get_start_question as _get_start_question
+from questionnaire.models import Survey, Question
 from questionnaire.constant import SurveyStatus
+from .db_executor import db_sync_to_async
 
 User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
 
-@sync_to_async
+@db_sync_to_async
 def write_document_db(
     survey_obj: Survey,
     content_file: ContentFile,
@@ -42,7 +42,7 @@ def write_document_db(
     serializer.save(survey=survey_obj)
 
 
-@sync_to_async
+@db_sync_to_async
 def save_survey_data(
     user_obj: User,
     survey_obj: Survey,
@@ -70,7 +70,8 @@ def save_survey_data(
         partial=True,
     )
     serializer.is_valid(raise_exception=True)
-    serializer.save(user=user_obj)
+    with transaction.atomic():
+        serializer.save(user=user_obj)
     data = serializer.data
     return (
         data.get("current_question_text"),
@@ -79,7 +80,7 @@ def save_survey_data(
     )
 
 
-@sync_to_async
+@db_sync_to_async
 def revert_survey_data(
     user_obj: User,
     survey_obj: Survey,
@@ -103,7 +104,8 @@ def revert_survey_data(
         partial=True,
     )
     serializer.is_valid(raise_exception=True)
-    serializer.save(user=user_obj)
+    with transaction.atomic():
+        serializer.save(user=user_obj)
     data = serializer.data
     return (
         data.get("current_question_text"),
@@ -113,34 +115,7 @@ def revert_survey_data(
     )
 
 
-@sync_to_async
-def get_or_create_user(user: TelegramUser) -> User:
-    """
-    Создать найти пользователя
-
-    Args:
-        user:
-
-    Returns:
-
-    """
-    user_obj, created = User.objects.get_or_create(
-        telegram_username="@" + user.username,
-        defaults={
-            "username": user.username,
-            "telegram_username": "@" + user.username,
-            "first_name": user.first_name or "",
-            "last_name": user.last_name or "",
-            # TODO При первичной авторизации не задается но потом просят задать
-            "password": "unusable_password",
-        },
-    )
-    if created:
-        logger.debug("Создан пользователь: %s", user_obj)
-    return user_obj
-
-
-@sync_to_async
+@db_sync_to_async
 def get_start_question() -> Question | None:
     """
     Стартовый вопрос
@@ -148,10 +123,10 @@ def get_start_question() -> Question | None:
     Returns:
         Question | None: вопрос
     """
-    return Question.objects.filter(type="start_telegram").first()
+    return _get_start_question("start_telegram")
 
 
-@sync_to_async
+@db_sync_to_async
 def change_processing(survey_obj: Survey) -> None:
     """
     Выставление статуса <В обработке>
@@ -161,50 +136,3 @@ def change_processing(survey_obj: Survey) -> None:
     """
     survey_obj.status = SurveyStatus.SURVEY_COMPLETED.value
     survey_obj.save()
-
-
-@sync_to_async
-def get_or_create_survey(
-    user_obj: User,
-    restart_question: bool,
-) -> tuple[str, list[str | None], list[str], Survey]:
-    """
-    Получить или создать опрос
-
-    Args:
-        user_obj: пользователь
-        restart_question: перезапустить опрос
-
-    Returns:
-        str: текст текущего вопроса
-        list[str|None]: варианта ответа
-        list[str]: данные ответы
-        Survey: объект вопроса
-    """
-    create_serializer = SurveyCreateSerializer(
-        data={"restart_question": restart_question},
-    )
-    create_serializer.is_valid(raise_exception=True)
-    create_serializer.save(user=user_obj)
-    data = create_serializer.data
-    return (
-        data.get("current_question_text"),
-        data.get("answers"),
-        data.get("result"),
-        create_serializer.instance,
-    )
-
-
-@sync_to_async
-def get_survey_documents(survey_obj: Survey) -> list[Document]:
-    """
-    Получить документы опроса
-
-    Args:
-        survey_obj: объект опроса
-
-    Returns:
-        list: список документов
-    """
-    documents = survey_obj.docs.all()
-    return list(documents)
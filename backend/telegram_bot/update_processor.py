@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from collections.abc import Awaitable
+from typing import Any
+
+from django.conf import settings
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class ChatUpdateProcessor(BaseUpdateProcessor):
+    """
+    Параллельная обработка обновлений разных чатов.
+
+    Обновления одного чата обрабатываются по очереди: ответы
+    пользователя должны попасть в опрос в порядке отправки.
+    """
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        self._chat_locks: dict[int, asyncio.Lock] = {}
+        self._chat_waiters: dict[int, int] = {}
+
+    async def process_update(
+        self,
+        update: object,
+        coroutine: Awaitable[Any],
+    ) -> None:
+        # Очередь чата - до семафора: обновление, ждущее свой чат,
+        # не занимает место, и другие чаты не ждут занятый
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            await super().process_update(update, coroutine)
+            return
+
+        lock = self._chat_locks.setdefault(chat.id, asyncio.Lock())
+        self._chat_waiters[chat.id] = self._chat_waiters.get(chat.id, 0) + 1
+        try:
+            async with lock:
+                await super().process_update(update, coroutine)
+        finally:
+            self._chat_waiters[chat.id] -= 1
+            if not self._chat_waiters[chat.id]:
+                del self._chat_waiters[chat.id]
+                del self._chat_locks[chat.id]
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: Awaitable[Any],
+    ) -> None:
+        await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
+def create_update_processor() -> ChatUpdateProcessor:
+    """
+    Обработчик обновлений бота: одновременно обрабатывается столько
+    обновлений, сколько потоков в пуле БД (TELEGRAM_DB_POOL_SIZE),
+    без пула - по одному
+
+    Returns:
+        ChatUpdateProcessor: обработчик обновлений
+    """
+    size = max(settings.TELEGRAM_DB_POOL_SIZE, 1)
+    logger.debug("Одновременно обрабатывается обновлений: %s", size)
+    return ChatUpdateProcessor(size)
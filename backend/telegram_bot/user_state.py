@@ -0,0 +1,49 @@
+import time
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+
+from django.conf import settings
+
+# Ключ user_data с последним известным состоянием опроса пользователя
+USER_STATE_KEY = "survey_state"
+
+
+@dataclass(slots=True)
+class UserState:
+    """Статус опроса пользователя, известный боту без запроса к БД"""
+
+    status: str
+    expires_at: float
+
+
+def remember_status(user_data: MutableMapping, status: str) -> None:
+    """
+    Запомнить статус опроса пользователя на TELEGRAM_STATE_TTL
+
+    Args:
+        user_data: данные пользователя
+        status: статус опроса
+    """
+    user_data[USER_STATE_KEY] = UserState(
+        status=status,
+        expires_at=time.monotonic() + settings.TELEGRAM_STATE_TTL,
+    )
+
+
+def get_status(user_data: MutableMapping) -> str | None:
+    """
+    Запомненный статус опроса пользователя.
+
+    Статус могут сменить вне бота (в админке), поэтому он
+    устаревает через TELEGRAM_STATE_TTL.
+
+    Args:
+        user_data: данные пользователя
+
+    Returns:
+        str | None: статус опроса или None, если неизвестен
+    """
+    state = user_data.get(USER_STATE_KEY)
+    if state is None or state.expires_at <= time.monotonic():
+        return None
+    return state.status
@@ -1,21 +1,43 @@
+import logging
+import time
+from http import HTTPStatus
+
 import requests
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
 URL = f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage"
+# Сколько раз повторять отправку после ответа 429
+MAX_RETRIES = 5
 
 
 def send_telegram_message(chat_id, message):
     """
-    Отправка сообщения через Telegram API
+    Отправка сообщения через Telegram API.
+    При ответе 429 ждет retry_after и повторяет отправку.
 
     Args:
         chat_id: идентификатор чата
         message: сообщение
 
     Returns:
-
+        dict: ответ Telegram API
     """
     data = {"chat_id": chat_id, "text": message}
 
-    response = requests.post(URL, data=data)
+    for attempt in range(MAX_RETRIES + 1):
+        response = requests.post(URL, data=data)
+        if (
+            response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+            or attempt == MAX_RETRIES
+        ):
+            break
+        retry_after = (
+            response.json().get("parameters", {}).get("retry_after", 1)
+        )
+        logger.warning(
+            "Ограничение Telegram API, повтор через %s с", retry_after
+        )
+        time.sleep(retry_after)
     return response.json()
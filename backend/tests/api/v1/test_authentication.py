@@ -0,0 +1,271 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.v1.authentication import _cache_key
+from questionnaire.models import Comment, Document, Survey
+
+User = get_user_model()
+
+PNG_BASE64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAA"
+    "AADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+def _auth_queries(client: APIClient) -> int:
+    """
+    Запросы к таблице токенов при одном запросе к API
+
+    Args:
+        client: клиент
+
+    Returns:
+        int: количество запросов
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("survey-list"))
+    assert response.status_code == status.HTTP_200_OK
+    return sum(
+        "authtoken_token" in query["sql"] for query in queries.captured_queries
+    )
+
+
+@pytest.mark.django_db
+class TestCachedTokenAuthentication:
+    """Тесты кеширования аутентификации по токену"""
+
+    @pytest.fixture
+    def token(self, user: User) -> Token:
+        return Token.objects.create(user=user)
+
+    @pytest.fixture
+    def token_client(
+        self,
+        api_client: APIClient,
+        token: Token,
+        question,
+    ) -> APIClient:
+        api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        return api_client
+
+    def test_cached(self, token_client):
+        """Токен читается из БД только при первом запросе"""
+        assert _auth_queries(token_client) == 1
+        assert _auth_queries(token_client) == 0
+
+    def test_cached_snapshot(self, token_client, token, user):
+        """В кеше только снимок пользователя, без пароля"""
+        _auth_queries(token_client)
+
+        snapshot = cache.get(_cache_key(token.key))
+
+        assert snapshot == {
+            "id": user.pk,
+            "username": user.username,
+            "is_active": True,
+            "is_staff": False,
+        }
+
+    def test_cached_user_fields(self, token_client, user):
+        """Поля вне снимка читаются из БД при обращении"""
+        _auth_queries(token_client)
+
+        response = token_client.get(reverse("user-me"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["email"] == user.email
+
+    def test_logout(self, token_client):
+        """После выхода токен не принимается"""
+        _auth_queries(token_client)
+
+        response = token_client.post(reverse("logout"))
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = token_client.get(reverse("survey-list"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_deactivated(self, token_client, user):
+        """Заблокированный пользователь не проходит аутентификацию"""
+        _auth_queries(token_client)
+
+        user.is_active = False
+        user.save()
+
+        response = token_client.get(reverse("survey-list"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_invalid_token(self, api_client):
+        """Неизвестный токен не кешируется как валидный"""
+        api_client.credentials(HTTP_AUTHORIZATION="Token unknown")
+
+        for _ in range(2):
+            response = api_client.get(reverse("survey-list"))
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestJWTAuthentication:
+    """Тесты аутентификации опросов по JWT"""
+
+    @pytest.fixture
+    def access_token(self, api_client: APIClient, user: User) -> str:
+        response = api_client.post(
+            reverse("jwt-create"),
+            {"username": user.username, "password": "testpass123"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.data["access"]
+
+    def test_staff_claim(self, api_client, user):
+        """Признак администратора передается в токене"""
+        user.is_staff = True
+        user.save()
+
+        response = api_client.post(
+            reverse("jwt-create"),
+            {"username": user.username, "password": "testpass123"},
+        )
+
+        token = AccessToken(response.data["access"])
+        assert token["is_staff"] is True
+        assert token["user_id"] == str(user.pk)
+
+    def test_staff_claim_refreshed(self, api_client, user):
+        """Снятие прав администратора действует с обновления токена"""
+        user.is_staff = True
+        user.save()
+        refresh = api_client.post(
+            reverse("jwt-create"),
+            {"username": user.username, "password": "testpass123"},
+        ).data["refresh"]
+        user.is_staff = False
+        user.save()
+
+        response = api_client.post(
+            reverse("jwt-refresh"), {"refresh": refresh}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert AccessToken(response.data["access"])["is_staff"] is False
+
+    def test_refresh_inactive_user(self, api_client, user):
+        """Заблокированный пользователь не обновляет токен"""
+        refresh = api_client.post(
+            reverse("jwt-create"),
+            {"username": user.username, "password": "testpass123"},
+        ).data["refresh"]
+        user.is_active = False
+        user.save()
+
+        response = api_client.post(
+            reverse("jwt-refresh"), {"refresh": refresh}
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_survey_steps_without_user_queries(
+        self,
+        api_client,
+        access_token,
+        user,
+        question,
+        answer_choice,
+    ):
+        """Шаги опроса не читают пользователя и токены из БД"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(reverse("survey-list"))
+            assert response.status_code == status.HTTP_201_CREATED
+            survey_id = response.data["id"]
+            response = api_client.put(
+                reverse("survey-detail", args=(survey_id,)),
+                {"answer": answer_choice.answer},
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        assert not any(
+            "users_user" in query["sql"] or "authtoken_token" in query["sql"]
+            for query in queries.captured_queries
+        )
+        assert Survey.objects.get(pk=survey_id).user == user
+
+    def test_other_user_survey(
+        self,
+        api_client,
+        access_token,
+        other_user,
+        question,
+    ):
+        """Чужой опрос недоступен по JWT"""
+        survey = Survey.objects.create(user=other_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        response = api_client.patch(
+            reverse("survey-processing", args=(survey.id,)),
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_document_upload(
+        self,
+        api_client,
+        access_token,
+        survey,
+        mock_yandex_disk_uploader,
+    ):
+        """Автор загружает документы опроса по JWT"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        response = api_client.post(
+            reverse("document-list", args=(survey.id,)),
+            {"image": f"data:image/png;base64,{PNG_BASE64}"},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Document.objects.filter(survey=survey).count() == 1
+
+    def test_other_user_documents(self, api_client, access_token, other_user):
+        """Документы чужого опроса по JWT недоступны"""
+        survey = Survey.objects.create(user=other_user)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        response = api_client.get(reverse("document-list", args=(survey.id,)))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_staff_comment(self, api_client, admin_user, survey):
+        """Администратор комментирует опрос по JWT"""
+        access_token = api_client.post(
+            reverse("jwt-create"),
+            {"username": admin_user.username, "password": "adminpass123"},
+        ).data["access"]
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        response = api_client.post(
+            reverse("comment-list", args=(survey.id,)),
+            {"text": "Комментарий"},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Comment.objects.get(survey=survey).user == admin_user
+
+    def test_comment_not_staff(self, api_client, access_token, survey):
+        """Автор опроса по JWT не комментирует"""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+        response = api_client.post(
+            reverse("comment-list", args=(survey.id,)),
+            {"text": "Комментарий"},
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,40 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from questionnaire.models import Document
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchApiCommand:
+    """Тесты команды нагрузочного прогона REST API"""
+
+    def test_survey_flow_without_errors(self):
+        """Сценарий опроса проходит без ошибок на локальном диске"""
+        out = StringIO()
+
+        call_command(
+            "bench_api",
+            users=2,
+            # Тестовая SQLite не держит параллельную запись
+            concurrency=1,
+            updates=5,
+            current_db=True,
+            stdout=out,
+        )
+
+        report = json.loads(out.getvalue())
+        endpoints = report["endpoints"]
+        assert set(endpoints) == {
+            "create",
+            "update",
+            "revert",
+            "processing",
+            "docs_upload",
+        }
+        assert all(endpoint["errors"] == 0 for endpoint in endpoints.values())
+        assert endpoints["update"]["count"] == 10
+        assert sum(endpoints["update"]["histogram_ms"].values()) == 10
+        assert Document.objects.filter(image__startswith="app:/").count() == 2
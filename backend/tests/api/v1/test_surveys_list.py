@@ -1,10 +1,9 @@
 # test_surveys_list.py
-from time import sleep
-
 import pytest
 from django.urls import reverse
 from rest_framework.status import (
     HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
     HTTP_401_UNAUTHORIZED,
 )
 from questionnaire.models import Survey
@@ -27,11 +26,11 @@ class TestSurveyList:
         response = authenticated_client.get(url)
 
         assert response.status_code == HTTP_200_OK
-        assert isinstance(response.data, list)
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == str(survey.id)
-        assert "current_question_text" in response.data[0]
-        assert "answers" in response.data[0]
+        results = response.data["results"]
+        assert len(results) == 1
+        assert results[0]["id"] == str(survey.id)
+        assert "current_question_text" in results[0]
+        assert "answers" in results[0]
 
     def test_list_surveys_empty(
         self,
@@ -39,20 +38,14 @@ class TestSurveyList:
         user,
         question,
     ):
-        """Тест получения пустого списка опросов"""
+        """Тест получения пустого списка опросов: GET ничего не создает"""
         url = reverse("survey-list")
 
         response = authenticated_client.get(url)
 
         assert response.status_code == HTTP_200_OK
-
-        assert isinstance(response.data, list)
-        assert len(response.data) == 1
-        response_question = response.data[0]
-        assert response_question["current_question_text"] == question.text
-        assert response_question["status"] == SurveyStatus.FILLING_SURVEY.value
-        assert response_question["result"] == []
-        assert response_question["answers"] == []
+        assert response.data["results"] == []
+        assert not Survey.objects.filter(user=user).exists()
 
     def test_list_surveys_only_current_user(
         self,
@@ -90,10 +83,10 @@ class TestSurveyList:
         response = authenticated_client.get(url)
 
         assert response.status_code == HTTP_200_OK
-        assert isinstance(response.data, list)
-        assert len(response.data) == 1
-        assert response.data[0]["id"] == str(user_survey.id)
-        assert response.data[0]["id"] != str(other_survey.id)
+        results = response.data["results"]
+        assert len(results) == 1
+        assert results[0]["id"] == str(user_survey.id)
+        assert results[0]["id"] != str(other_survey.id)
 
     def test_list_surveys_unauthenticated(
         self,
@@ -106,3 +99,108 @@ class TestSurveyList:
         response = api_client.get(url)
 
         assert response.status_code == HTTP_401_UNAUTHORIZED
+
+    def test_list_surveys_pagination(
+        self,
+        authenticated_client: APIClient,
+        user,
+        question,
+    ):
+        """Постраничный вывод по курсору, новые опросы первыми"""
+        surveys = [
+            Survey.objects.create(user=user, current_question=question)
+            for _ in range(3)
+        ]
+        url = reverse("survey-list")
+
+        response = authenticated_client.get(url, {"page_size": 2})
+
+        assert response.status_code == HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [
+            str(surveys[2].id),
+            str(surveys[1].id),
+        ]
+        response = authenticated_client.get(response.data["next"])
+        assert [item["id"] for item in response.data["results"]] == [
+            str(surveys[0].id),
+        ]
+        assert response.data["next"] is None
+
+    def test_list_surveys_not_modified(
+        self,
+        authenticated_client: APIClient,
+        survey: Survey,
+        django_assert_num_queries,
+    ):
+        """Повторный запрос без изменений - 304, после изменения - 200"""
+        url = reverse("survey-list")
+        response = authenticated_client.get(url)
+        etag = response["ETag"]
+        assert "no-cache" in response["Cache-Control"]
+
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+        survey.status = SurveyStatus.WAITING_DOCS.value
+        survey.save()
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_retrieve_survey(
+        self,
+        authenticated_client: APIClient,
+        survey: Survey,
+    ):
+        """Получение опроса по идентификатору с ETag"""
+        url = reverse("survey-detail", args=(survey.id,))
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data["id"] == str(survey.id)
+        response = authenticated_client.get(
+            url,
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    def test_retrieve_after_revert_and_new_answer(
+        self,
+        authenticated_client: APIClient,
+        survey: Survey,
+        answer_choice_user_set,
+    ):
+        """Откат и другой ответ на тот же вопрос меняют ETag"""
+        url = reverse("survey-detail", args=(survey.id,))
+        authenticated_client.put(url, {"answer": "Первый"}, format="json")
+        etag = authenticated_client.get(url)["ETag"]
+
+        authenticated_client.patch(url + "revert/")
+        authenticated_client.put(url, {"answer": "Второй"}, format="json")
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data["result"][-1] == "Второй"
+
+    def test_retrieve_after_question_edit(
+        self,
+        authenticated_client: APIClient,
+        survey: Survey,
+        question,
+    ):
+        """Изменение текста текущего вопроса в админке меняет ETag"""
+        url = reverse("survey-detail", args=(survey.id,))
+        etag = authenticated_client.get(url)["ETag"]
+
+        question.text = "Новый текст вопроса?"
+        question.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data["current_question_text"] == question.text
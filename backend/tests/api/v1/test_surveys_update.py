@@ -314,6 +314,32 @@ class TestSurveyUpdate:
             "мой_пользовательский_ответ",
         ]
 
+    def test_update_survey_custom_answer_order(
+        self,
+        authenticated_client,
+        survey,
+        question,
+        answer_choice_user_set,
+    ) -> None:
+        """Из нескольких пользовательских ответов выбирается первый
+        в порядке опросника (рекурсивный), а не по первичному ключу"""
+        # Ответы стартового вопроса упорядочены по ключу
+        question.type = "standart"
+        question.save()
+        AnswerChoice.objects.create(
+            current_question=question,
+            next_question=question,
+            answer=None,
+        )
+        url = reverse("survey-detail", kwargs={"pk": survey.id})
+
+        response = authenticated_client.put(
+            url, {"answer": "мой_ответ"}, format="json"
+        )
+
+        assert response.status_code == HTTP_200_OK
+        assert Survey.objects.get(id=survey.id).current_question == question
+
     def test_update_survey_with_final_question(
         self,
         authenticated_client: APIClient,
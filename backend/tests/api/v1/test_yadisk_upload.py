@@ -1,7 +1,10 @@
+import base64
+from unittest.mock import MagicMock
 from urllib.parse import unquote
 from uuid import uuid4
 
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
 
@@ -47,9 +50,30 @@ class TestDocumentViewSet:
         assert Document.objects.count() == initial_count + 1
         assert new_record.survey == survey
         assert new_record.image == self.download_url
+        assert new_record.thumbnail == self.download_url
         mock_yandex_disk_uploader["mock_get"].assert_called()
         mock_yandex_disk_uploader["mock_put"].assert_called()
 
+    def test_create_pdf_document_without_thumbnail(
+        self, authenticated_client, mock_yandex_disk_uploader, survey
+    ):
+        """Тест: PDF загружается как есть, без миниатюры"""
+        pdf = base64.b64encode(b"%PDF-1.4\n%%EOF\n").decode()
+        url = reverse(
+            self.list_view_name,
+            kwargs=self.list_view_kwargs(survey.pk),
+        )
+
+        response = authenticated_client.post(
+            url,
+            self.data_image(f"data:application/pdf;base64,{pdf}"),
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Document.objects.get(survey=survey).thumbnail == ""
+        mock_yandex_disk_uploader["mock_put"].assert_called_once()
+
     def test_create_document_invalid_base64(
         self, authenticated_client, survey
     ):
@@ -131,3 +155,156 @@ class TestDocumentViewSet:
         response = authenticated_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_documents_of_survey_only(
+        self, authenticated_client, survey, survey_other_user,
+        document_factory,
+    ):
+        """Тест: в списке только документы опроса из URL"""
+        document_factory.create_batch(3, survey=survey)
+        document_factory.create_batch(2, survey=survey_other_user)
+        url = reverse(
+            self.list_view_name, kwargs=self.list_view_kwargs(survey.pk)
+        )
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+
+    def test_list_documents_of_other_user_forbidden(
+        self, authenticated_client, survey_other_user, document_factory
+    ):
+        """Тест: документы чужого опроса недоступны"""
+        document_factory.create_batch(2, survey=survey_other_user)
+        url = reverse(
+            self.list_view_name,
+            kwargs=self.list_view_kwargs(survey_other_user.pk),
+        )
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_delete_document_queries(
+        self, authenticated_client, survey, document,
+        django_assert_max_num_queries,
+    ):
+        """Тест: опрос загружается один раз на запрос удаления"""
+        url = reverse(
+            "document-detail",
+            kwargs=self.detail_view_kwargs(survey.pk, document.pk),
+        )
+
+        with django_assert_max_num_queries(3):
+            response = authenticated_client.delete(url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+class TestDocumentBatchUpload:
+    """Тесты пакетной загрузки документов"""
+
+    png = base64.b64decode(TestDocumentViewSet.base64_image)
+
+    def _files(self, count, extension="png"):
+        return [
+            SimpleUploadedFile(f"scan{i}.{extension}", self.png)
+            for i in range(count)
+        ]
+
+    def _url(self, survey):
+        return reverse("document-batch", kwargs={"survey_pk": survey.pk})
+
+    def test_batch_upload(
+        self, authenticated_client, mock_yandex_disk_uploader, survey,
+        django_assert_max_num_queries,
+    ):
+        """Тест: все файлы загружены, документы созданы одним запросом"""
+        with django_assert_max_num_queries(2):
+            response = authenticated_client.post(
+                self._url(survey),
+                {"files": self._files(3)},
+                format="multipart",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        results = response.data["results"]
+        assert [result["file"] for result in results] == [
+            "scan0.png", "scan1.png", "scan2.png",
+        ]
+        ids = {result["id"] for result in results}
+        assert set(
+            Document.objects.filter(survey=survey).values_list("id", flat=True)
+        ) == ids
+        # изображение и миниатюра для каждого файла
+        assert mock_yandex_disk_uploader["mock_put"].call_count == 6
+        assert not Document.objects.filter(thumbnail="").exists()
+
+    def test_batch_upload_partial_failure(
+        self, authenticated_client, mock_yandex_disk_uploader, survey
+    ):
+        """Тест: ошибка одного файла не отменяет остальные (207)"""
+        failed = MagicMock()
+        failed.raise_for_status.side_effect = Exception("disk error")
+        mock_put = mock_yandex_disk_uploader["mock_put"]
+        mock_put.side_effect = lambda url, data: (
+            failed
+            if data == b"broken"
+            else mock_yandex_disk_uploader["mock_response_put"]
+        )
+        files = [
+            *self._files(2),
+            SimpleUploadedFile("broken.png", b"broken"),
+        ]
+
+        response = authenticated_client.post(
+            self._url(survey), {"files": files}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        results = response.data["results"]
+        assert "id" in results[0] and "id" in results[1]
+        assert results[2]["file"] == "broken.png"
+        assert "error" in results[2]
+        assert Document.objects.filter(survey=survey).count() == 2
+
+    def test_batch_upload_invalid_extension(
+        self, authenticated_client, survey
+    ):
+        """Тест: файлы неподдерживаемого типа отклоняются"""
+        response = authenticated_client.post(
+            self._url(survey),
+            {"files": self._files(1, extension="exe")},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Document.objects.exists()
+
+    def test_batch_upload_too_many_files(
+        self, authenticated_client, survey, settings
+    ):
+        """Тест: число файлов ограничено DOCUMENT_BATCH_MAX_FILES"""
+        settings.DOCUMENT_BATCH_MAX_FILES = 2
+
+        response = authenticated_client.post(
+            self._url(survey),
+            {"files": self._files(3)},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_upload_other_user_forbidden(
+        self, authenticated_client, survey_other_user
+    ):
+        """Тест: загрузка в чужой опрос запрещена"""
+        response = authenticated_client.post(
+            self._url(survey_other_user),
+            {"files": self._files(1)},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
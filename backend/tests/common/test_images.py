@@ -0,0 +1,125 @@
+from io import BytesIO
+
+import pytest
+from django.test import override_settings
+from PIL import Image
+
+from common.utils.images import (
+    get_image_executor,
+    normalize_image,
+    prepare_image,
+    shutdown_image_executor,
+)
+
+# Тег EXIF Orientation: 6 - снимок повернут на 90 по часовой
+ORIENTATION_TAG = 0x0112
+
+
+def _image_bytes(
+    size: tuple[int, int],
+    mode: str = "RGB",
+    image_format: str = "JPEG",
+    orientation: int | None = None,
+) -> bytes:
+    output = BytesIO()
+    image = Image.new(mode, size, "red")
+    kwargs = {}
+    if orientation is not None:
+        exif = Image.Exif()
+        exif[ORIENTATION_TAG] = orientation
+        kwargs["exif"] = exif
+    image.save(output, image_format, **kwargs)
+    return output.getvalue()
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(BytesIO(data))
+
+
+@pytest.fixture(autouse=True)
+def _reset_image_executor():
+    """Остановка пула после каждого теста"""
+    yield
+    shutdown_image_executor()
+
+
+class TestPrepareImage:
+    """Тесты нормализации изображений документов"""
+
+    @pytest.fixture(autouse=True)
+    def _settings(self, settings):
+        settings.IMAGE_PROCESS_WORKERS = 0
+        settings.IMAGE_MAX_SIZE = 100
+        settings.IMAGE_THUMBNAIL_SIZE = 20
+
+    def test_downsize_and_thumbnail(self):
+        """Тест: изображение уменьшается, миниатюра создается"""
+        prepared = prepare_image("scan.png", _image_bytes((400, 200)))
+
+        assert prepared.name == "scan.jpg"
+        assert prepared.thumbnail_name == "scan_thumb.jpg"
+        with _open(prepared.data) as image:
+            assert image.format == "JPEG"
+            assert image.size == (100, 50)
+        with _open(prepared.thumbnail) as thumbnail:
+            assert thumbnail.size == (20, 10)
+
+    def test_exif_orientation(self):
+        """Тест: снимок поворачивается по EXIF"""
+        data = _image_bytes((80, 40), orientation=6)
+
+        prepared = prepare_image("photo.jpg", data)
+
+        with _open(prepared.data) as image:
+            assert image.size == (40, 80)
+            assert ORIENTATION_TAG not in image.getexif()
+
+    def test_transparent_on_white(self):
+        """Тест: прозрачное изображение сохраняется на белом фоне"""
+        transparent = Image.new("RGBA", (10, 10), (0, 0, 0, 0))
+        output = BytesIO()
+        transparent.save(output, "PNG")
+
+        prepared = prepare_image("logo.png", output.getvalue())
+
+        with _open(prepared.data) as image:
+            assert image.mode == "RGB"
+            assert all(
+                channel > 250 for channel in image.getpixel((5, 5))
+            )
+
+    def test_pdf_unchanged(self):
+        """Тест: PDF загружается без изменений и без миниатюры"""
+        data = b"%PDF-1.4\n%%EOF\n"
+
+        prepared = prepare_image("scan.pdf", data)
+
+        assert prepared.name == "scan.pdf"
+        assert prepared.data == data
+        assert prepared.thumbnail is None
+
+    def test_normalize_not_image(self):
+        """Тест: не изображение не нормализуется"""
+        assert normalize_image(b"not an image", 100, 20, 80) is None
+
+
+class TestImageExecutor:
+    """Тесты пула процессов изображений"""
+
+    @override_settings(IMAGE_PROCESS_WORKERS=0)
+    def test_pool_disabled(self):
+        """Тест: при IMAGE_PROCESS_WORKERS=0 пул не создается"""
+        assert get_image_executor() is None
+
+    @override_settings(
+        IMAGE_PROCESS_WORKERS=1,
+        IMAGE_MAX_SIZE=100,
+        IMAGE_THUMBNAIL_SIZE=20,
+    )
+    def test_prepare_in_pool(self):
+        """Тест: изображение обрабатывается в процессе пула"""
+        prepared = prepare_image("scan.jpg", _image_bytes((400, 200)))
+
+        assert get_image_executor() is not None
+        with _open(prepared.data) as image:
+            assert image.size == (100, 50)
@@ -0,0 +1,294 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import (
+    AnswerChoice,
+    Comment,
+    Document,
+    Question,
+    Survey,
+)
+from questionnaire.search import answers_search_text, user_search_text
+
+User = get_user_model()
+
+# Количество вопросов в большом опроснике
+QUESTION_COUNT = 40
+# Количество вариантов ответа на каждый вопрос
+ANSWERS_PER_QUESTION = 4
+# Количество опросов для списков в админке
+SURVEY_COUNT = 100
+# Количество документов и комментариев к каждому опросу
+DOCS_PER_SURVEY = 3
+COMMENTS_PER_SURVEY = 3
+
+BASELINES_PATH = Path(__file__).resolve().parent / "baselines.json"
+# Перезаписать эталонные замеры времени вместо проверки
+UPDATE_BASELINES = os.getenv("PERF_UPDATE_BASELINES", "").lower() == "true"
+# Допустимое замедление относительно эталона (во сколько раз)
+TIME_TOLERANCE = float(os.getenv("PERF_TIME_TOLERANCE", "3.0"))
+# Абсолютный запас в секундах, сглаживающий шум на быстрых замерах
+TIME_SLACK = float(os.getenv("PERF_TIME_SLACK", "0.05"))
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.fixture
+def user() -> User:
+    """
+    Тестовый пользователь
+
+    Returns:
+        User: пользователь
+    """
+    return User.objects.create_user(
+        username="perfuser",
+        email="perf@example.com",
+        password="perfpass123",
+        telegram_username="@perf_user",
+    )
+
+
+@pytest.fixture
+def authenticated_client(api_client: APIClient, user: User) -> APIClient:
+    """
+    Получить аутентифицированного клиента
+
+    Args:
+        api_client: клиент
+        user: пользователь
+
+    Returns:
+        APIClient: клиент
+    """
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+@pytest.fixture
+def superuser_client(client):
+    """
+    Клиент Django, авторизованный суперпользователем (для админки)
+
+    Args:
+        client: клиент Django
+
+    Returns:
+        Client: клиент
+    """
+    admin = User.objects.create_superuser(
+        username="perfadmin",
+        email="perfadmin@example.com",
+        password="perfadmin123",
+    )
+    client.force_login(admin)
+    return client
+
+
+@pytest.fixture
+def fake_yandex_disk():
+    """Подмена HTTP-запросов к API Яндекс-диска"""
+    response = MagicMock()
+    response.json.return_value = {"href": "https://fake-disk.local/file"}
+    response.headers = {"Location": "https://fake-disk.local/disk/file.png"}
+    with (
+        patch("common.utils.yadisk.requests.get", return_value=response),
+        patch("common.utils.yadisk.requests.put", return_value=response),
+    ):
+        yield response
+
+
+@pytest.fixture
+def large_questionnaire() -> list[Question]:
+    """
+    Большой опросник: цепочка из QUESTION_COUNT вопросов,
+    у каждого ANSWERS_PER_QUESTION вариантов ответа и
+    пользовательский вариант (None) на следующий вопрос.
+    Последний вопрос без вариантов ответа.
+
+    Returns:
+        list[Question]: вопросы в порядке прохождения
+    """
+    questions = Question.objects.bulk_create(
+        Question(
+            text=f"Вопрос №{index}?",
+            type="start" if index == 0 else "standart",
+        )
+        for index in range(QUESTION_COUNT)
+    )
+    AnswerChoice.objects.bulk_create(
+        AnswerChoice(
+            current_question=question,
+            next_question=questions[index + 1],
+            answer=answer,
+        )
+        for index, question in enumerate(questions[:-1])
+        for answer in [
+            *(f"Ответ {number}" for number in range(ANSWERS_PER_QUESTION)),
+            None,
+        ]
+    )
+    return questions
+
+
+def _build_survey(
+    user: User,
+    questions: list[Question],
+    step: int,
+) -> Survey:
+    """
+    Собрать опрос, прошедший step вопросов
+
+    Args:
+        user: пользователь
+        questions: вопросы опросника
+        step: индекс текущего вопроса
+
+    Returns:
+        Survey: несохраненный опрос
+    """
+    result = []
+    version = 0
+    for question in questions[: step + 1]:
+        version ^= question.updated_uuid.int
+    for question in questions[:step]:
+        result.extend((question.text, "Ответ 0"))
+    # bulk_create не вызывает save(), данные для поиска заполняются здесь
+    return Survey(
+        user=user,
+        search_user=user_search_text(user),
+        search_answers=answers_search_text(result),
+        current_question=questions[step],
+        status=SurveyStatus.FILLING_SURVEY.value,
+        result=result,
+        questions_version_uuid=UUID(int=version),
+        updated_at=questions[step].updated_at,
+    )
+
+
+@pytest.fixture
+def deep_survey(user: User, large_questionnaire: list[Question]) -> Survey:
+    """
+    Опрос пользователя на середине большого опросника
+
+    Args:
+        user: пользователь
+        large_questionnaire: вопросы опросника
+
+    Returns:
+        Survey: опрос
+    """
+    survey = _build_survey(
+        user,
+        large_questionnaire,
+        len(large_questionnaire) // 2,
+    )
+    survey.save()
+    return survey
+
+
+@pytest.fixture
+def many_surveys(large_questionnaire: list[Question]) -> list[Survey]:
+    """
+    SURVEY_COUNT опросов разных пользователей
+    с документами и комментариями
+
+    Args:
+        large_questionnaire: вопросы опросника
+
+    Returns:
+        list[Survey]: опросы
+    """
+    users = User.objects.bulk_create(
+        User(
+            username=f"perf_user_{index}",
+            email=f"perf_user_{index}@example.com",
+            phone_number=f"+7999{index:07d}",
+        )
+        for index in range(SURVEY_COUNT)
+    )
+    surveys = Survey.objects.bulk_create(
+        _build_survey(
+            user,
+            large_questionnaire,
+            index % (len(large_questionnaire) - 1),
+        )
+        for index, user in enumerate(users)
+    )
+    Document.objects.bulk_create(
+        Document(survey=survey, image=f"app:/{survey.pk}_{number}.png")
+        for survey in surveys
+        for number in range(DOCS_PER_SURVEY)
+    )
+    Comment.objects.bulk_create(
+        Comment(survey=survey, user=survey.user, text=f"Комментарий {number}")
+        for survey in surveys
+        for number in range(COMMENTS_PER_SURVEY)
+    )
+    return surveys
+
+
+@pytest.fixture(scope="session")
+def _wall_time_measurements():
+    """
+    Замеры времени за сессию.
+    При PERF_UPDATE_BASELINES=true записываются в baselines.json
+    """
+    measurements = {}
+    yield measurements
+    if UPDATE_BASELINES and measurements:
+        baselines = (
+            json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+            if BASELINES_PATH.exists()
+            else {}
+        )
+        baselines.update(measurements)
+        BASELINES_PATH.write_text(
+            json.dumps(baselines, indent=4, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+
+@pytest.fixture
+def wall_time(_wall_time_measurements):
+    """
+    Замер времени выполнения блока с проверкой по эталону.
+
+    Пример:
+        with wall_time("api.survey_update"):
+            client.put(...)
+    """
+    baselines = (
+        json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+        if BASELINES_PATH.exists()
+        else {}
+    )
+
+    @contextmanager
+    def _measure(name: str):
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        _wall_time_measurements[name] = round(elapsed, 4)
+        if UPDATE_BASELINES or name not in baselines:
+            return
+        limit = baselines[name] * TIME_TOLERANCE + TIME_SLACK
+        assert elapsed <= limit, (
+            f"{name}: {elapsed:.4f}с превышает эталон "
+            f"{baselines[name]:.4f}с (допуск x{TIME_TOLERANCE})"
+        )
+
+    return _measure
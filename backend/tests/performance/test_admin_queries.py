@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK
+
+from questionnaire.models import Survey
+
+# Бюджеты запросов к БД на одну страницу админки
+SURVEY_CHANGELIST_MAX_QUERIES = 5
+SURVEY_CHANGE_MAX_QUERIES = 25
+DOCUMENT_CHANGELIST_MAX_QUERIES = 5
+
+
+@pytest.fixture(autouse=True)
+def _fake_yadisk_url():
+    """Ссылки Яндекс-диска в превью без обращения к API"""
+    with patch(
+        "questionnaire.admin.get_cached_yadisk_url",
+        return_value="https://fake-disk.local/file.png",
+    ):
+        yield
+
+
+@pytest.mark.django_db
+class TestAdminQueries:
+    """Бюджеты запросов к БД для страниц админки на большом объеме данных."""
+
+    def test_survey_changelist(
+        self,
+        superuser_client,
+        many_surveys: list[Survey],
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Список опросов"""
+        url = reverse("admin:questionnaire_survey_changelist")
+
+        with (
+            django_assert_max_num_queries(SURVEY_CHANGELIST_MAX_QUERIES),
+            wall_time("admin.survey_changelist"),
+        ):
+            response = superuser_client.get(url)
+
+        assert response.status_code == HTTP_200_OK
+
+    def test_survey_changelist_search(
+        self,
+        superuser_client,
+        many_surveys: list[Survey],
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Поиск в списке опросов"""
+        url = reverse("admin:questionnaire_survey_changelist")
+
+        with (
+            django_assert_max_num_queries(SURVEY_CHANGELIST_MAX_QUERIES),
+            wall_time("admin.survey_changelist_search"),
+        ):
+            response = superuser_client.get(url, {"q": "+79990000042"})
+
+        assert response.status_code == HTTP_200_OK
+
+    def test_survey_change(
+        self,
+        superuser_client,
+        many_surveys: list[Survey],
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Карточка опроса с документами и комментариями"""
+        url = reverse(
+            "admin:questionnaire_survey_change",
+            args=(many_surveys[-1].pk,),
+        )
+
+        with (
+            django_assert_max_num_queries(SURVEY_CHANGE_MAX_QUERIES),
+            wall_time("admin.survey_change"),
+        ):
+            response = superuser_client.get(url)
+
+        assert response.status_code == HTTP_200_OK
+
+    def test_document_changelist(
+        self,
+        superuser_client,
+        many_surveys: list[Survey],
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Список документов"""
+        url = reverse("admin:questionnaire_document_changelist")
+
+        with (
+            django_assert_max_num_queries(DOCUMENT_CHANGELIST_MAX_QUERIES),
+            wall_time("admin.document_changelist"),
+        ):
+            response = superuser_client.get(url)
+
+        assert response.status_code == HTTP_200_OK
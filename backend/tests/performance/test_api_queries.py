@@ -0,0 +1,169 @@
+import pytest
+from django.urls import reverse
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
+from rest_framework.test import APIClient
+
+from questionnaire.models import Document, Question, Survey
+
+# Бюджеты запросов к БД на один вызов эндпоинта
+CREATE_MAX_QUERIES = 4
+UPDATE_MAX_QUERIES = 8
+REVERT_MAX_QUERIES = 7
+LIST_MAX_QUERIES = 2
+PROCESSING_MAX_QUERIES = 5
+DOCS_LIST_MAX_QUERIES = 2
+DOCS_CREATE_MAX_QUERIES = 2
+
+BASE64_IMAGE = (
+    "data:image/png;base64,"
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAA"
+    "AADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+@pytest.mark.django_db
+class TestSurveyApiQueries:
+    """Бюджеты запросов к БД для эндпоинтов опросов."""
+
+    def test_create_existing_survey(
+        self,
+        authenticated_client: APIClient,
+        deep_survey: Survey,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Повторное создание опроса на большом опроснике"""
+        url = reverse("survey-list")
+
+        with (
+            django_assert_max_num_queries(CREATE_MAX_QUERIES),
+            wall_time("api.survey_create"),
+        ):
+            response = authenticated_client.post(url, {}, format="json")
+
+        assert response.status_code == HTTP_201_CREATED
+
+    def test_update_survey(
+        self,
+        authenticated_client: APIClient,
+        deep_survey: Survey,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Ответ на вопрос в середине большого опросника"""
+        url = reverse("survey-detail", kwargs={"pk": deep_survey.pk})
+
+        with (
+            django_assert_max_num_queries(UPDATE_MAX_QUERIES),
+            wall_time("api.survey_update"),
+        ):
+            response = authenticated_client.put(
+                url, {"answer": "Ответ 1"}, format="json"
+            )
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data["result"][-1] == "Ответ 1"
+
+    def test_revert_survey(
+        self,
+        authenticated_client: APIClient,
+        deep_survey: Survey,
+        large_questionnaire: list[Question],
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Откат вопроса в середине большого опросника"""
+        url = reverse("survey-revert", kwargs={"pk": deep_survey.pk})
+
+        with (
+            django_assert_max_num_queries(REVERT_MAX_QUERIES),
+            wall_time("api.survey_revert"),
+        ):
+            response = authenticated_client.patch(url, {}, format="json")
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data["revert_success"] is True
+
+    def test_list_surveys(
+        self,
+        authenticated_client: APIClient,
+        deep_survey: Survey,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Список опросов пользователя"""
+        url = reverse("survey-list")
+
+        with (
+            django_assert_max_num_queries(LIST_MAX_QUERIES),
+            wall_time("api.survey_list"),
+        ):
+            response = authenticated_client.get(url)
+
+        assert response.status_code == HTTP_200_OK
+
+    def test_processing_survey(
+        self,
+        authenticated_client: APIClient,
+        deep_survey: Survey,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Смена статуса опроса на <В обработке>"""
+        url = reverse("survey-processing", kwargs={"pk": deep_survey.pk})
+
+        with (
+            django_assert_max_num_queries(PROCESSING_MAX_QUERIES),
+            wall_time("api.survey_processing"),
+        ):
+            response = authenticated_client.patch(url, {}, format="json")
+
+        assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestDocumentApiQueries:
+    """Бюджеты запросов к БД для эндпоинтов документов."""
+
+    def test_list_documents(
+        self,
+        authenticated_client: APIClient,
+        deep_survey: Survey,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Список документов опроса"""
+        Document.objects.bulk_create(
+            Document(survey=deep_survey, image=f"app:/{number}.png")
+            for number in range(20)
+        )
+        url = reverse("document-list", kwargs={"survey_pk": deep_survey.pk})
+
+        with (
+            django_assert_max_num_queries(DOCS_LIST_MAX_QUERIES),
+            wall_time("api.document_list"),
+        ):
+            response = authenticated_client.get(url)
+
+        assert response.status_code == HTTP_200_OK
+
+    def test_create_document(
+        self,
+        authenticated_client: APIClient,
+        deep_survey: Survey,
+        fake_yandex_disk,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Загрузка документа с подменой Яндекс-диска"""
+        url = reverse("document-list", kwargs={"survey_pk": deep_survey.pk})
+
+        with (
+            django_assert_max_num_queries(DOCS_CREATE_MAX_QUERIES),
+            wall_time("api.document_create"),
+        ):
+            response = authenticated_client.post(
+                url, {"image": BASE64_IMAGE}, format="json"
+            )
+
+        assert response.status_code == HTTP_201_CREATED
@@ -0,0 +1,186 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import Document, Survey
+from telegram_bot.constant import MSG_REVERT_PREVIOUS_QUESTION
+from telegram_bot.history import SURVEY_STEPS_KEY
+from telegram_bot.router import route_text
+from telegram_bot.survey_handlers import (
+    handle_message,
+    start_command,
+    status_command,
+)
+
+# Бюджеты запросов к БД на одно входящее сообщение
+START_MAX_QUERIES = 3
+ANSWER_MAX_QUERIES = 9
+REVERT_MAX_QUERIES = 12
+STATUS_MAX_QUERIES = 3
+ROUTED_MAX_QUERIES = 0
+
+
+def _create_update(text: str) -> MagicMock:
+    """
+    Создание обновления Telegram с подменой ответов бота
+
+    Args:
+        text: текст сообщения пользователя
+
+    Returns:
+        MagicMock: обновление
+    """
+    update = MagicMock()
+    update.effective_user.id = 777
+    update.effective_user.username = "perf_user"
+    update.effective_user.first_name = "Perf"
+    update.effective_user.last_name = "User"
+    update.effective_chat.id = 777
+    update.message.message_id = 100
+    update.message.text = text
+    update.message.reply_text = AsyncMock()
+    update.message.reply_photo = AsyncMock()
+    update.message.reply_document = AsyncMock()
+    update.message.reply_media_group = AsyncMock()
+    return update
+
+
+@pytest.fixture(autouse=True)
+def telegram_user(user):
+    """Пользователь, уже знакомый боту"""
+    user.telegram_id = 777
+    user.save(update_fields=("telegram_id",))
+    return user
+
+
+@pytest.fixture
+def context() -> MagicMock:
+    """Контекст обработчика с подменой Bot API"""
+    context = MagicMock()
+    context.chat_data = {}
+    context.user_data = {}
+    context.bot.delete_message = AsyncMock()
+    context.bot.delete_messages = AsyncMock()
+    return context
+
+
+@pytest.mark.django_db
+class TestBotHandlerQueries:
+    """
+    Бюджеты запросов к БД для обработчиков бота.
+
+    Обработчики запускаются через async_to_sync, чтобы вызовы
+    sync_to_async выполнялись в основном потоке на том же соединении,
+    которое считает django_assert_max_num_queries.
+    """
+
+    def test_start_command(
+        self,
+        deep_survey: Survey,
+        context: MagicMock,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Команда /start на большом опроснике"""
+        update = _create_update("/start")
+
+        with (
+            django_assert_max_num_queries(START_MAX_QUERIES),
+            wall_time("bot.start_command"),
+        ):
+            async_to_sync(start_command)(update, context)
+
+        update.message.reply_text.assert_awaited()
+
+    def test_answer_message(
+        self,
+        deep_survey: Survey,
+        context: MagicMock,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Ответ на вопрос в середине большого опросника"""
+        update = _create_update("Ответ 1")
+
+        with (
+            django_assert_max_num_queries(ANSWER_MAX_QUERIES),
+            wall_time("bot.handle_message_answer"),
+        ):
+            async_to_sync(handle_message)(update, context)
+
+        deep_survey.refresh_from_db()
+        assert deep_survey.result[-1] == "Ответ 1"
+
+    def test_revert_message(
+        self,
+        deep_survey: Survey,
+        context: MagicMock,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Откат вопроса в середине большого опросника"""
+        update = _create_update(MSG_REVERT_PREVIOUS_QUESTION)
+        result_length = len(deep_survey.result)
+        context.chat_data[SURVEY_STEPS_KEY] = [[1], [10, 11], [12]]
+
+        with (
+            django_assert_max_num_queries(REVERT_MAX_QUERIES),
+            wall_time("bot.handle_message_revert"),
+        ):
+            async_to_sync(handle_message)(update, context)
+
+        deep_survey.refresh_from_db()
+        assert len(deep_survey.result) == result_length - 2
+        # Сообщения двух последних вопросов удаляются одним вызовом
+        context.bot.delete_messages.assert_awaited_once_with(
+            chat_id=777,
+            message_ids=[10, 11, 12, 100],
+        )
+        context.bot.delete_message.assert_not_awaited()
+
+    def test_status_command(
+        self,
+        deep_survey: Survey,
+        context: MagicMock,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Статус опроса с историей ответов и документами"""
+        Document.objects.bulk_create(
+            Document(survey=deep_survey, image=f"app:/{number}.png")
+            for number in range(10)
+        )
+        update = _create_update("/status")
+
+        with (
+            django_assert_max_num_queries(STATUS_MAX_QUERIES),
+            wall_time("bot.status_command"),
+        ):
+            async_to_sync(status_command)(update, context)
+
+        # История одним сообщением, альбом документов и помощь
+        assert update.message.reply_text.await_count == 2
+        update.message.reply_media_group.assert_awaited_once()
+
+    def test_routed_waiting_docs(
+        self,
+        deep_survey: Survey,
+        context: MagicMock,
+        django_assert_max_num_queries,
+        wall_time,
+    ):
+        """Текст при ожидании документов: статус известен после ответа"""
+        deep_survey.status = SurveyStatus.WAITING_DOCS.value
+        deep_survey.save(update_fields=("status",))
+        async_to_sync(route_text)(_create_update("Текст"), context)
+        update = _create_update("Текст")
+
+        with (
+            django_assert_max_num_queries(ROUTED_MAX_QUERIES),
+            wall_time("bot.route_text_waiting_docs"),
+        ):
+            async_to_sync(route_text)(update, context)
+
+        update.message.reply_text.assert_awaited_once()
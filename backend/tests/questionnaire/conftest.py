@@ -0,0 +1,26 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import Question, Survey
+
+User = get_user_model()
+
+
+@pytest.fixture
+def survey() -> Survey:
+    """
+    Опрос на этапе стартового вопроса
+
+    Returns:
+        Survey: опрос
+    """
+    question = Question.objects.create(text="Начнем?", type="start")
+    return Survey.objects.create(
+        user=User.objects.create_user(username="owner", password="pass"),
+        current_question=question,
+        status=SurveyStatus.FILLING_SURVEY.value,
+        result=["Начнем?", "Да"],
+        questions_version_uuid=question.updated_uuid,
+        updated_at=question.updated_at,
+    )
@@ -0,0 +1,86 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import QuerySet
+
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import AnswerChoice, Comment, Question, Survey
+
+User = get_user_model()
+
+
+def _plan(queryset: QuerySet) -> str:
+    """
+    План выполнения запроса.
+
+    В PostgreSQL на почти пустых таблицах последовательное чтение
+    дешевле индекса, поэтому оно отключается.
+
+    Args:
+        queryset: запрос
+
+    Returns:
+        str: план выполнения
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+@pytest.mark.django_db
+class TestHotQueryIndexes:
+    """Частые запросы используют индексы"""
+
+    @pytest.fixture
+    def user(self) -> User:
+        return User.objects.create(username="indexes")
+
+    @pytest.fixture
+    def survey(self, user) -> Survey:
+        return Survey.objects.create(user=user)
+
+    def test_question_type(self):
+        """Стартовый вопрос по типу"""
+        plan = _plan(Question.objects.filter(type="start"))
+
+        assert "questionnaire_question_type" in plan
+
+    def test_custom_answer(self):
+        """
+        Пользовательский вариант ответа (answer IS NULL) ищется по
+        индексу уникального ограничения (current_question, answer)
+        """
+        question = Question.objects.create(text="Вопрос?")
+
+        plan = _plan(
+            AnswerChoice.objects.filter(current_question=question, answer=None)
+        )
+
+        # В SQLite ограничение создается вместе с таблицей (autoindex)
+        assert (
+            "unique_last_question_answer" in plan
+            or "autoindex_questionnaire_answerchoice" in plan
+        )
+
+    def test_user_surveys(self, user, survey):
+        """Опросы пользователя, новые первыми"""
+        plan = _plan(Survey.objects.filter(user=user).order_by("-created_at"))
+
+        assert "survey_user_created_idx" in plan
+
+    def test_status_surveys(self, survey):
+        """Фильтр админки по статусу с сортировкой по дате"""
+        plan = _plan(
+            Survey.objects.filter(
+                status=SurveyStatus.WAITING_DOCS.value
+            ).order_by("-created_at")
+        )
+
+        assert "survey_status_created_idx" in plan
+
+    def test_survey_comments(self, survey):
+        """Комментарии опроса, новые первыми"""
+        plan = _plan(Comment.objects.filter(survey=survey))
+
+        assert "comment_survey_created_idx" in plan
@@ -0,0 +1,66 @@
+import pytest
+from django.urls import reverse
+
+from questionnaire.models import AnswerChoice, Question
+
+
+@pytest.mark.django_db
+class TestAnswerChoiceManagers:
+    """Тесты менеджеров вариантов ответа"""
+
+    @pytest.fixture
+    def questions(self) -> tuple[Question, Question]:
+        start = Question.objects.create(text="Начнем?", type="start")
+        question = Question.objects.create(text="Еще документ?")
+        AnswerChoice.objects.create(
+            current_question=question,
+            next_question=None,
+            answer="Нет",
+        )
+        AnswerChoice.objects.create(
+            current_question=question,
+            next_question=question,
+            answer="Да",
+        )
+        AnswerChoice.objects.create(
+            current_question=start,
+            next_question=question,
+            answer="Начать",
+        )
+        return start, question
+
+    def test_default_manager_lean(self, questions):
+        """Поиск ответа по вопросу - без соединения и сортировки"""
+        _, question = questions
+
+        sql = str(question.answers.filter(answer="Да").query).upper()
+
+        assert "JOIN" not in sql
+        assert "CASE" not in sql
+        assert "ORDER BY" not in sql
+
+    def test_question_order(self, questions):
+        """Ответы вопроса в порядке опросника: рекурсивный раньше"""
+        _, question = questions
+
+        assert question.answers.in_questionnaire_order().first().answer == (
+            "Да"
+        )
+        assert question.answers.order_by("pk").first().answer == "Нет"
+
+    def test_admin_ordering(self, questions):
+        """Порядок опросника: стартовый вопрос, рекурсивные, остальные"""
+        assert list(
+            AnswerChoice.admin_objects.values_list("answer", flat=True)
+        ) == ["Начать", "Да", "Нет"]
+
+    def test_admin_changelist(self, admin_client, questions):
+        """Список в админке в порядке опросника"""
+        response = admin_client.get(
+            reverse("admin:questionnaire_answerchoice_changelist"),
+        )
+
+        assert response.status_code == 200
+        assert [
+            choice.answer for choice in response.context["cl"].result_list
+        ] == ["Начать", "Да", "Нет"]
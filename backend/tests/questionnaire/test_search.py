@@ -0,0 +1,145 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import Survey
+from questionnaire.search import fill_missing_user_search, search_filter
+
+User = get_user_model()
+
+CHANGELIST_URL = "admin:questionnaire_survey_changelist"
+
+
+@pytest.fixture
+def author(survey) -> User:
+    """
+    Автор опроса с заполненными данными
+
+    Returns:
+        User: пользователь
+    """
+    user = survey.user
+    user.first_name = "Мария"
+    user.last_name = "Иванова"
+    user.email = "maria@example.com"
+    user.phone_number = "+7 (912) 345-67-89"
+    user.telegram_username = "maria_tg"
+    user.save()
+    return user
+
+
+@pytest.mark.django_db
+class TestSurveySearchFields:
+    """Тесты заполнения данных для поиска опросов"""
+
+    def test_filled_on_create(self, survey):
+        """Ответы и данные пользователя заполняются при создании"""
+        assert survey.search_answers == "да"
+        assert survey.search_user == ""
+
+    @pytest.fixture
+    def bare_user_survey(self, survey) -> Survey:
+        """Опрос пользователя из JWT без состояния"""
+        user = User.objects.create_user(
+            username="jwt", password="pass", last_name="Петров"
+        )
+        return Survey(
+            user=User(pk=user.pk),
+            current_question=survey.current_question,
+            status=SurveyStatus.FILLING_SURVEY.value,
+            result=[],
+            questions_version_uuid=survey.questions_version_uuid,
+            updated_at=survey.updated_at,
+        )
+
+    def test_bare_user_filled_after_commit(
+        self, bare_user_survey, django_capture_on_commit_callbacks
+    ):
+        """Опрос пользователя из JWT создается без чтения пользователя,
+        его данные заполняются после фиксации транзакции"""
+        with django_capture_on_commit_callbacks(execute=True):
+            bare_user_survey.save()
+            assert bare_user_survey.search_user is None
+
+        bare_user_survey.refresh_from_db()
+        assert bare_user_survey.search_user == "петров"
+
+    def test_fill_missing_batches(self, bare_user_survey):
+        """Незаполненные опросы заполняются пачками не больше limit"""
+        bare_user_survey.save()
+        Survey.objects.update(search_user=None)
+
+        assert fill_missing_user_search(limit=1) == 1
+        assert fill_missing_user_search(limit=1) == 1
+        assert fill_missing_user_search(limit=1) == 0
+
+    def test_fill_command(self, bare_user_survey):
+        """Команда заполняет все опросы без данных пользователя"""
+        bare_user_survey.save()
+        out = StringIO()
+
+        call_command("fill_survey_search", "--batch-size=1", stdout=out)
+
+        assert "Заполнено опросов: 1" in out.getvalue()
+        bare_user_survey.refresh_from_db()
+        assert bare_user_survey.search_user == "петров"
+
+    def test_answers_updated(self, survey):
+        """Ответы обновляются и при сохранении только результатов"""
+        survey.result = ["Начнем?", "Да", "Город?", "Казань"]
+        survey.save(update_fields=["result"])
+
+        survey.refresh_from_db()
+        assert survey.search_answers == "да казань"
+
+    def test_user_update_refreshes_surveys(self, survey, author):
+        """Изменение пользователя обновляет его опросы"""
+        survey.refresh_from_db()
+        assert "иванова" in survey.search_user
+        assert "79123456789" in survey.search_user
+
+    def test_unrelated_user_update_skipped(
+        self, survey, author, django_assert_num_queries
+    ):
+        """Сохранение других полей пользователя опросы не трогает
+        (второй запрос - сброс кеша токенов)"""
+        with django_assert_num_queries(2):
+            author.save(update_fields=["last_login"])
+
+
+@pytest.mark.django_db
+class TestSurveyAdminSearch:
+    """Тесты поиска опросов в админке"""
+
+    def search(self, admin_client, term: str) -> list[Survey]:
+        response = admin_client.get(reverse(CHANGELIST_URL), {"q": term})
+        assert response.status_code == 200
+        return list(response.context["cl"].result_list)
+
+    @pytest.mark.parametrize(
+        "term",
+        (
+            "ИВАНОВА",
+            "мария иванова",
+            "Maria@Example.com",
+            "8 912 345 67 89",
+            "345-67",
+            "maria_tg",
+            "да",
+        ),
+    )
+    def test_found(self, admin_client, survey, author, term):
+        """Опрос находится по ФИО, почте, телефону, Telegram и ответу"""
+        assert self.search(admin_client, term) == [survey]
+
+    def test_not_found(self, admin_client, survey, author):
+        """Все слова запроса должны совпасть"""
+        assert self.search(admin_client, "иванова петрова") == []
+
+    def test_empty_term(self):
+        """Пустой запрос не добавляет условий"""
+        assert not search_filter("   ")
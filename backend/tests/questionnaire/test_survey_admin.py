@@ -0,0 +1,135 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from questionnaire.comments import render_survey_comments
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import Comment, Document, Survey
+
+CHANGELIST_URL = "admin:questionnaire_survey_changelist"
+
+
+@pytest.mark.django_db
+class TestSurveyAdminChangelist:
+    """Тесты списка опросов в админке"""
+
+    @pytest.fixture
+    def survey_with_files(self, survey, admin_user) -> Survey:
+        for i in range(3):
+            Document.objects.create(survey=survey, image=f"app:/{i}.jpg")
+        for i in range(2):
+            Comment.objects.create(
+                survey=survey, user=admin_user, text=f"Комментарий {i}"
+            )
+        return survey
+
+    def test_counts_annotated(self, admin_client, survey_with_files):
+        """Количества считаются в БД без загрузки документов и
+        комментариев и без результатов опроса"""
+        with CaptureQueriesContext(connection) as queries:
+            response = admin_client.get(reverse(CHANGELIST_URL))
+
+        assert response.status_code == 200
+        (row,) = response.context["cl"].result_list
+        assert (row.documents_total, row.comments_total) == (3, 2)
+        sql = " ".join(query["sql"] for query in queries)
+        assert '"questionnaire_survey"."result"' not in sql
+        assert 'FROM "questionnaire_document"' not in sql
+        assert 'FROM "questionnaire_comment"' not in sql
+
+    def test_order_by_count(self, admin_client, survey_with_files):
+        """Сортировка по количеству документов"""
+        response = admin_client.get(reverse(CHANGELIST_URL), {"o": "4"})
+
+        assert response.status_code == 200
+
+    def test_action_full_objects(self, admin_client, survey_with_files):
+        """Действия над списком получают опросы без группировки"""
+        response = admin_client.post(
+            reverse(CHANGELIST_URL),
+            {
+                "action": "mark_completed",
+                "_selected_action": [survey_with_files.pk],
+            },
+        )
+
+        assert response.status_code == 302
+        survey_with_files.refresh_from_db()
+        assert survey_with_files.status == SurveyStatus.COMPLETED.value
+
+    def test_change_view(self, admin_client, survey_with_files):
+        """Карточка опроса загружается полностью"""
+        response = admin_client.get(
+            reverse(
+                "admin:questionnaire_survey_change",
+                args=(survey_with_files.pk,),
+            )
+        )
+
+        assert response.status_code == 200
+        assert "Да" in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestSurveyAdminComments:
+    """Тесты списка комментариев в карточке опроса"""
+
+    @pytest.fixture(autouse=True)
+    def _limit(self, settings):
+        settings.ADMIN_COMMENTS_LIMIT = 3
+
+    @pytest.fixture
+    def comments(self, survey, admin_user) -> list[Comment]:
+        return [
+            Comment.objects.create(
+                survey=survey, user=admin_user, text=f"Комментарий {i}"
+            )
+            for i in range(5)
+        ]
+
+    def test_latest_window(self, survey, comments):
+        """Последние комментарии и ссылка на остальные"""
+        html = render_survey_comments(survey.pk)
+
+        assert "Комментарий 4" in html
+        assert "Комментарий 2" in html
+        assert "Комментарий 1" not in html
+        assert "Показать все комментарии (5)" in html
+        assert f"survey__id__exact={survey.pk}" in html
+
+    def test_no_comments(self, survey):
+        """Без комментариев фрагмент не строится"""
+        assert render_survey_comments(survey.pk) is None
+
+    def test_constant_queries(
+        self, survey, comments, django_assert_num_queries
+    ):
+        """Два запроса без кеша и один - из кеша"""
+        with django_assert_num_queries(2):
+            render_survey_comments(survey.pk)
+        with django_assert_num_queries(1):
+            render_survey_comments(survey.pk)
+
+    def test_new_comment_changes_key(self, survey, comments, admin_user):
+        """Новый комментарий виден сразу"""
+        render_survey_comments(survey.pk)
+        Comment.objects.create(survey=survey, user=admin_user, text="Новый")
+
+        assert "Новый" in render_survey_comments(survey.pk)
+
+    def test_edit_invalidates(self, survey, comments):
+        """Измененный комментарий виден сразу"""
+        render_survey_comments(survey.pk)
+        comments[-1].text = "Исправлено"
+        comments[-1].save()
+
+        assert "Исправлено" in render_survey_comments(survey.pk)
+
+    def test_escaped(self, survey, admin_user):
+        """Текст комментария экранируется"""
+        Comment.objects.create(
+            survey=survey, user=admin_user, text="<script>x</script>"
+        )
+
+        assert "<script>" not in render_survey_comments(survey.pk)
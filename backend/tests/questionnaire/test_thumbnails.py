@@ -0,0 +1,202 @@
+import os
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.urls import reverse
+from PIL import Image
+
+from questionnaire.models import Document
+from questionnaire.thumbnails import (
+    evict,
+    get_thumbnail,
+    placeholder,
+    shutdown_thumbnail_executor,
+    thumbnail_path,
+)
+
+
+def _jpeg(size: tuple[int, int]) -> bytes:
+    output = BytesIO()
+    Image.new("RGB", size, "blue").save(output, "JPEG")
+    return output.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def _thumbnail_settings(settings, tmp_path):
+    settings.THUMBNAIL_CACHE_DIR = tmp_path
+    settings.THUMBNAIL_ACCEL_REDIRECT = ""
+    settings.IMAGE_PROCESS_WORKERS = 0
+    settings.IMAGE_THUMBNAIL_SIZE = 40
+    settings.THUMBNAIL_BUILD_WORKERS = 0
+    yield
+    shutdown_thumbnail_executor()
+
+
+@pytest.fixture
+def disk():
+    """Подмена Яндекс-диска: ссылка на скачивание и файл изображения"""
+    response = MagicMock()
+    response.content = _jpeg((400, 200))
+    with (
+        patch(
+            "questionnaire.thumbnails.get_cached_yadisk_url",
+            return_value="https://fake-disk.local/file",
+        ),
+        patch(
+            "questionnaire.thumbnails.requests.get",
+            return_value=response,
+        ) as mock_get,
+    ):
+        yield mock_get
+
+
+@pytest.mark.django_db
+class TestThumbnailCache:
+    """Тесты кеша миниатюр документов"""
+
+    def test_generated_once(self, survey, disk):
+        """Тест: миниатюра создается при первом обращении"""
+        document = Document.objects.create(survey=survey, image="app:/a.jpg")
+
+        path = get_thumbnail(document)
+        assert get_thumbnail(document) == path
+
+        disk.assert_called_once()
+        with Image.open(path) as image:
+            assert image.size == (40, 20)
+
+    def test_stored_thumbnail_downloaded(self, survey, disk):
+        """Тест: скачивается готовая миниатюра, а не оригинал"""
+        document = Document.objects.create(
+            survey=survey,
+            image="app:/a.jpg",
+            thumbnail="app:/a_thumb.jpg",
+        )
+
+        with patch(
+            "questionnaire.thumbnails.get_cached_yadisk_url",
+            return_value="https://fake-disk.local/thumb",
+        ) as get_url:
+            get_thumbnail(document)
+
+        get_url.assert_called_once_with("app:/a_thumb.jpg")
+
+    def test_pdf_icon(self, survey, disk):
+        """Тест: для PDF создается значок без скачивания файла"""
+        document = Document.objects.create(survey=survey, image="app:/a.pdf")
+
+        path = get_thumbnail(document)
+
+        disk.assert_not_called()
+        with Image.open(path) as image:
+            assert image.size == (40, 40)
+
+    def test_evict_least_recently_used(self, survey, disk):
+        """Тест: вытесняются давно не использованные миниатюры"""
+        documents = [
+            Document.objects.create(survey=survey, image=f"app:/{i}.jpg")
+            for i in range(3)
+        ]
+        paths = [get_thumbnail(document) for document in documents]
+        for age, path in zip((300, 100, 200), paths):
+            os.utime(path, (0, path.stat().st_mtime - age))
+        sizes = [path.stat().st_size for path in paths]
+
+        removed = evict(max_bytes=sum(sizes) - 1)
+
+        assert removed == 1
+        assert not paths[0].exists()
+        assert paths[1].exists() and paths[2].exists()
+
+
+@pytest.mark.django_db
+class TestThumbnailView:
+    """Тесты отдачи миниатюр в админке"""
+
+    @staticmethod
+    def _url(document: Document) -> str:
+        return reverse(
+            "admin:questionnaire_document_thumbnail",
+            args=(document.pk,),
+        )
+
+    def test_file_response(self, admin_client, survey, disk):
+        """Тест: без nginx миниатюру отдает Django с долгим кешем"""
+        document = Document.objects.create(survey=survey, image="app:/a.jpg")
+
+        response = admin_client.get(self._url(document))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/jpeg"
+        assert "immutable" in response["Cache-Control"]
+        assert "private" in response["Cache-Control"]
+        assert b"".join(response.streaming_content) == (
+            thumbnail_path(document).read_bytes()
+        )
+
+    def test_accel_redirect(self, admin_client, survey, disk, settings):
+        """Тест: с THUMBNAIL_ACCEL_REDIRECT файл отдает nginx"""
+        settings.THUMBNAIL_ACCEL_REDIRECT = "/protected-thumbnails/"
+        document = Document.objects.create(survey=survey, image="app:/a.jpg")
+
+        response = admin_client.get(self._url(document))
+
+        path = thumbnail_path(document)
+        assert response.status_code == 200
+        assert response["X-Accel-Redirect"] == (
+            f"/protected-thumbnails/{path.parent.name}/{path.name}"
+        )
+        assert response.content == b""
+
+    def test_file_unavailable(self, admin_client, survey):
+        """Тест: недоступный файл - 404, в кеш ничего не пишется"""
+        document = Document.objects.create(survey=survey, image="app:/a.jpg")
+
+        with patch(
+            "questionnaire.thumbnails.get_cached_yadisk_url",
+            return_value=None,
+        ):
+            response = admin_client.get(self._url(document))
+
+        assert response.status_code == 404
+        assert not thumbnail_path(document).exists()
+
+    def test_built_in_background(self, admin_client, survey, disk, settings):
+        """Тест: при промахе сразу отдается значок без кеширования,
+        миниатюра строится в фоне"""
+        settings.THUMBNAIL_BUILD_WORKERS = 1
+        document = Document.objects.create(survey=survey, image="app:/a.jpg")
+
+        response = admin_client.get(self._url(document))
+
+        assert response.status_code == 200
+        assert response.content == placeholder(document)
+        assert "no-store" in response["Cache-Control"]
+        shutdown_thumbnail_executor()
+        disk.assert_called_once()
+        response = admin_client.get(self._url(document))
+        assert "immutable" in response["Cache-Control"]
+        assert b"".join(response.streaming_content) == (
+            thumbnail_path(document).read_bytes()
+        )
+
+    def test_pdf_not_deferred(self, admin_client, survey, disk, settings):
+        """Тест: значок PDF строится сразу, без фона"""
+        settings.THUMBNAIL_BUILD_WORKERS = 1
+        document = Document.objects.create(survey=survey, image="app:/a.pdf")
+
+        response = admin_client.get(self._url(document))
+
+        assert "immutable" in response["Cache-Control"]
+        assert thumbnail_path(document).exists()
+
+    def test_not_staff(self, client, survey, disk):
+        """Тест: миниатюры доступны только персоналу"""
+        document = Document.objects.create(survey=survey, image="app:/a.jpg")
+        client.force_login(survey.user)
+
+        response = client.get(self._url(document))
+
+        assert response.status_code == 302
+        disk.assert_not_called()
@@ -0,0 +1,62 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from common.utils.benchmark import (
+    latency_histogram,
+    latency_summary,
+    percentile,
+)
+
+
+class TestBenchmarkUtils:
+    """Тесты расчета статистики нагрузочных прогонов"""
+
+    def test_percentile(self):
+        """Перцентиль по ближайшему рангу"""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+    def test_latency_summary(self):
+        """Сводка задержек в миллисекундах"""
+        summary = latency_summary([0.01, 0.02, 0.03])
+
+        assert summary["count"] == 3
+        assert summary["p50_ms"] == 20.0
+        assert summary["max_ms"] == 30.0
+
+    def test_latency_histogram(self):
+        """Распределение задержек по корзинам"""
+        histogram = latency_histogram([0.001, 0.02, 0.02, 10.0], (5, 25))
+
+        assert histogram == {"<=5": 1, "<=25": 2, "+inf": 1}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBenchBotCommand:
+    """Тесты команды нагрузочного прогона бота"""
+
+    def test_virtual_users_complete_survey(self):
+        """Виртуальные пользователи проходят опросник без ошибок"""
+        out = StringIO()
+
+        call_command(
+            "bench_bot",
+            users=2,
+            current_db=True,
+            json=True,
+            stdout=out,
+        )
+
+        report = json.loads(out.getvalue())
+        assert report["error_replies"] == 0
+        assert report["latency"]["processing"]["count"] == 2
+        assert report["updates"] == report["latency"]["all"]["count"]
+        assert report["queries"]["total"] > 0
+        assert report["api_calls"]["getMe"] == 1
@@ -12,6 +12,7 @@ from telegram import (
 from telegram.ext import ContextTypes
 
 from telegram_bot.bot import TelegramBot
+from telegram_bot.router import route_text
 from telegram_bot.survey_handlers import handle_message
 from questionnaire.constant import TelegramCommand, SurveyStatus
 from telegram_bot.menu_handlers import _get_default_help_keyboard
@@ -58,7 +59,7 @@ class TestTelegramBot(TestCase):
         return mock_context
 
     @pytest.mark.asyncio
-    @patch("telegram_bot.sync_to_async.get_or_create_user")
+    @patch("telegram_bot.survey_handlers.load_survey_state")
     async def test_handle_message_exception(self, mock_get_user):
         """Тест обработки исключения в handle_message"""
         # Arrange
@@ -87,17 +88,15 @@ class TestTelegramBot(TestCase):
         handlers = self.bot.application.handlers[0]
 
         # Assert
-        assert len(handlers) == 7
+        assert len(handlers) == 3
 
         # Проверяем типы обработчиков
         handler_types = [type(handler).__name__ for handler in handlers]
-        assert "MessageHandler" == handler_types[0]
+        assert "CommandHandler" == handler_types[0]
         assert "MessageHandler" == handler_types[1]
         assert "MessageHandler" == handler_types[2]
-        assert "MessageHandler" == handler_types[3]
-        assert "CommandHandler" == handler_types[4]
-        assert "MessageHandler" == handler_types[5]
-        assert "MessageHandler" == handler_types[6]
+        # Текст разбирает один маршрутизатор
+        assert handlers[2].callback is route_text
 
 
 class TestKeyboardFunctions:
@@ -146,13 +145,13 @@ class TestKeyboardFunctions:
 
     def test_get_reply_markup_with_answers(self):
         """Тест создания клавиатуры с ответами"""
-        from telegram_bot.survey_handlers import _get_reply_markup
+        from telegram_bot.keyboards import _build_answers_keyboard
 
         # Arrange
         answers = ["Ответ 1", "Ответ 2", "Ответ 3"]
 
         # Act
-        markup = _get_reply_markup(answers)
+        markup = _build_answers_keyboard(answers)
 
         # Assert
         assert markup is not None
@@ -168,10 +167,10 @@ class TestKeyboardFunctions:
 
     def test_get_reply_markup_empty_answers(self):
         """Тест создания клавиатуры без ответов"""
-        from telegram_bot.survey_handlers import _get_reply_markup
+        from telegram_bot.keyboards import _build_answers_keyboard
 
         # Act
-        markup = _get_reply_markup([])
+        markup = _build_answers_keyboard([])
 
         # Assert
         assert markup == ReplyKeyboardMarkup(
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+import pytest
+from django.test import override_settings
+
+from telegram_bot.db_executor import (
+    db_sync_to_async,
+    get_db_executor,
+    shutdown_db_executor,
+)
+
+
+@db_sync_to_async
+def _current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+@pytest.fixture(autouse=True)
+def _reset_db_executor():
+    """Остановка пула после каждого теста"""
+    yield
+    shutdown_db_executor()
+
+
+class TestDbExecutor:
+    """Тесты пула потоков БД для бота"""
+
+    @override_settings(TELEGRAM_DB_POOL_SIZE=0)
+    async def test_pool_disabled(self):
+        """Без пула вызовы идут в общий поток sync_to_async"""
+        assert get_db_executor() is None
+
+        thread_name = await _current_thread_name()
+
+        assert not thread_name.startswith("telegram-db")
+
+    @override_settings(TELEGRAM_DB_POOL_SIZE=2)
+    async def test_pool_enabled(self):
+        """С пулом вызовы выполняются в потоках пула"""
+        thread_name = await _current_thread_name()
+
+        assert thread_name.startswith("telegram-db")
+        assert get_db_executor() is get_db_executor()
+
+    @override_settings(TELEGRAM_DB_POOL_SIZE=2)
+    async def test_parallel_calls(self):
+        """Вызовы разных пользователей выполняются параллельно"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        @db_sync_to_async
+        def wait_other_user() -> bool:
+            barrier.wait()
+            return True
+
+        results = await asyncio.gather(wait_other_user(), wait_other_user())
+
+        assert results == [True, True]
+
+    @override_settings(TELEGRAM_DB_POOL_SIZE=2)
+    def test_shutdown(self):
+        """Остановка пула создает новый пул при следующем обращении"""
+        executor = get_db_executor()
+
+        shutdown_db_executor()
+
+        assert get_db_executor() is not executor
@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from telegram.error import BadRequest
+
+from telegram_bot.history import (
+    SURVEY_STEPS_KEY,
+    add_to_step,
+    delete_messages,
+    pop_steps,
+    reset_steps,
+    start_step,
+)
+
+
+class TestSurveySteps:
+    """Тесты истории сообщений опроса в чате"""
+
+    def test_steps(self):
+        """Сообщения группируются по вопросам"""
+        chat_data = {}
+
+        add_to_step(chat_data, 1)
+        start_step(chat_data, 2)
+        add_to_step(chat_data, 3, 4)
+        start_step(chat_data, 5)
+
+        assert chat_data[SURVEY_STEPS_KEY] == [[1], [2, 3, 4], [5]]
+        assert pop_steps(chat_data, 2) == [2, 3, 4, 5]
+        assert chat_data[SURVEY_STEPS_KEY] == [[1]]
+
+    def test_pop_more_than_saved(self):
+        """Удаляются только известные сообщения"""
+        chat_data = {}
+
+        assert pop_steps(chat_data, 2) == []
+        start_step(chat_data, 7)
+        assert pop_steps(chat_data, 2) == [7]
+
+    def test_reset_and_limit(self):
+        """История сбрасывается и не растет бесконечно"""
+        chat_data = {}
+        for message_id in range(100):
+            start_step(chat_data, message_id)
+
+        assert len(chat_data[SURVEY_STEPS_KEY]) == 50
+
+        reset_steps(chat_data)
+        assert chat_data[SURVEY_STEPS_KEY] == []
+
+
+class TestDeleteMessages:
+    """Тесты удаления сообщений"""
+
+    async def test_batch(self):
+        """Сообщения удаляются одним вызовом"""
+        bot = MagicMock()
+        bot.delete_messages = AsyncMock(return_value=True)
+        bot.delete_message = AsyncMock()
+
+        await delete_messages(bot, 1, [10, 11])
+
+        bot.delete_messages.assert_awaited_once_with(
+            chat_id=1, message_ids=[10, 11]
+        )
+        bot.delete_message.assert_not_awaited()
+
+    async def test_fallback(self):
+        """При ошибке сообщения удаляются по одному"""
+        bot = MagicMock()
+        bot.delete_messages = AsyncMock(side_effect=BadRequest("error"))
+        bot.delete_message = AsyncMock(
+            side_effect=[True, BadRequest("not found"), True]
+        )
+
+        await delete_messages(bot, 1, [10, 11, 12])
+
+        assert bot.delete_message.await_count == 3
+
+    async def test_empty(self):
+        """Без сообщений Bot API не вызывается"""
+        bot = MagicMock()
+        bot.delete_messages = AsyncMock()
+
+        await delete_messages(bot, 1, [])
+
+        bot.delete_messages.assert_not_awaited()
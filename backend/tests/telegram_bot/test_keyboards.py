@@ -0,0 +1,129 @@
+
+from django.test import override_settings
+
+from questionnaire.cache import (
+    RevisionMemo,
+    get_question_answers,
+    get_revision,
+    get_start_question,
+)
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import AnswerChoice, Question
+from telegram_bot.constant import MSG_REVERT_PREVIOUS_QUESTION
+from telegram_bot.keyboards import EMPTY_KEYBOARD, get_question_keyboard
+from telegram_bot.menu_handlers import _get_default_help_keyboard
+
+
+def _create_question(*answers: str) -> Question:
+    """Вопрос с вариантами ответа"""
+    question = Question.objects.create(text="Вопрос?")
+    for answer in answers:
+        AnswerChoice.objects.create(current_question=question, answer=answer)
+    return question
+
+
+class TestQuestionnaireCache:
+    """Тесты кеша вариантов ответа"""
+
+    def test_answers_cached(self, django_assert_num_queries):
+        """Повторное чтение без запросов к БД"""
+        question = _create_question("Да", "Нет")
+
+        with django_assert_num_queries(1):
+            assert get_question_answers(question.id) == ["Да", "Нет"]
+        with django_assert_num_queries(0):
+            assert get_question_answers(question.id) == ["Да", "Нет"]
+
+    def test_revision_bumped(self):
+        """Изменение ответов меняет ревизию и сбрасывает кеш"""
+        question = _create_question("Да")
+        get_question_answers(question.id)
+        revision = get_revision()
+
+        AnswerChoice.objects.create(current_question=question, answer="Нет")
+
+        assert get_revision() > revision
+        assert get_question_answers(question.id) == ["Да", "Нет"]
+
+        AnswerChoice.objects.filter(answer="Да").delete()
+
+        assert get_question_answers(question.id) == ["Нет"]
+
+    def test_start_question(self, django_assert_num_queries):
+        """Стартовый вопрос читается из БД один раз на ревизию"""
+        question = Question.objects.create(text="Начнем?", type="start")
+
+        with django_assert_num_queries(1):
+            first = get_start_question()
+        with django_assert_num_queries(0):
+            second = get_start_question()
+
+        # Копии: изменение текста сериализатором не попадает в кеш
+        assert first == second == question
+        first.text = "Некорректный ответ. " + first.text
+        assert get_start_question().text == "Начнем?"
+
+        question.text = "Начнем опрос?"
+        question.save()
+
+        assert get_start_question().text == "Начнем опрос?"
+
+    @override_settings(QUESTIONNAIRE_CACHE_TIMEOUT=0)
+    def test_memo_timeout(self):
+        """Значения в памяти процесса живут не дольше таймаута"""
+        memo = RevisionMemo()
+
+        assert memo.get_or_build("key", object) is not memo.get_or_build(
+            "key", object
+        )
+
+
+class TestKeyboards:
+    """Тесты клавиатур бота"""
+
+    def test_question_keyboard_memoized(self):
+        """Клавиатура вопроса строится один раз на ревизию"""
+        question = _create_question("Да", "Нет")
+        answers = get_question_answers(question.id)
+
+        keyboard = get_question_keyboard(question.id, answers)
+
+        assert get_question_keyboard(question.id, answers) is keyboard
+        assert [
+            [button.text for button in row] for row in keyboard.keyboard
+        ] == [["Да"], ["Нет"]]
+
+        question.save()
+
+        assert get_question_keyboard(question.id, answers) is not keyboard
+
+    @override_settings(QUESTIONNAIRE_CACHE_TIMEOUT=0)
+    def test_question_keyboard_timeout(self):
+        """Без смены ревизии клавиатура перестраивается по таймауту:
+        изменения из админки в другом процессе не теряются"""
+        question = _create_question("Да", "Нет")
+        answers = get_question_answers(question.id)
+
+        keyboard = get_question_keyboard(question.id, answers)
+
+        assert get_question_keyboard(question.id, answers) is not keyboard
+
+    def test_revert_button(self):
+        """Кнопка возврата - отдельная клавиатура"""
+        question = _create_question("Да")
+
+        keyboard = get_question_keyboard(question.id, ["Да"], show_revert=True)
+
+        assert keyboard is not get_question_keyboard(question.id, ["Да"])
+        assert keyboard.keyboard[1][0].text == MSG_REVERT_PREVIOUS_QUESTION
+
+    def test_empty_keyboard(self):
+        """Без вариантов ответа - пустая клавиатура"""
+        assert get_question_keyboard(None, ["Да"]) is EMPTY_KEYBOARD
+        assert get_question_keyboard(1, []) is EMPTY_KEYBOARD
+
+    def test_status_keyboard_memoized(self):
+        """Клавиатура статуса строится один раз"""
+        assert _get_default_help_keyboard(
+            SurveyStatus.WAITING_DOCS
+        ) is _get_default_help_keyboard(SurveyStatus.WAITING_DOCS)
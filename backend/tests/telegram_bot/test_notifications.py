@@ -0,0 +1,148 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from telegram.error import Forbidden, NetworkError
+
+from questionnaire.constant import SurveyStatus
+from questionnaire.models import Survey
+from telegram_bot.constant import (
+    NOTIFICATION_FAILED,
+    NOTIFICATION_PENDING,
+    NOTIFICATION_SENT,
+)
+from telegram_bot.models import Notification
+from telegram_bot.notifications import (
+    NotificationSender,
+    enqueue_status_notifications,
+    status_text,
+)
+
+User = get_user_model()
+
+
+def _create_survey(username: str, chat_id: int | None = None) -> Survey:
+    """
+    Опрос пользователя (знакомого боту, если задан chat_id)
+
+    Args:
+        username: имя пользователя
+        chat_id: идентификатор пользователя Telegram
+
+    Returns:
+        Survey: опрос
+    """
+    user = User.objects.create(username=username, telegram_id=chat_id)
+    return Survey.objects.create(
+        user=user,
+        status=SurveyStatus.SURVEY_COMPLETED.value,
+    )
+
+
+class TestEnqueueNotifications:
+    """Тесты постановки уведомлений в очередь"""
+
+    def test_enqueue(self):
+        """Уведомления только пользователям с чатом"""
+        _create_survey("with_chat", chat_id=1)
+        _create_survey("without_chat")
+
+        count = enqueue_status_notifications(
+            Survey.objects.all(),
+            SurveyStatus.COMPLETED.value,
+        )
+
+        assert count == 1
+        notification = Notification.objects.get()
+        assert notification.chat_id == 1
+        assert notification.status == NOTIFICATION_PENDING
+        assert notification.text == status_text(SurveyStatus.COMPLETED.value)
+
+    def test_admin_bulk_action(self, admin_client):
+        """Массовая смена статуса в админке ставит уведомления в очередь"""
+        surveys = [
+            _create_survey(f"user_{number}", chat_id=number)
+            for number in range(3)
+        ]
+        _create_survey("without_chat")
+
+        response = admin_client.post(
+            reverse("admin:questionnaire_survey_changelist"),
+            {
+                "action": "mark_rejected",
+                "_selected_action": [
+                    str(survey.id) for survey in Survey.objects.all()
+                ],
+            },
+        )
+
+        assert response.status_code == 302
+        rejected = Survey.objects.filter(status=SurveyStatus.REJECTED.value)
+        assert rejected.count() == 4
+        assert sorted(
+            Notification.objects.values_list("chat_id", flat=True)
+        ) == [0, 1, 2]
+        assert {
+            notification.survey_id
+            for notification in Notification.objects.all()
+        } == {survey.id for survey in surveys}
+
+
+class TestNotificationSender:
+    """Тесты отправки уведомлений из очереди"""
+
+    @pytest.fixture
+    def bot(self) -> MagicMock:
+        bot = MagicMock()
+        bot.send_message = AsyncMock()
+        return bot
+
+    def test_send_pending(self, bot):
+        """Уведомления отправляются и отмечаются отправленными"""
+        Notification.objects.bulk_create(
+            Notification(chat_id=number, text="текст") for number in range(5)
+        )
+
+        sender = NotificationSender(bot, batch_size=2)
+        sent = async_to_sync(sender.send_pending)()
+
+        assert sent == 5
+        assert bot.send_message.await_count == 5
+        assert not Notification.objects.exclude(status=NOTIFICATION_SENT)
+
+    def test_errors(self, bot):
+        """Заблокированный бот - не доставлено, сетевая ошибка - повтор"""
+        blocked = Notification.objects.create(chat_id=1, text="текст")
+        retry = Notification.objects.create(chat_id=2, text="текст")
+
+        async def send_message(chat_id, text):
+            if chat_id == blocked.chat_id:
+                raise Forbidden("bot was blocked by the user")
+            raise NetworkError("timeout")
+
+        bot.send_message = AsyncMock(side_effect=send_message)
+
+        sent = async_to_sync(NotificationSender(bot).send_pending)()
+
+        assert sent == 0
+        blocked.refresh_from_db()
+        retry.refresh_from_db()
+        assert blocked.status == NOTIFICATION_FAILED
+        assert retry.status == NOTIFICATION_PENDING
+        assert retry.attempts == 1
+        assert retry.send_after > timezone.now() + timedelta(seconds=10)
+
+    def test_not_ready(self, bot):
+        """Отложенные уведомления не отправляются раньше времени"""
+        Notification.objects.create(
+            chat_id=1,
+            text="текст",
+            send_after=timezone.now() + timedelta(minutes=5),
+        )
+
+        assert async_to_sync(NotificationSender(bot).send_pending)() == 0
+        bot.send_message.assert_not_awaited()
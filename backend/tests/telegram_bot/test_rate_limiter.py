@@ -0,0 +1,213 @@
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import pytest
+from django.test import override_settings
+from telegram.error import RetryAfter
+
+from telegram_bot.bot import TelegramBot
+from telegram_bot.rate_limiter import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    TelegramRateLimiter,
+    TokenBucket,
+    retry_after_seconds,
+)
+from telegram_bot.utils import send_telegram_message
+
+
+async def _send(
+    limiter: TelegramRateLimiter,
+    callback,
+    chat_id: int = 1,
+    priority: int | None = None,
+):
+    """Отправка сообщения через ограничитель"""
+    return await limiter.process_request(
+        callback,
+        (),
+        {},
+        "sendMessage",
+        {"chat_id": chat_id, "text": "текст"},
+        priority,
+    )
+
+
+class TestTokenBucket:
+    """Тесты корзины токенов"""
+
+    async def test_burst_then_rate(self):
+        """Всплеск до емкости, дальше с заданной скоростью"""
+        bucket = TokenBucket(rate=20, capacity=2)
+
+        started = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+
+        assert time.monotonic() - started >= 0.09
+        assert not bucket.full
+
+
+class TestTelegramRateLimiter:
+    """Тесты ограничителя исходящих запросов"""
+
+    @pytest.fixture
+    async def limiter(self):
+        limiter = TelegramRateLimiter(global_rate=50, chat_rate=10)
+        await limiter.initialize()
+        yield limiter
+        await limiter.shutdown()
+
+    async def test_global_rate(self, limiter):
+        """Запросы в разные чаты ограничиваются общей корзиной"""
+        callback = AsyncMock(return_value=True)
+
+        started = time.monotonic()
+        await asyncio.gather(
+            *(_send(limiter, callback, chat_id) for chat_id in range(60))
+        )
+
+        assert callback.await_count == 60
+        assert time.monotonic() - started >= 0.18
+
+    async def test_chat_rate(self, limiter):
+        """Уведомления в один чат ограничиваются корзиной чата"""
+        callback = AsyncMock(return_value=True)
+
+        started = time.monotonic()
+        for _ in range(5):
+            await _send(limiter, callback, priority=PRIORITY_BULK)
+
+        assert time.monotonic() - started >= 0.18
+
+    async def test_interactive_not_delayed_in_chat(self, limiter):
+        """Ответы в чат не ждут корзину чата, но уведомления после
+        них ждут"""
+        callback = AsyncMock(return_value=True)
+
+        started = time.monotonic()
+        for _ in range(5):
+            await _send(limiter, callback)
+        assert time.monotonic() - started < 0.1
+
+        await _send(limiter, callback, priority=PRIORITY_BULK)
+        assert time.monotonic() - started >= 0.25
+
+    async def test_not_message_endpoint(self, limiter):
+        """Удаление сообщений не ограничивается корзиной чата"""
+        callback = AsyncMock(return_value=True)
+
+        started = time.monotonic()
+        for _ in range(5):
+            await limiter.process_request(
+                callback, (), {}, "deleteMessage", {"chat_id": 1}, None
+            )
+
+        assert time.monotonic() - started < 0.1
+
+    async def test_retry_after(self, limiter):
+        """После ответа 429 запрос повторяется через retry_after"""
+        callback = AsyncMock(
+            side_effect=[RetryAfter(timedelta(seconds=0.1)), {"ok": True}]
+        )
+
+        started = time.monotonic()
+        result = await _send(limiter, callback)
+
+        assert result == {"ok": True}
+        assert callback.await_count == 2
+        assert time.monotonic() - started >= 0.1
+
+    @pytest.mark.parametrize("retry_after", (timedelta(seconds=2), 2))
+    def test_retry_after_seconds(self, retry_after):
+        """Время ожидания читается из timedelta и из числа секунд"""
+        error = RetryAfter(2)
+        with patch.object(
+            RetryAfter,
+            "retry_after",
+            new_callable=PropertyMock,
+            return_value=retry_after,
+        ):
+            assert retry_after_seconds(error) == 2.0
+
+    async def test_retry_limit(self):
+        """После max_retries ошибка пробрасывается"""
+        limiter = TelegramRateLimiter(max_retries=1)
+        await limiter.initialize()
+        callback = AsyncMock(side_effect=RetryAfter(timedelta(0)))
+
+        with pytest.raises(RetryAfter):
+            await _send(limiter, callback)
+
+        assert callback.await_count == 2
+
+    async def test_interactive_before_bulk(self):
+        """Интерактивные ответы получают токены раньше уведомлений"""
+        limiter = TelegramRateLimiter(global_rate=10, chat_rate=100)
+        await limiter.initialize()
+        order = []
+
+        def callback(name: str):
+            async def request():
+                order.append(name)
+
+            return request
+
+        # Исчерпываем общую корзину
+        for chat_id in range(10):
+            await _send(limiter, callback("warmup"), chat_id)
+        bulk = [
+            asyncio.create_task(
+                _send(limiter, callback("bulk"), 100 + i, PRIORITY_BULK)
+            )
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(
+            _send(limiter, callback("interactive"), 200, PRIORITY_INTERACTIVE)
+        )
+        await asyncio.gather(*bulk, interactive)
+
+        assert order[10:] == ["interactive", "bulk", "bulk", "bulk"]
+
+
+class TestRateLimiterSetup:
+    """Тесты подключения ограничителя к боту"""
+
+    def test_bot_rate_limiter(self):
+        """Бот создается с ограничителем из настроек"""
+        bot = TelegramBot()
+
+        rate_limiter = bot.application.bot.rate_limiter
+        assert isinstance(rate_limiter, TelegramRateLimiter)
+
+    @override_settings(TELEGRAM_RATE_LIMIT_GLOBAL=0)
+    def test_rate_limit_disabled(self):
+        """Нулевой лимит отключает ограничитель"""
+        assert TelegramBot().application.bot.rate_limiter is None
+        assert (
+            TelegramBot(rate_limit=False).application.bot.rate_limiter is None
+        )
+
+
+class TestSendTelegramMessage:
+    """Тесты синхронной отправки сообщения"""
+
+    @patch("telegram_bot.utils.time.sleep")
+    @patch("telegram_bot.utils.requests.post")
+    def test_retry_after(self, mock_post, mock_sleep):
+        """При ответе 429 отправка повторяется через retry_after"""
+        limited = MagicMock(status_code=429)
+        limited.json.return_value = {
+            "ok": False,
+            "parameters": {"retry_after": 3},
+        }
+        sent = MagicMock(status_code=200)
+        sent.json.return_value = {"ok": True}
+        mock_post.side_effect = [limited, sent]
+
+        assert send_telegram_message(1, "текст") == {"ok": True}
+        mock_sleep.assert_called_once_with(3)
+        assert mock_post.call_count == 2
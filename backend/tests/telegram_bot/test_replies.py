@@ -0,0 +1,118 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from telegram import InputMediaDocument, InputMediaPhoto
+
+from questionnaire.models import Document
+from telegram_bot.replies import (
+    DOCUMENTS_HEADER,
+    EMPTY_RESULT,
+    RESULT_HEADER,
+    build_media_groups,
+    pack_messages,
+    reply_survey_status,
+)
+
+
+def _create_message() -> MagicMock:
+    """Сообщение с подменой ответов бота"""
+    message = MagicMock()
+    message.reply_text = AsyncMock()
+    message.reply_photo = AsyncMock()
+    message.reply_document = AsyncMock()
+    message.reply_media_group = AsyncMock()
+    return message
+
+
+class TestPackMessages:
+    """Тесты упаковки текста в сообщения"""
+
+    def test_pack_into_one_message(self):
+        """Короткие блоки объединяются в одно сообщение"""
+        assert pack_messages(["a", "b", "c"], limit=10) == ["a\n\nb\n\nc"]
+
+    def test_pack_respects_limit(self):
+        """Сообщения не превышают лимит длины"""
+        blocks = ["x" * 40 for _ in range(10)]
+
+        messages = pack_messages(blocks, limit=100)
+
+        assert all(len(message) <= 100 for message in messages)
+        assert len(messages) == 5
+        assert "\n\n".join(messages) == "\n\n".join(blocks)
+
+    def test_split_long_block(self):
+        """Блок длиннее лимита режется на части"""
+        messages = pack_messages(["y" * 25], limit=10)
+
+        assert messages == ["y" * 10, "y" * 10, "y" * 5]
+
+    def test_empty(self):
+        """Пустой список блоков"""
+        assert pack_messages([]) == []
+
+
+class TestBuildMediaGroups:
+    """Тесты группировки документов в альбомы"""
+
+    def test_albums_of_ten(self):
+        """Фото группируются в альбомы до 10 штук"""
+        documents = [Document(image=f"app:/{i}.png") for i in range(23)]
+
+        groups = build_media_groups(documents)
+
+        assert [len(group) for group in groups] == [10, 10, 3]
+        assert all(
+            isinstance(media, InputMediaPhoto)
+            for group in groups
+            for media in group
+        )
+
+    def test_pdf_separate_album(self):
+        """PDF не смешиваются с фото и пустые пути пропускаются"""
+        documents = [
+            Document(image="app:/1.png"),
+            Document(image="app:/2.PDF"),
+            Document(image=""),
+            Document(image="app:/3.jpeg"),
+            Document(image="app:/4.pdf"),
+        ]
+
+        groups = build_media_groups(documents)
+
+        assert [len(group) for group in groups] == [2, 2]
+        assert all(
+            isinstance(media, InputMediaDocument) for media in groups[1]
+        )
+
+
+class TestReplySurveyStatus:
+    """Тесты ответа историей опроса"""
+
+    async def test_history_in_one_message(self):
+        """История из 30 вопросов уходит одним сообщением и альбомом"""
+        message = _create_message()
+        result = [
+            text
+            for number in range(30)
+            for text in (f"Вопрос {number}?", f"Ответ {number}")
+        ]
+        documents = [Document(image=f"app:/{i}.png") for i in range(5)]
+
+        await reply_survey_status(message, result, documents)
+
+        message.reply_text.assert_awaited_once()
+        text = message.reply_text.await_args.args[0]
+        assert text.startswith(RESULT_HEADER)
+        assert text.endswith(DOCUMENTS_HEADER)
+        assert "Ответ 29" in text
+        message.reply_media_group.assert_awaited_once()
+
+    async def test_single_document(self):
+        """Один документ отправляется без альбома"""
+        message = _create_message()
+
+        await reply_survey_status(message, [], [Document(image="app:/1.pdf")])
+
+        assert message.reply_text.await_args.args[0].startswith(EMPTY_RESULT)
+        message.reply_document.assert_awaited_once_with(document="app:/1.pdf")
+        message.reply_media_group.assert_not_awaited()
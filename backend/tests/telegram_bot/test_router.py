@@ -0,0 +1,135 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from django.test import override_settings
+
+from questionnaire.constant import SurveyStatus, TelegramCommand
+from telegram_bot import router
+from telegram_bot.router import normalize_text, route_text
+from telegram_bot.user_state import get_status, remember_status
+
+
+def _create_update(text: str) -> MagicMock:
+    """
+    Обновление Telegram с текстом сообщения
+
+    Args:
+        text: текст сообщения
+
+    Returns:
+        MagicMock: обновление
+    """
+    update = MagicMock()
+    update.message.text = text
+    return update
+
+
+@pytest.fixture
+def context() -> MagicMock:
+    """Контекст с данными пользователя"""
+    context = MagicMock()
+    context.user_data = {}
+    return context
+
+
+class TestUserState:
+    """Тесты запомненного статуса опроса"""
+
+    def test_remember_status(self):
+        """Статус доступен до истечения TTL"""
+        user_data = {}
+        assert get_status(user_data) is None
+
+        remember_status(user_data, SurveyStatus.WAITING_DOCS.value)
+
+        assert get_status(user_data) == SurveyStatus.WAITING_DOCS.value
+
+    @override_settings(TELEGRAM_STATE_TTL=0)
+    def test_expired(self):
+        """Устаревший статус не используется"""
+        user_data = {}
+        remember_status(user_data, SurveyStatus.WAITING_DOCS.value)
+
+        assert get_status(user_data) is None
+
+
+class TestRouter:
+    """Тесты маршрутизации текстовых сообщений"""
+
+    def test_normalize_text(self):
+        """Пробелы, регистр и упоминание бота не влияют на маршрут"""
+        assert normalize_text(" /Start@promo_bot ") == "/start"
+        assert normalize_text("Получить статус опроса") == (
+            "получить статус опроса"
+        )
+
+    def test_text_routes(self):
+        """Кнопка и команда ведут к одному обработчику"""
+        for command in TelegramCommand.START, TelegramCommand.HELP:
+            button, call_name = command.get_all_select_command()
+            assert (
+                router.TEXT_ROUTES[normalize_text(button)]
+                is router.TEXT_ROUTES[call_name]
+            )
+        assert "/log" not in router.TEXT_ROUTES
+
+    async def test_command(self, context):
+        """Команда обрабатывается без учета статуса"""
+        handler = AsyncMock()
+        update = _create_update("/status@promo_bot")
+        remember_status(context.user_data, SurveyStatus.WAITING_DOCS.value)
+
+        with patch.dict(router.TEXT_ROUTES, {"/status": handler}):
+            await route_text(update, context)
+
+        handler.assert_awaited_once_with(update, context)
+
+    async def test_unknown_command(self, context):
+        """Неизвестная команда игнорируется"""
+        with patch("telegram_bot.router.handle_message") as handle_message:
+            await route_text(_create_update("/unknown"), context)
+
+        handle_message.assert_not_called()
+
+    async def test_unknown_status(self, context):
+        """Без запомненного статуса текст разбирает handle_message"""
+        update = _create_update("Ответ")
+
+        with patch(
+            "telegram_bot.router.handle_message",
+            new_callable=AsyncMock,
+        ) as handle_message:
+            await route_text(update, context)
+
+        handle_message.assert_awaited_once_with(update, context)
+
+    async def test_status_route(self, context):
+        """Текст направляется по запомненному статусу"""
+        handler = AsyncMock()
+        update = _create_update("Ответ")
+        remember_status(context.user_data, SurveyStatus.WAITING_DOCS.value)
+
+        with patch.dict(
+            router.STATUS_ROUTES,
+            {SurveyStatus.WAITING_DOCS.value: handler},
+        ):
+            await route_text(update, context)
+
+        handler.assert_awaited_once_with(update, context)
+
+    async def test_status_help(self, context):
+        """Статусы без маршрута получают помощь"""
+        update = _create_update("Ответ")
+        remember_status(context.user_data, SurveyStatus.IN_PROGRESS.value)
+
+        with patch(
+            "telegram_bot.router.help_command",
+            new_callable=AsyncMock,
+        ) as help_command:
+            await route_text(update, context)
+
+        help_command.assert_awaited_once_with(
+            update,
+            context,
+            status=SurveyStatus.IN_PROGRESS.value,
+        )
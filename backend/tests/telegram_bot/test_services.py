@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+
+from telegram_bot.services import _get_or_create_user
+
+User = get_user_model()
+
+
+class TestGetOrCreateUser:
+    """Тесты поиска пользователя бота"""
+
+    def test_create_user(self, mock_telegram_user):
+        """Новый пользователь создается с идентификатором Telegram"""
+        user_obj = _get_or_create_user(mock_telegram_user)
+
+        assert user_obj.telegram_id == 123456
+        assert user_obj.telegram_username == "@test_user"
+
+    def test_find_by_telegram_id(self, mock_telegram_user):
+        """Пользователь находится по id после смены username"""
+        user_obj = _get_or_create_user(mock_telegram_user)
+        mock_telegram_user.username = "renamed_user"
+
+        assert _get_or_create_user(mock_telegram_user) == user_obj
+        assert User.objects.count() == 1
+
+    def test_backfill_by_username(self, mock_telegram_user):
+        """Пользователю без идентификатора он записывается"""
+        user_obj = User.objects.create(
+            username="test_user",
+            telegram_username="@test_user",
+        )
+
+        assert _get_or_create_user(mock_telegram_user) == user_obj
+        user_obj.refresh_from_db()
+        assert user_obj.telegram_id == 123456
+
+    def test_created_concurrently(self, mock_telegram_user):
+        """Пользователь, созданный параллельно после поиска,
+        возвращается без ошибки уникальности"""
+        user_obj = _get_or_create_user(mock_telegram_user)
+
+        with patch.object(QuerySet, "first", return_value=None):
+            assert _get_or_create_user(mock_telegram_user) == user_obj
+
+        assert User.objects.count() == 1
+
+    def test_without_username(self, mock_telegram_user):
+        """Пользователь Telegram без username"""
+        mock_telegram_user.username = None
+
+        user_obj = _get_or_create_user(mock_telegram_user)
+
+        assert user_obj.username == "telegram_123456"
+        assert user_obj.telegram_username is None
+        assert _get_or_create_user(mock_telegram_user) == user_obj
@@ -0,0 +1,89 @@
+import asyncio
+
+from django.test import override_settings
+from telegram import Chat, Message, Update
+
+from telegram_bot.bot import TelegramBot
+from telegram_bot.update_processor import ChatUpdateProcessor
+
+
+def _update(update_id: int, chat_id: int) -> Update:
+    chat = Chat(id=chat_id, type="private")
+    return Update(
+        update_id=update_id,
+        message=Message(message_id=update_id, date=None, chat=chat),
+    )
+
+
+class TestChatUpdateProcessor:
+    """Тесты параллельной обработки обновлений"""
+
+    async def test_chats_in_parallel(self):
+        """Обновления разных чатов обрабатываются одновременно"""
+        processor = ChatUpdateProcessor(2)
+        both_started = asyncio.Barrier(2)
+
+        async def handle():
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+
+        await asyncio.gather(
+            processor.process_update(_update(1, 1), handle()),
+            processor.process_update(_update(2, 2), handle()),
+        )
+
+    async def test_chat_in_order(self):
+        """Обновления одного чата обрабатываются по очереди"""
+        processor = ChatUpdateProcessor(2)
+        handled = []
+
+        async def handle(number: int, delay: float):
+            await asyncio.sleep(delay)
+            handled.append(number)
+
+        await asyncio.gather(
+            processor.process_update(_update(1, 1), handle(1, 0.05)),
+            processor.process_update(_update(2, 1), handle(2, 0)),
+        )
+
+        assert handled == [1, 2]
+        assert not processor._chat_locks
+
+    async def test_busy_chat_not_blocking(self):
+        """Очередь одного чата не занимает места других чатов"""
+        processor = ChatUpdateProcessor(2)
+        release = asyncio.Event()
+        handled = []
+
+        async def handle(name: str, wait: bool):
+            if wait:
+                await release.wait()
+            handled.append(name)
+
+        busy = [
+            asyncio.create_task(
+                processor.process_update(
+                    _update(number, 1), handle(number, True)
+                )
+            )
+            for number in range(4)
+        ]
+        await asyncio.wait_for(
+            processor.process_update(_update(10, 2), handle("other", False)),
+            timeout=1,
+        )
+
+        assert handled == ["other"]
+        assert processor.current_concurrent_updates == 1
+        release.set()
+        await asyncio.gather(*busy)
+        assert handled == ["other", 0, 1, 2, 3]
+
+    @override_settings(TELEGRAM_DB_POOL_SIZE=4)
+    def test_bot_sized_to_pool(self):
+        """Параллельность бота равна размеру пула БД"""
+        assert TelegramBot(token="1:x").application.concurrent_updates == 4
+
+    @override_settings(TELEGRAM_DB_POOL_SIZE=0)
+    def test_bot_without_pool(self):
+        """Без пула БД обновления обрабатываются по одному"""
+        assert TelegramBot(token="1:x").application.concurrent_updates == 1
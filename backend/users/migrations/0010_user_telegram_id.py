@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0009_alter_user_telegram_username"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="telegram_id",
+            field=models.BigIntegerField(
+                blank=True,
+                null=True,
+                unique=True,
+                verbose_name="Идентификатор пользователя в Телеграм",
+            ),
+        ),
+    ]
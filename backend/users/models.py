@@ -103,6 +103,12 @@ class User(AbstractUser):
         null=True,
         blank=True,
     )
+    telegram_id = models.BigIntegerField(
+        "Идентификатор пользователя в Телеграм",
+        unique=True,
+        null=True,
+        blank=True,
+    )
 
     USERNAME_FIELD = "username"
 
@@ -1,7 +1,7 @@
 import React, { useState, useRef, useEffect } from 'react';
 import { X, Upload, FileText, Lock } from 'lucide-react';
 import { useAppSelector } from '../../../hooks/redux';
-import { surveyAPI } from '../../../utils/surveyAPI';
+import { surveyAPI, DOCUMENT_BATCH_MAX_FILES } from '../../../utils/surveyAPI';
 import { FileWithPreview, UploadedDocument } from '../../../types';
 import styles from './FileUpload.module.css';
 
@@ -52,37 +52,62 @@ export const FileUpload: React.FC<FileUploadProps> = ({ onUploadComplete }) => {
 
     setFiles(prev => [...prev, ...newFiles]);
 
-    const uploadPromises = newFiles.map(fileWithPreview => uploadFile(fileWithPreview));
-    await Promise.all(uploadPromises);
+    await uploadFiles(newFiles);
 
     if (fileInputRef.current) {
       fileInputRef.current.value = '';
     }
   };
 
-  const uploadFile = async (fileWithPreview: FileWithPreview) => {
+  const setFileState = (file: File, state: Partial<FileWithPreview>) => {
+    setFiles(prev => prev.map(f => 
+      f.file === file ? { ...f, isUploading: false, ...state } : f
+    ));
+  };
+
+  // Сервер принимает не больше DOCUMENT_BATCH_MAX_FILES файлов за запрос:
+  // отправляем пачками по очереди
+  const uploadFiles = async (filesToUpload: FileWithPreview[]) => {
+    for (let start = 0; start < filesToUpload.length; start += DOCUMENT_BATCH_MAX_FILES) {
+      await uploadBatch(filesToUpload.slice(start, start + DOCUMENT_BATCH_MAX_FILES));
+    }
+  };
+
+  const uploadBatch = async (filesToUpload: FileWithPreview[]) => {
     if (!surveyId) return;
 
     try {
-      const uploadedDoc = await surveyAPI.uploadDocument(surveyId, fileWithPreview.file);
-      
-      setFiles(prev => prev.map(f => 
-        f.file === fileWithPreview.file 
-          ? { ...f, isUploading: false, uploadedId: uploadedDoc.id }
-          : f
-      ));
+      const results = await surveyAPI.uploadDocuments(
+        surveyId,
+        filesToUpload.map(f => f.file),
+      );
+      const uploadedDocs: UploadedDocument[] = [];
+
+      results.forEach((result, index) => {
+        const { file } = filesToUpload[index];
+        if (result.id === undefined) {
+          setFileState(file, { uploadError: result.error || 'Ошибка загрузки' });
+          return;
+        }
+        setFileState(file, { uploadedId: result.id });
+        uploadedDocs.push({
+          id: result.id,
+          file: result.image ?? '',
+          image: result.image,
+        });
+      });
 
       setUploadedDocs(prev => {
-        const updated = [...prev, uploadedDoc];
+        const updated = [...prev, ...uploadedDocs];
         if (onUploadComplete) {
           onUploadComplete(updated);
         }
         return updated;
       });
 
-      console.log('✅ File uploaded successfully:', uploadedDoc);
+      console.log('✅ Files uploaded:', results);
     } catch (error) {
-      console.error('❌ Error uploading file:', error);
+      console.error('❌ Error uploading files:', error);
       
       let errorMessage = 'Ошибка загрузки';
       if (error instanceof Error) {
@@ -92,15 +117,7 @@ export const FileUpload: React.FC<FileUploadProps> = ({ onUploadComplete }) => {
         }
       }
       
-      setFiles(prev => prev.map(f => 
-        f.file === fileWithPreview.file 
-          ? { 
-              ...f, 
-              isUploading: false, 
-              uploadError: errorMessage
-            }
-          : f
-      ));
+      filesToUpload.forEach(({ file }) => setFileState(file, { uploadError: errorMessage }));
     }
   };
 
@@ -30,8 +30,8 @@ export const startSurveyAsync = createAsyncThunk(
       // Затем получаем список опросов для получения ID и текущего вопроса
       const surveys = await surveyAPI.getSurveys();
       
-      // Берем последний созданный опрос
-      const currentSurvey = surveys[surveys.length - 1];
+      // Берем последний созданный опрос (список начинается с новых)
+      const currentSurvey = surveys[0];
       
       return {
         createResponse,
@@ -270,7 +270,8 @@ export const surveySlice = createSlice({
         
         const surveys = action.payload;
         if (surveys.length > 0) {
-          const lastSurvey = surveys[surveys.length - 1];
+          // Список опросов начинается с новых
+          const lastSurvey = surveys[0];
           
           state.surveyId = lastSurvey.id;
           state.currentQuestion = lastSurvey.current_question_text;
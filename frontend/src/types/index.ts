@@ -44,6 +44,13 @@ export interface Survey {
   status?: "new" | "waiting_docs" | "processing";
 }
 
+// Страница курсорной пагинации DRF
+export interface PaginatedResponse<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
 export interface SubmitAnswerRequest {
   answer: string;
 }
@@ -62,6 +69,14 @@ export interface UploadedDocument {
   file_size?: number;
 }
 
+// Результат пакетной загрузки по одному файлу: документ или ошибка
+export interface BatchUploadResult {
+  file: string;
+  id?: number;
+  image?: string;
+  error?: string;
+}
+
 export interface FileWithPreview {
   file: File;
   preview: string;
@@ -1,8 +1,10 @@
 import { 
   UploadedDocument,
+  BatchUploadResult,
   CreateSurveyRequest, 
   CreateSurveyResponse, 
   Survey, 
+  PaginatedResponse,
   SubmitAnswerRequest, 
   SubmitAnswerResponse, 
   ProcessingRequest
@@ -10,6 +12,9 @@ import {
 
 const API_BASE_URL = import.meta.env.VITE_API_URL;
 
+// Файлов в одном запросе docs/batch/ - не больше DOCUMENT_BATCH_MAX_FILES сервера
+export const DOCUMENT_BATCH_MAX_FILES = 10;
+
 function getAuthHeaders(extraHeaders: Record<string, string> = {}): Record<string, string> {
   const accessToken = sessionStorage.getItem('auth_token');
   
@@ -68,7 +73,7 @@ export const surveyAPI = {
     return data;
   },
 
-  // GET /api/v1/surveys/ - получение списка опросов
+  // GET /api/v1/surveys/ - получение списка опросов (первая страница)
   getSurveys: async (): Promise<Survey[]> => {
     console.log('📤 API Request: GET /v1/surveys/');
 
@@ -83,9 +88,10 @@ export const surveyAPI = {
       await handleApiError(response);
     }
     
-    const data = await response.json();
+    // Опросы постранично, новые первыми
+    const data: PaginatedResponse<Survey> = await response.json();
     console.log('📥 API Response: GET /v1/surveys/', data);
-    return data;
+    return data.results;
   },
 
   // PUT /api/v1/surveys/{id}/ - отправка ответа
@@ -168,6 +174,30 @@ export const surveyAPI = {
     return data;
   },
 
+  // POST /api/v1/surveys/{survey_pk}/docs/batch/ - загрузить несколько документов
+  // одним запросом (результаты в порядке файлов)
+  uploadDocuments: async (surveyId: string, files: File[]): Promise<BatchUploadResult[]> => {
+    const formData = new FormData();
+    files.forEach(file => formData.append('files', file));
+
+    console.log(`📤 API Request: POST /v1/surveys/${surveyId}/docs/batch/`, { files: files.length });
+
+    // Content-Type с границей multipart выставит браузер
+    const response = await fetch(`${API_BASE_URL}/v1/surveys/${surveyId}/docs/batch/`, {
+      method: 'POST',
+      headers: getAuthHeaders(),
+      body: formData,
+    });
+
+    if (!response.ok) {
+      await handleApiError(response);
+    }
+
+    const data = await response.json();
+    console.log(`📥 API Response: POST /v1/surveys/${surveyId}/docs/batch/`, data);
+    return data.results;
+  },
+
   // DELETE /api/v1/surveys/{survey_pk}/docs/{id}/ - удалить документ
   deleteDocument: async (surveyId: string, documentId: number): Promise<void> => {
     console.log(`📤 API Request: DELETE /v1/surveys/${surveyId}/docs/${documentId}/`);